@@ -0,0 +1,99 @@
+"""Stale-hit and purge cost on a cache directory with thousands of entries.
+
+Compares the current `JsonCache` (TTL from file mtime / fixed header) against the previous layout, where
+`created_at` lived inside the JSON document and every check parsed the whole body.
+
+    python benchmarks/cache_ttl.py --entries 5000 --payload-kb 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from espn_fbb.cache import JsonCache, key_digest
+
+
+def _payload(kb: int, seed: int) -> dict[str, Any]:
+    row = {"id": seed, "name": f"player-{seed}", "stats": {str(i): i * 1.5 for i in range(24)}}
+    per_row = len(json.dumps(row))
+    return {"teams": [dict(row, id=seed * 1000 + i) for i in range(max(1, kb * 1024 // per_row))]}
+
+
+def _legacy_get(root: Path, key: str, ttl_seconds: int) -> Any | None:
+    path = root / f"{key_digest(key)}.json"
+    with path.open("r", encoding="utf-8") as fh:
+        payload = json.load(fh)
+    if payload["created_at"] + ttl_seconds < time.time():
+        return None
+    return payload["value"]
+
+
+def _legacy_purge(root: Path, cutoff: float) -> None:
+    for path in root.glob("*.json"):
+        with path.open("r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        if payload["created_at"] < cutoff:
+            path.unlink()
+
+
+def _timed(label: str, fn: Callable[[], None], count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed * 1000:10.1f} ms  {elapsed / count * 1e6:10.1f} us/entry")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--payload-kb", type=int, default=32)
+    args = parser.parse_args()
+
+    keys = [f"league:{i}" for i in range(args.entries)]
+    with tempfile.TemporaryDirectory() as tmp:
+        new_root = Path(tmp) / "binary"
+        old_root = Path(tmp) / "legacy"
+        old_root.mkdir()
+        cache = JsonCache(new_root)
+        created_at = time.time()
+        for i, key in enumerate(keys):
+            value = _payload(args.payload_kb, i)
+            cache.set(key, value)
+            (old_root / f"{key_digest(key)}.json").write_text(
+                json.dumps({"created_at": created_at, "value": value}), encoding="utf-8"
+            )
+
+        new_bytes = sum(p.stat().st_size for p in new_root.glob("*.cache"))
+        old_bytes = sum(p.stat().st_size for p in old_root.glob("*.json"))
+        print(f"{args.entries} entries, ~{args.payload_kb} KiB JSON each")
+        print(f"disk: legacy {old_bytes / 2**20:.1f} MiB, binary {new_bytes / 2**20:.1f} MiB\n")
+
+        # ttl_seconds=-1 makes every entry stale: the path every expired lookup takes.
+        legacy = _timed("stale get (legacy, full parse)", lambda: [_legacy_get(old_root, k, -1) for k in keys], len(keys))
+        current = _timed("stale get (stat only)", lambda: [cache.get(k, -1) for k in keys], len(keys))
+        print(f"{'':<34} {legacy / current:10.1f} x\n")
+
+        _timed("fresh get (legacy)", lambda: [_legacy_get(old_root, k, 3600) for k in keys], len(keys))
+        _timed("fresh get (binary, mmap)", lambda: [cache.get(k, 3600) for k in keys], len(keys))
+        print()
+
+        # A cutoff before every entry: the scan visits everything and deletes nothing, like a routine purge.
+        legacy = _timed("purge scan (legacy, full parse)", lambda: _legacy_purge(old_root, created_at - 86400), len(keys))
+        current = _timed(
+            "purge scan (scandir + stat)",
+            lambda: cache.purge_old_snapshots(retention_days=1, now_ts=created_at),
+            len(keys),
+        )
+        print(f"{'':<34} {legacy / current:10.1f} x")
+        assert len(os.listdir(new_root)) == args.entries
+
+
+if __name__ == "__main__":
+    main()
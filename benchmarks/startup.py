@@ -0,0 +1,115 @@
+"""CLI startup cost: wall time per scenario plus a `python -X importtime` breakdown.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --json startup.json
+    python benchmarks/startup.py --baseline startup.json --tolerance 0.25
+    python benchmarks/startup.py --budget-ms 150
+
+With `--baseline`, any scenario whose median wall time grew by more than `--tolerance` exits non-zero; with
+`--budget-ms`, so does a `cli --help` run slower than the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# name -> python -c source. `cli --help` is the cron/completion path and what --budget-ms applies to.
+SCENARIOS = {
+    "import espn_fbb.cli": "import espn_fbb.cli",
+    "cli --help": "import sys; from espn_fbb.cli import app; sys.argv = ['espn-fbb', '--help']; app()",
+    "import espn_fbb.commands": "import espn_fbb.commands",
+}
+BUDGET_SCENARIO = "cli --help"
+
+
+def _run(source: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", source], capture_output=True, text=True, env=env, cwd=ROOT, check=False
+    )
+
+
+def _wall_ms(source: str, repeat: int) -> dict[str, float]:
+    _run(source)  # warm the bytecode and OS file caches
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(source)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(samples), "best_ms": min(samples)}
+
+
+def _import_times(source: str) -> dict[str, dict[str, int]]:
+    # `-X importtime` lines: "import time: self [us] | cumulative | imported package" (nesting shown by indent).
+    out: dict[str, dict[str, int]] = {}
+    for line in _run(source, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        out[name.strip()] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us)}
+    return out
+
+
+def _compare(results: dict[str, dict[str, float]], baseline_path: Path, tolerance: float) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        ratio = result["median_ms"] / before["median_ms"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(f"{name}: {before['median_ms']:.1f} -> {result['median_ms']:.1f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per scenario")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--baseline", type=Path, help="results file from an earlier --json run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed wall-time growth vs. the baseline")
+    parser.add_argument("--budget-ms", type=float, help=f"fail when '{BUDGET_SCENARIO}' is slower than this")
+    args = parser.parse_args()
+
+    baseline_ms = _wall_ms("pass", args.repeat)["median_ms"]
+    print(f"interpreter baseline (python -c pass): {baseline_ms:.1f} ms")
+    print(f"{'scenario':<28} {'median ms':>10} {'best ms':>10} {'imports ms':>11}")
+
+    results: dict[str, dict[str, float]] = {}
+    imports: dict[str, dict[str, dict[str, int]]] = {}
+    for name, source in SCENARIOS.items():
+        result = results[name] = _wall_ms(source, args.repeat)
+        times = imports[name] = _import_times(source)
+        result["import_ms"] = sum(t["self_us"] for t in times.values()) / 1000
+        print(f"{name:<28} {result['median_ms']:10.1f} {result['best_ms']:10.1f} {result['import_ms']:11.1f}")
+
+    for name, times in imports.items():
+        print(f"\nslowest imports for '{name}' (cumulative ms):")
+        slowest = sorted(times.items(), key=lambda item: item[1]["cumulative_us"], reverse=True)[: args.top]
+        for module, t in slowest:
+            print(f"  {t['cumulative_us'] / 1000:8.1f}  {module}")
+
+    if args.json:
+        payload = {"python": sys.version.split()[0], "baseline_ms": baseline_ms, "results": results}
+        args.json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    failures = _compare(results, args.baseline, args.tolerance) if args.baseline else []
+    if args.budget_ms is not None and results[BUDGET_SCENARIO]["median_ms"] > args.budget_ms:
+        failures.append(f"{BUDGET_SCENARIO}: {results[BUDGET_SCENARIO]['median_ms']:.1f} ms > {args.budget_ms:.1f} ms")
+    for line in failures:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Throughput and peak memory of the analytics builds, schedule lookups and cache on synthetic leagues.
+
+    python benchmarks/suite.py --teams 12 --roster-size 13 --history-days 30 --season-days 160
+    python benchmarks/suite.py --json results.json
+    python benchmarks/suite.py --baseline results.json --tolerance 0.25
+
+With `--baseline`, any benchmark whose throughput fell by more than `--tolerance` exits non-zero.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+from synthetic import generate_league, generate_schedule, matchup_scoring_periods
+
+from espn_fbb.analytics import build_outlook, build_preview, build_recap
+from espn_fbb.analytics_schedule import ScheduleIndex, _games_by_pro_team
+from espn_fbb.cache import JsonCache
+from espn_fbb.snapshots import SnapshotStore
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    # Peak is measured on its own pass: tracemalloc slows allocation-heavy code several fold.
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    median = statistics.median(samples)
+    return {
+        "median_ms": median * 1000,
+        "best_ms": min(samples) * 1000,
+        "ops_per_s": 1.0 / median if median > 0 else float("inf"),
+        "peak_kib": peak / 1024,
+    }
+
+
+def _benchmarks(args: argparse.Namespace, tmp: Path) -> dict[str, Callable[[], Any]]:
+    league = generate_league(args.teams, args.roster_size, args.history_days, args.season_days, seed=args.seed)
+    schedule = generate_schedule(args.season_days, seed=args.seed)
+    index = ScheduleIndex.from_payload(schedule)
+    team_id = 1
+    matchup_period_id = league["status"]["currentMatchupPeriod"]
+    scoring_period_ids = matchup_scoring_periods(args.season_days)[matchup_period_id]
+
+    cache = JsonCache(tmp / "cache")
+    cache.set("league", league)
+    snapshots = JsonCache(tmp / "snapshots")
+    for i in range(args.snapshots):
+        snapshots.set(f"entry:{i}", {"PTS": {"you": 1.0, "opp": 2.0}})
+    # One season of daily rows for one team; appends land on the last day, so each one is an in-place overwrite.
+    store = SnapshotStore(tmp / "series")
+    snapshot = {key: {"you": 1.0, "opp": 2.0} for key in ("PTS", "REB", "AST", "STL", "BLK", "3PM", "FG%", "FT%", "TO")}
+    start = date(2025, 10, 21)
+    days = [start + timedelta(days=i) for i in range(args.season_days)]
+    for i, day in enumerate(days):
+        store.append("12345", team_id, i // 7 + 1, day, snapshot, retention_days=args.season_days)
+    last_period = (len(days) - 1) // 7 + 1
+
+    return {
+        "build_recap": lambda: build_recap(league, team_id, "12345"),
+        "build_preview": lambda: build_preview(league, index, team_id, "12345", week="current"),
+        "build_outlook": lambda: build_outlook(league, index, team_id, "12345"),
+        "_games_by_pro_team (raw payload)": lambda: _games_by_pro_team(schedule, matchup_period_id, scoring_period_ids),
+        "_games_by_pro_team (ScheduleIndex)": lambda: _games_by_pro_team(index, matchup_period_id, scoring_period_ids),
+        "JsonCache.set (league)": lambda: cache.set("league", league),
+        "JsonCache.get (league)": lambda: cache.get("league", ttl_seconds=3600),
+        f"purge_old_snapshots ({args.snapshots} entries)": lambda: snapshots.purge_old_snapshots(retention_days=10),
+        "SnapshotStore.append (same day)": lambda: store.append(
+            "12345", team_id, last_period, days[-1], snapshot, retention_days=args.season_days
+        ),
+        f"SnapshotStore recap read ({len(days)} rows)": lambda: _snapshot_reads(store, team_id, last_period, days[-1]),
+    }
+
+
+def _snapshot_reads(store: SnapshotStore, team_id: int, matchup_period_id: int, today: date) -> tuple[Any, Any]:
+    # What recap reads before building movers: yesterday's row and the period's first row.
+    series = store.load("12345", team_id)
+    yesterday = today - timedelta(days=1)
+    return series.get(matchup_period_id, yesterday), series.first(matchup_period_id, end=yesterday)
+
+
+def _compare(results: dict[str, dict[str, float]], baseline_path: Path, tolerance: float) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        ratio = result["ops_per_s"] / before["ops_per_s"]
+        if ratio < 1.0 - tolerance:
+            regressions.append(f"{name}: {before['ops_per_s']:.1f} -> {result['ops_per_s']:.1f} ops/s ({ratio:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--roster-size", type=int, default=13)
+    parser.add_argument("--history-days", type=int, default=30, help="per-game stat rows kept for each player")
+    parser.add_argument("--season-days", type=int, default=160, help="scoring periods in the season")
+    parser.add_argument("--snapshots", type=int, default=2000, help="cache entries scanned by the purge")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", help="run only benchmarks whose name contains this substring")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--baseline", type=Path, help="results file from an earlier --json run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed throughput drop vs. the baseline")
+    args = parser.parse_args()
+
+    params = {
+        "teams": args.teams,
+        "roster_size": args.roster_size,
+        "history_days": args.history_days,
+        "season_days": args.season_days,
+        "snapshots": args.snapshots,
+        "seed": args.seed,
+    }
+    print(" ".join(f"{k}={v}" for k, v in params.items()))
+    print(f"{'benchmark':<40} {'median ms':>10} {'best ms':>10} {'ops/s':>10} {'peak KiB':>10}")
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, fn in _benchmarks(args, Path(tmp)).items():
+            if args.only and args.only not in name:
+                continue
+            result = results[name] = _measure(fn, args.repeat)
+            print(
+                f"{name:<40} {result['median_ms']:10.2f} {result['best_ms']:10.2f} "
+                f"{result['ops_per_s']:10.1f} {result['peak_kib']:10.1f}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps({"params": params, "results": results}, indent=2), encoding="utf-8")
+    if args.baseline:
+        regressions = _compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
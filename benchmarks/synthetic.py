@@ -0,0 +1,233 @@
+"""Deterministic synthetic ESPN payloads for benchmarks.
+
+Shapes follow the `mMatchupScore`/`mScoreboard`/`mTeam`/`mRoster`/`mSettings` league views and the
+`proTeamSchedules_wl` schedule: daily scoring periods grouped into 7-day matchup periods, per-game stat rows for
+every player, season/last-N/projection aggregate rows, and a dated pro-team schedule.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+SEASON = 2026
+PRO_TEAMS = 30
+MATCHUP_LENGTH = 7
+SEASON_START = datetime(2025, 10, 21, 23, 30, tzinfo=timezone.utc)
+LINEUP_SLOT_COUNTS = {"0": 1, "1": 1, "2": 1, "3": 1, "4": 1, "5": 1, "6": 1, "11": 3, "12": 3, "13": 1}
+STARTER_SLOTS = [0, 1, 2, 3, 4, 5, 6, 11, 11, 11]
+ELIGIBLE_BY_POSITION = {0: [0, 5, 11, 12], 1: [1, 5, 11, 12], 2: [2, 6, 11, 12], 3: [3, 6, 11, 12], 4: [4, 11, 12]}
+CATEGORY_STAT_IDS = (0, 1, 2, 3, 6, 11, 17, 19, 20)
+INJURY_STATUSES = ("ACTIVE",) * 16 + ("DAY_TO_DAY", "QUESTIONABLE", "OUT", "INJURY_RESERVE")
+
+
+def matchup_scoring_periods(season_days: int) -> dict[int, list[int]]:
+    count = (season_days + MATCHUP_LENGTH - 1) // MATCHUP_LENGTH
+    return {
+        mp: list(range((mp - 1) * MATCHUP_LENGTH + 1, min(mp * MATCHUP_LENGTH, season_days) + 1))
+        for mp in range(1, count + 1)
+    }
+
+
+def _game_line(rng: random.Random, skill: float) -> dict[str, float]:
+    fga = float(rng.randint(4, 24))
+    fta = float(rng.randint(0, 10))
+    fgm = float(rng.randint(0, int(fga)))
+    ftm = float(rng.randint(0, int(fta)))
+    threes = float(rng.randint(0, min(int(fgm), 6)))
+    return {
+        "0": round((2 * fgm + threes + ftm) * skill, 1),
+        "1": float(rng.randint(0, 3)),
+        "2": float(rng.randint(0, 3)),
+        "3": float(rng.randint(0, 10)),
+        "6": float(rng.randint(1, 14)),
+        "11": float(rng.randint(0, 5)),
+        "13": fgm,
+        "14": fga,
+        "15": ftm,
+        "16": fta,
+        "17": threes,
+        "40": float(rng.randint(12, 38)),
+        "42": 1.0,
+    }
+
+
+def _aggregate(lines: list[dict[str, float]]) -> dict[str, float]:
+    out: dict[str, float] = {}
+    for line in lines:
+        for sid, value in line.items():
+            out[sid] = out.get(sid, 0.0) + value
+    out["19"] = out["13"] / out["14"] if out.get("14") else 0.0
+    out["20"] = out["15"] / out["16"] if out.get("16") else 0.0
+    return out
+
+
+def _player(rng: random.Random, player_id: int, current_period: int, history_days: int) -> dict[str, Any]:
+    position = rng.randint(0, 4)
+    skill = rng.uniform(0.6, 1.6)
+    first = max(1, current_period - history_days)
+    daily = {pid: _game_line(rng, skill) for pid in range(first, current_period + 1) if rng.random() < 0.55}
+    stats: list[dict[str, Any]] = [
+        {
+            "statSourceId": 0,
+            "statSplitTypeId": 5,
+            "seasonId": SEASON,
+            "scoringPeriodId": pid,
+            "id": f"05{SEASON}{pid}",
+            "appliedTotal": line["0"],
+            "stats": line,
+        }
+        for pid, line in daily.items()
+    ]
+    season_lines = list(daily.values()) or [_game_line(rng, skill)]
+    season_total = _aggregate(season_lines)
+    for split, lines in ((0, season_lines), (1, season_lines[-7:]), (2, season_lines[-15:]), (3, season_lines[-30:])):
+        row = {"statSourceId": 0, "statSplitTypeId": split, "seasonId": SEASON, "scoringPeriodId": 0}
+        stats.append(dict(row, stats=_aggregate(lines)))
+    stats.append(
+        {
+            "statSourceId": 1,
+            "statSplitTypeId": 0,
+            "seasonId": SEASON,
+            "scoringPeriodId": 0,
+            "stats": {sid: value * rng.uniform(0.9, 1.1) for sid, value in season_total.items()},
+        }
+    )
+    stats.append(
+        {"statSourceId": 0, "statSplitTypeId": 0, "seasonId": SEASON - 1, "scoringPeriodId": 0, "stats": season_total}
+    )
+    return {
+        "id": player_id,
+        "fullName": f"Player {player_id}",
+        "firstName": "Player",
+        "lastName": str(player_id),
+        "proTeamId": rng.randint(1, PRO_TEAMS),
+        "defaultPositionId": position + 1,
+        "injuryStatus": rng.choice(INJURY_STATUSES),
+        "injured": False,
+        "eligibleSlots": ELIGIBLE_BY_POSITION[position],
+        "ownership": {"percentOwned": rng.uniform(0, 100), "percentStarted": rng.uniform(0, 100)},
+        "stats": stats,
+    }
+
+
+def _side(rng: random.Random, team_id: int, played: bool) -> dict[str, Any]:
+    score_by_stat = {}
+    for sid in CATEGORY_STAT_IDS:
+        value = rng.uniform(0.4, 0.85) if sid in (19, 20) else float(rng.randint(10, 600)) if played else 0.0
+        score_by_stat[str(sid)] = {"score": value, "result": rng.choice(["WIN", "LOSS", "TIE"]) if played else None}
+    return {
+        "teamId": team_id,
+        "totalPoints": float(rng.randint(0, 9)),
+        "cumulativeScore": {"wins": 0, "losses": 0, "ties": 0, "scoreByStat": score_by_stat},
+    }
+
+
+def generate_league(
+    teams: int = 12,
+    roster_size: int = 13,
+    history_days: int = 30,
+    season_days: int = 160,
+    *,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """League payload at the midpoint of the season, with `history_days` of per-game rows per player."""
+    rng = random.Random(seed)
+    periods = matchup_scoring_periods(season_days)
+    current_period = max(1, season_days // 2)
+    current_matchup = (current_period - 1) // MATCHUP_LENGTH + 1
+    team_ids = list(range(1, teams + 1))
+
+    team_rows = []
+    player_id = 1000
+    for team_id in team_ids:
+        entries = []
+        for i in range(roster_size):
+            player_id += 1
+            slot = STARTER_SLOTS[i] if i < len(STARTER_SLOTS) else 12
+            if i == roster_size - 1 and roster_size > len(STARTER_SLOTS) + 1:
+                slot = 13
+            entries.append(
+                {
+                    "playerId": player_id,
+                    "lineupSlotId": slot,
+                    "acquisitionType": "DRAFT",
+                    "playerPoolEntry": {
+                        "id": player_id,
+                        "player": _player(rng, player_id, current_period, history_days),
+                    },
+                }
+            )
+        wins = rng.randint(0, current_matchup)
+        team_rows.append(
+            {
+                "id": team_id,
+                "abbrev": f"T{team_id}",
+                "location": "Team",
+                "nickname": str(team_id),
+                "playoffSeed": team_id,
+                "record": {"overall": {"wins": wins, "losses": current_matchup - wins, "ties": 0, "percentage": 0.5}},
+                "roster": {"entries": entries},
+            }
+        )
+
+    schedule = []
+    for mp in range(1, len(periods) + 1):
+        order = team_ids[:]
+        rng.shuffle(order)
+        for home, away in zip(order[::2], order[1::2]):
+            played = mp <= current_matchup
+            schedule.append(
+                {
+                    "id": len(schedule) + 1,
+                    "matchupPeriodId": mp,
+                    "home": _side(rng, home, played),
+                    "away": _side(rng, away, played),
+                    "winner": "UNDECIDED",
+                }
+            )
+
+    return {
+        "id": 12345,
+        "seasonId": SEASON,
+        "scoringPeriodId": current_period,
+        "status": {
+            "currentMatchupPeriod": current_matchup,
+            "currentScoringPeriod": current_period,
+            "latestScoringPeriod": current_period,
+            "seasonId": SEASON,
+        },
+        "settings": {
+            "name": "Synthetic League",
+            "scheduleSettings": {
+                "matchupPeriodCount": len(periods),
+                "matchupPeriodLength": MATCHUP_LENGTH,
+                # Explicit scoring-period lists keep the window independent of today's date.
+                "matchupPeriods": [{"id": mp, "scoringPeriodIds": ids} for mp, ids in periods.items()],
+            },
+            "rosterSettings": {"lineupSlotCounts": LINEUP_SLOT_COUNTS},
+        },
+        "schedule": schedule,
+        "teams": team_rows,
+    }
+
+
+def generate_schedule(season_days: int = 160, *, seed: int = 0) -> dict[str, Any]:
+    """`proTeamSchedules_wl` payload: every pro team's dated games keyed by scoring period."""
+    rng = random.Random(seed)
+    by_team: dict[int, dict[str, list[dict[str, Any]]]] = {pro: {} for pro in range(1, PRO_TEAMS + 1)}
+    game_id = 400000000
+    for pid in range(1, season_days + 1):
+        tip = SEASON_START + timedelta(days=pid - 1)
+        playing = [pro for pro in range(1, PRO_TEAMS + 1) if rng.random() < 0.5]
+        for home, away in zip(playing[::2], playing[1::2]):
+            game_id += 1
+            game = {"id": game_id, "date": int(tip.timestamp() * 1000), "homeProTeamId": home, "awayProTeamId": away}
+            by_team[home][str(pid)] = [game]
+            by_team[away][str(pid)] = [game]
+    pro_teams = [
+        {"id": pro, "abbrev": f"P{pro}", "name": f"Pro {pro}", "proGamesByScoringPeriod": games}
+        for pro, games in by_team.items()
+    ]
+    return {"settings": {"proTeams": pro_teams}}
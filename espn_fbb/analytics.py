@@ -4,27 +4,18 @@ from typing import Any
 
 from espn_fbb.analytics_base import (
     MOVER_THRESHOLDS,
-    _active_count,
     _category_outlook_map,
     _category_projection_map,
     _combine_category_totals,
     _compute_categories,
     _current_category_totals_from_side,
     _current_matchup_period_id,
-    _fantasy_team_name,
-    _find_matchup_for_period,
-    _has_stats_for_period,
     _leader_sign,
     _lineup_role,
     _matchup_score,
     _matchup_score_with_ties,
-    _normalize_injury_status,
-    _player_stat_map,
-    _roster_entries,
     _signal_lists,
     _summary_hints,
-    _team_map,
-    _team_standing,
     _to_float,
     _to_int,
     FGA_STAT_ID,
@@ -32,18 +23,27 @@ from espn_fbb.analytics_base import (
     FTA_STAT_ID,
     FTM_STAT_ID,
     STAT_ID_MAP,
+    StatVector,
 )
+from espn_fbb.analytics_lineup import optimize_daily_lineups
 from espn_fbb.analytics_projection import (
+    RosterAnalysis,
     _category_stats_from_totals,
-    _count_missing_season_stats,
     _infer_season_id,
     _lineup_swap_actions,
     _outlook,
-    _projected_category_totals_from_starters,
+    _projected_totals,
     _season_averages_stat_map,
-    _team_projected_games,
 )
-from espn_fbb.analytics_schedule import _games_by_pro_team, _resolve_matchup_window, _starter_slot_counts
+from espn_fbb.analytics_simulation import simulate_matchup
+from espn_fbb.analytics_schedule import (
+    ScheduleIndex,
+    _as_schedule_index,
+    _resolve_matchup_window,
+    _starter_slot_counts,
+)
+from espn_fbb import timings
+from espn_fbb.league_model import League, Player, RosterEntry, Team, _as_league
 from espn_fbb.schema import (
     CategoryStat,
     DataQuality,
@@ -67,15 +67,19 @@ from espn_fbb.schema import (
 from espn_fbb.utils import iso_ts
 
 
-def _team_has_stats_for_period(team: dict[str, Any], scoring_period_id: int) -> bool:
-    for entry in _roster_entries(team):
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        if _has_stats_for_period(player, scoring_period_id):
-            return True
-    return False
+def _team_has_stats_for_period(team: Team, scoring_period_id: int) -> bool:
+    return any(entry.player.stats.period(scoring_period_id) for entry in team.entries)
+
+
+def _active_count(team: Team) -> int:
+    return sum(1 for entry in team.entries if 0 <= entry.slot <= 12)
+
+
+def _roster_slot(entry: RosterEntry) -> int:
+    return 999 if entry.lineup_slot_id is None else entry.lineup_slot_id
 
 
-def _season_averages(player: dict[str, Any], season_id: int) -> SeasonAverages | None:
+def _season_averages(player: Player, season_id: int) -> SeasonAverages | None:
     stat_map = _season_averages_stat_map(player, season_id)
     if not stat_map:
         return None
@@ -99,7 +103,7 @@ def _season_averages(player: dict[str, Any], season_id: int) -> SeasonAverages |
     )
 
 
-def _period_stats(stat_map: dict[int, float]) -> PeriodStats | None:
+def _period_stats(stat_map: StatVector | dict[int, float]) -> PeriodStats | None:
     if not stat_map:
         return None
     fga = stat_map.get(FGA_STAT_ID, 0.0)
@@ -128,34 +132,26 @@ def _period_stats(stat_map: dict[int, float]) -> PeriodStats | None:
     )
 
 
-def _entry_games(entry: dict[str, Any], games_by_pro_team: dict[int, int] | None) -> int | None:
+def _entry_games(entry: RosterEntry, games_by_pro_team: dict[int, int] | None) -> int | None:
     if not games_by_pro_team:
         return None
-    player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-    pro_team_id = player.get("proTeamId")
-    if pro_team_id is None:
-        return 0
-    return games_by_pro_team.get(_to_int(pro_team_id, -1), 0)
+    return entry.player.games(games_by_pro_team)
 
 
 def _preview_roster_entries(
-    team: dict[str, Any],
-    season_id: int,
-    *,
-    games_total_by_pro_team: dict[int, int] | None = None,
+    team: Team, season_id: int, *, games_total_by_pro_team: dict[int, int] | None = None
 ) -> list[PreviewRosterEntry]:
     entries: list[PreviewRosterEntry] = []
-    for entry in _roster_entries(team):
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        status, raw = _normalize_injury_status(player.get("injuryStatus"))
+    for entry in team.entries:
+        player = entry.player
         entries.append(
             PreviewRosterEntry(
-                player_id=_to_int(player.get("id", 0), 0),
-                player_name=str(player.get("fullName", "Unknown")),
-                lineup_slot_id=_to_int(entry.get("lineupSlotId", 999), 999),
-                lineup_role=_lineup_role(_to_int(entry.get("lineupSlotId", 999), 999)),
-                status=status,
-                status_raw=raw,
+                player_id=player.id,
+                player_name=player.name,
+                lineup_slot_id=_roster_slot(entry),
+                lineup_role=_lineup_role(_roster_slot(entry)),
+                status=player.status,
+                status_raw=player.status_raw,
                 season_avg=_season_averages(player, season_id),
                 games_total=_entry_games(entry, games_total_by_pro_team),
             )
@@ -166,24 +162,23 @@ def _preview_roster_entries(
 
 
 def _outlook_roster_entries(
-    team: dict[str, Any],
+    team: Team,
     season_id: int,
     *,
     games_played_by_pro_team: dict[int, int] | None = None,
     games_remaining_by_pro_team: dict[int, int] | None = None,
 ) -> list[OutlookRosterEntry]:
     entries: list[OutlookRosterEntry] = []
-    for entry in _roster_entries(team):
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        status, raw = _normalize_injury_status(player.get("injuryStatus"))
+    for entry in team.entries:
+        player = entry.player
         entries.append(
             OutlookRosterEntry(
-                player_id=_to_int(player.get("id", 0), 0),
-                player_name=str(player.get("fullName", "Unknown")),
-                lineup_slot_id=_to_int(entry.get("lineupSlotId", 999), 999),
-                lineup_role=_lineup_role(_to_int(entry.get("lineupSlotId", 999), 999)),
-                status=status,
-                status_raw=raw,
+                player_id=player.id,
+                player_name=player.name,
+                lineup_slot_id=_roster_slot(entry),
+                lineup_role=_lineup_role(_roster_slot(entry)),
+                status=player.status,
+                status_raw=player.status_raw,
                 season_avg=_season_averages(player, season_id),
                 games_played=_entry_games(entry, games_played_by_pro_team),
                 games_remaining=_entry_games(entry, games_remaining_by_pro_team),
@@ -194,24 +189,21 @@ def _outlook_roster_entries(
     return entries
 
 
-def _roster_entries_with_period_stats(
-    team: dict[str, Any], season_id: int, scoring_period_id: int
-) -> list[RecapRosterEntry]:
+def _roster_entries_with_period_stats(team: Team, season_id: int, scoring_period_id: int) -> list[RecapRosterEntry]:
     entries: list[RecapRosterEntry] = []
-    for entry in _roster_entries(team):
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        stat_map = _player_stat_map(player, scoring_period_id=scoring_period_id)
+    for entry in team.entries:
+        player = entry.player
+        stat_map = player.stats.period(scoring_period_id)
         if not stat_map:
             continue
-        status, raw = _normalize_injury_status(player.get("injuryStatus"))
         entries.append(
             RecapRosterEntry(
-                player_id=_to_int(player.get("id", 0), 0),
-                player_name=str(player.get("fullName", "Unknown")),
-                lineup_slot_id=_to_int(entry.get("lineupSlotId", 999), 999),
-                lineup_role=_lineup_role(_to_int(entry.get("lineupSlotId", 999), 999)),
-                status=status,
-                status_raw=raw,
+                player_id=player.id,
+                player_name=player.name,
+                lineup_slot_id=_roster_slot(entry),
+                lineup_role=_lineup_role(_roster_slot(entry)),
+                status=player.status,
+                status_raw=player.status_raw,
                 season_avg=_season_averages(player, season_id),
                 period_stats=_period_stats(stat_map),
             )
@@ -221,7 +213,11 @@ def _roster_entries_with_period_stats(
     return entries
 
 
-def compute_movers(categories: list[CategoryStat], yesterday_snapshot: dict[str, dict[str, float]] | None) -> list[Mover]:
+def compute_movers(
+    categories: list[CategoryStat],
+    yesterday_snapshot: dict[str, dict[str, float]] | None,
+    period_start_snapshot: dict[str, dict[str, float]] | None = None,
+) -> list[Mover]:
     if not yesterday_snapshot:
         return []
 
@@ -248,6 +244,8 @@ def compute_movers(categories: list[CategoryStat], yesterday_snapshot: dict[str,
         else:
             kind = "cushion"
 
+        start = (period_start_snapshot or {}).get(c.key)
+        period_delta = today_margin - (_to_float(start.get("you")) - _to_float(start.get("opp"))) if start else None
         movers.append(
             Mover(
                 key=c.key,
@@ -255,6 +253,7 @@ def compute_movers(categories: list[CategoryStat], yesterday_snapshot: dict[str,
                 delta_margin=round(delta, 4),
                 today_margin=round(today_margin, 4),
                 yesterday_margin=round(y_margin, 4),
+                period_delta_margin=round(period_delta, 4) if period_delta is not None else None,
             )
         )
 
@@ -267,21 +266,23 @@ def build_snapshot(categories: list[CategoryStat]) -> dict[str, dict[str, float]
 
 
 def build_recap(
-    league_payload: dict[str, Any],
+    league_payload: dict[str, Any] | League,
     team_id: int,
     league_id: str,
     yesterday_snapshot: dict[str, dict[str, float]] | None = None,
+    period_start_snapshot: dict[str, dict[str, float]] | None = None,
 ) -> RecapResponse:
-    matchup_period_id = _current_matchup_period_id(league_payload)
-    you_side, opp_side = _find_matchup_for_period(league_payload, team_id, matchup_period_id)
+    with timings.stage("league_model"):
+        league = _as_league(league_payload)
+        payload = league.payload
+        matchup_period_id = _current_matchup_period_id(payload)
+        you_side, opp_side = league.find_matchup(team_id, matchup_period_id)
+        you_team = league.team(team_id)
+        opp_team_id = _to_int(opp_side.get("teamId", -1), -1)
+        opp_team = league.team(opp_team_id)
     categories = _compute_categories(you_side, opp_side)
 
-    teams = _team_map(league_payload)
-    you_team = teams.get(team_id, {})
-    opp_team_id = _to_int(opp_side.get("teamId", -1), -1)
-    opp_team = teams.get(opp_team_id, {})
-
-    current_scoring_period = (league_payload.get("status") or {}).get("currentScoringPeriod")
+    current_scoring_period = (payload.get("status") or {}).get("currentScoringPeriod")
     if isinstance(current_scoring_period, list):
         current_scoring_period = current_scoring_period[0] if current_scoring_period else None
     previous_scoring_period_id = _to_int(current_scoring_period, 1) - 1
@@ -291,7 +292,7 @@ def build_recap(
     has_your_data = _team_has_stats_for_period(you_team, previous_scoring_period_id)
     has_opp_data = _team_has_stats_for_period(opp_team, previous_scoring_period_id)
     has_data = has_your_data or has_opp_data
-    season_id = _infer_season_id(league_payload, you_team)
+    season_id = _infer_season_id(league, you_team)
 
     if has_data:
         rosters_meta = RosterMeta(
@@ -310,13 +311,13 @@ def build_recap(
         generated_at=iso_ts(),
         league_id=league_id,
         team_id=team_id,
-        you_team_name=_fantasy_team_name(you_team),
+        you_team_name=you_team.name,
         opp_team_id=opp_team_id if opp_team_id > 0 else None,
-        opp_team_name=_fantasy_team_name(opp_team),
+        opp_team_name=opp_team.name,
         matchup_period_id=matchup_period_id,
         matchup_score=_matchup_score(categories),
         categories=categories,
-        movers=compute_movers(categories, yesterday_snapshot),
+        movers=compute_movers(categories, yesterday_snapshot, period_start_snapshot),
         rosters=RecapRosterGroup(
             you=_roster_entries_with_period_stats(you_team, season_id, previous_scoring_period_id)
             if has_your_data
@@ -334,39 +335,40 @@ def build_recap(
 
 
 def build_preview(
-    league_payload: dict[str, Any],
-    schedule_payload: dict[str, Any],
+    league_payload: dict[str, Any] | League,
+    schedule_payload: dict[str, Any] | ScheduleIndex,
     team_id: int,
     league_id: str,
     week: str,
 ) -> PreviewResponse:
-    matchup_period_id, scoring_period_ids, _ = _resolve_matchup_window(league_payload, schedule_payload, week)
-
-    try:
-        you_side, opp_side = _find_matchup_for_period(league_payload, team_id, matchup_period_id)
-    except ValueError:
-        you_side = {"teamId": team_id}
-        opp_side = {"teamId": -1}
-
-    teams = _team_map(league_payload)
-    you_team = teams.get(team_id, {})
-    opp_team_id = _to_int(opp_side.get("teamId", -1), -1)
-    opp_team = teams.get(opp_team_id, {})
-
-    games_map = _games_by_pro_team(schedule_payload, matchup_period_id, scoring_period_ids=scoring_period_ids)
-    starter_slot_counts = _starter_slot_counts(league_payload)
-    you_games = _team_projected_games(you_team, games_map, starter_slot_counts=starter_slot_counts)
-    opp_games = _team_projected_games(opp_team, games_map, starter_slot_counts=starter_slot_counts)
+    with timings.stage("schedule_index"):
+        schedule_index = _as_schedule_index(schedule_payload)
+    payload = league_payload.payload if isinstance(league_payload, League) else league_payload
+    matchup_period_id, scoring_period_ids, _ = _resolve_matchup_window(payload, schedule_index, week)
+
+    with timings.stage("league_model"):
+        league = _as_league(league_payload)
+        try:
+            you_side, opp_side = league.find_matchup(team_id, matchup_period_id)
+        except ValueError:
+            you_side = {"teamId": team_id}
+            opp_side = {"teamId": -1}
+        you_team = league.team(team_id)
+        opp_team_id = _to_int(opp_side.get("teamId", -1), -1)
+        opp_team = league.team(opp_team_id)
+
+    games_map = schedule_index.games_by_pro_team(matchup_period_id, scoring_period_ids=scoring_period_ids)
+    starter_slot_counts = _starter_slot_counts(payload)
+    season_id = _infer_season_id(league, you_team)
+    with timings.stage("roster_analysis"):
+        you_analysis = RosterAnalysis.build(you_team, season_id, games_map, starter_slot_counts)
+        opp_analysis = RosterAnalysis.build(opp_team, season_id, games_map, starter_slot_counts)
+    you_games = you_analysis.total_games
+    opp_games = opp_analysis.total_games
     games_diff = you_games - opp_games
 
-    season_id = _infer_season_id(league_payload, you_team)
-
-    you_proj_totals = _projected_category_totals_from_starters(
-        you_team, season_id=season_id, pro_team_games=games_map, starter_slot_counts=starter_slot_counts
-    )
-    opp_proj_totals = _projected_category_totals_from_starters(
-        opp_team, season_id=season_id, pro_team_games=games_map, starter_slot_counts=starter_slot_counts
-    )
+    with timings.stage("projection"):
+        you_proj_totals, opp_proj_totals = _projected_totals([you_analysis, opp_analysis])
     projected_categories = _category_stats_from_totals(you_proj_totals, opp_proj_totals)
     has_projection_signal = any(c.you != 0.0 or c.opp != 0.0 for c in projected_categories)
     categories = projected_categories if has_projection_signal else _compute_categories(you_side, opp_side)
@@ -374,14 +376,28 @@ def build_preview(
     favored, at_risk = _signal_lists(categories)
     lineup_actions: list[LineupAction] = []
     if week == "current":
-        lineup_actions = _lineup_swap_actions(
-            team=you_team,
-            season_id=season_id,
-            pro_team_games=games_map,
-            starter_slot_counts=starter_slot_counts,
-            categories=categories,
-            at_risk=at_risk,
-        )
+        with timings.stage("lineup_actions"):
+            lineup_actions = _lineup_swap_actions(
+                team=you_team,
+                season_id=season_id,
+                pro_team_games=games_map,
+                starter_slot_counts=starter_slot_counts,
+                categories=categories,
+                at_risk=at_risk,
+            )
+
+    lineup_plan = None
+    daily_games = schedule_index.daily_games_by_pro_team(matchup_period_id, scoring_period_ids)
+    if daily_games and has_projection_signal:
+        with timings.stage("lineup_plan"):
+            lineup_plan = optimize_daily_lineups(
+                team=you_team,
+                season_id=season_id,
+                starter_slot_counts=starter_slot_counts,
+                daily_games=daily_games,
+                opp_totals=opp_proj_totals,
+                period_dates=schedule_index.scoring_period_dates(),
+            )
 
     return PreviewResponse(
         schema_version="2.0",
@@ -389,24 +405,16 @@ def build_preview(
         generated_at=iso_ts(),
         league_id=league_id,
         team_id=team_id,
-        you_team_name=_fantasy_team_name(you_team),
+        you_team_name=you_team.name,
         opp_team_id=opp_team_id if opp_team_id > 0 else None,
-        opp_team_name=_fantasy_team_name(opp_team),
-        you_standing=_team_standing(you_team),
-        opp_standing=_team_standing(opp_team),
+        opp_team_name=opp_team.name,
+        you_standing=you_team.standing,
+        opp_standing=opp_team.standing,
         matchup_period_id=matchup_period_id,
         projected_matchup_score=_matchup_score_with_ties(categories),
         rosters=PreviewRosterGroup(
-            you=_preview_roster_entries(
-                you_team,
-                season_id,
-                games_total_by_pro_team=games_map,
-            ),
-            opp=_preview_roster_entries(
-                opp_team,
-                season_id,
-                games_total_by_pro_team=games_map,
-            ),
+            you=_preview_roster_entries(you_team, season_id, games_total_by_pro_team=games_map),
+            opp=_preview_roster_entries(opp_team, season_id, games_total_by_pro_team=games_map),
         ),
         categories=_category_projection_map(categories),
         games=GamesBreakdown(
@@ -415,81 +423,69 @@ def build_preview(
             games_diff=games_diff,
         ),
         lineup_actions=lineup_actions,
+        lineup_plan=lineup_plan,
         summary_hints=_summary_hints(categories),
         data_quality=DataQuality(
             projection_basis="season_avg_x_projected_games",
             projection_used=has_projection_signal,
             season_id=season_id,
             scoring_period_ids=scoring_period_ids,
-            your_starters_missing_season_stats=_count_missing_season_stats(
-                you_team, season_id, games_map, starter_slot_counts
-            ),
-            opp_starters_missing_season_stats=_count_missing_season_stats(
-                opp_team, season_id, games_map, starter_slot_counts
-            ),
+            your_starters_missing_season_stats=you_analysis.missing_stats_count,
+            opp_starters_missing_season_stats=opp_analysis.missing_stats_count,
         ),
         outlook=_outlook(favored, at_risk, games_diff),
     )
 
 
 def build_outlook(
-    league_payload: dict[str, Any],
-    schedule_payload: dict[str, Any],
+    league_payload: dict[str, Any] | League,
+    schedule_payload: dict[str, Any] | ScheduleIndex,
     team_id: int,
     league_id: str,
+    simulations: int = 0,
+    seed: int = 0,
 ) -> OutlookResponse:
-    matchup_period_id, scoring_period_ids, _ = _resolve_matchup_window(league_payload, schedule_payload, "current")
-    try:
-        you_side, opp_side = _find_matchup_for_period(league_payload, team_id, matchup_period_id)
-    except ValueError:
-        you_side = {"teamId": team_id}
-        opp_side = {"teamId": -1}
-
-    teams = _team_map(league_payload)
-    you_team = teams.get(team_id, {})
-    opp_team_id = _to_int(opp_side.get("teamId", -1), -1)
-    opp_team = teams.get(opp_team_id, {})
-    starter_slot_counts = _starter_slot_counts(league_payload)
-
-    current_scoring_period = (league_payload.get("status") or {}).get("currentScoringPeriod")
+    with timings.stage("schedule_index"):
+        schedule_index = _as_schedule_index(schedule_payload)
+    payload = league_payload.payload if isinstance(league_payload, League) else league_payload
+    matchup_period_id, scoring_period_ids, _ = _resolve_matchup_window(payload, schedule_index, "current")
+    with timings.stage("league_model"):
+        league = _as_league(league_payload)
+        try:
+            you_side, opp_side = league.find_matchup(team_id, matchup_period_id)
+        except ValueError:
+            you_side = {"teamId": team_id}
+            opp_side = {"teamId": -1}
+        you_team = league.team(team_id)
+        opp_team_id = _to_int(opp_side.get("teamId", -1), -1)
+        opp_team = league.team(opp_team_id)
+    starter_slot_counts = _starter_slot_counts(payload)
+
+    current_scoring_period = (payload.get("status") or {}).get("currentScoringPeriod")
     if isinstance(current_scoring_period, list):
         current_scoring_period = current_scoring_period[0] if current_scoring_period else None
     current_scoring_period_id = _to_int(current_scoring_period, 0)
     remaining_scoring_period_ids = [pid for pid in scoring_period_ids if pid > current_scoring_period_id]
     played_scoring_period_ids = [pid for pid in scoring_period_ids if pid <= current_scoring_period_id]
 
-    remaining_games_map = _games_by_pro_team(
-        schedule_payload, matchup_period_id, scoring_period_ids=remaining_scoring_period_ids
-    )
-    played_games_map = _games_by_pro_team(
-        schedule_payload, matchup_period_id, scoring_period_ids=played_scoring_period_ids
-    )
-    you_remaining_games = _team_projected_games(
-        you_team, remaining_games_map, starter_slot_counts=starter_slot_counts
-    )
-    opp_remaining_games = _team_projected_games(
-        opp_team, remaining_games_map, starter_slot_counts=starter_slot_counts
+    remaining_games_map = schedule_index.games_by_pro_team(
+        matchup_period_id, scoring_period_ids=remaining_scoring_period_ids
     )
+    played_games_map = schedule_index.games_by_pro_team(matchup_period_id, scoring_period_ids=played_scoring_period_ids)
+    season_id = _infer_season_id(league, you_team)
+    with timings.stage("roster_analysis"):
+        you_analysis = RosterAnalysis.build(you_team, season_id, remaining_games_map, starter_slot_counts)
+        opp_analysis = RosterAnalysis.build(opp_team, season_id, remaining_games_map, starter_slot_counts)
+    you_remaining_games = you_analysis.total_games
+    opp_remaining_games = opp_analysis.total_games
     games_remaining_diff = you_remaining_games - opp_remaining_games
 
     current_categories = _compute_categories(you_side, opp_side)
 
-    season_id = _infer_season_id(league_payload, you_team)
-
     you_current_totals = _current_category_totals_from_side(you_side)
     opp_current_totals = _current_category_totals_from_side(opp_side)
-    you_remaining_totals = _projected_category_totals_from_starters(
-        you_team,
-        season_id=season_id,
-        pro_team_games=remaining_games_map,
-        starter_slot_counts=starter_slot_counts,
-    )
-    opp_remaining_totals = _projected_category_totals_from_starters(
-        opp_team,
-        season_id=season_id,
-        pro_team_games=remaining_games_map,
-        starter_slot_counts=starter_slot_counts,
-    )
+    with timings.stage("projection"):
+        you_remaining_totals, opp_remaining_totals = _projected_totals([you_analysis, opp_analysis])
 
     you_projected_totals = _combine_category_totals(you_current_totals, you_remaining_totals)
     opp_projected_totals = _combine_category_totals(opp_current_totals, opp_remaining_totals)
@@ -497,17 +493,32 @@ def build_outlook(
     projected_favored, projected_at_risk = _signal_lists(projected_categories)
     projection_used = any(c.you != 0.0 or c.opp != 0.0 for c in projected_categories)
 
+    win_probability = None
+    if simulations > 0:
+        with timings.stage("simulation"):
+            win_probability = simulate_matchup(
+                you_analysis,
+                opp_analysis,
+                season_id=season_id,
+                pro_team_games=remaining_games_map,
+                starter_slot_counts=starter_slot_counts,
+                you_current=you_current_totals,
+                opp_current=opp_current_totals,
+                simulations=simulations,
+                seed=seed,
+            )
+
     return OutlookResponse(
         schema_version="2.0",
         command="matchup_outlook",
         generated_at=iso_ts(),
         league_id=league_id,
         team_id=team_id,
-        you_team_name=_fantasy_team_name(you_team),
+        you_team_name=you_team.name,
         opp_team_id=opp_team_id if opp_team_id > 0 else None,
-        opp_team_name=_fantasy_team_name(opp_team),
-        you_standing=_team_standing(you_team),
-        opp_standing=_team_standing(opp_team),
+        opp_team_name=opp_team.name,
+        you_standing=you_team.standing,
+        opp_standing=opp_team.standing,
         matchup_period_id=matchup_period_id,
         current_matchup_score=_matchup_score_with_ties(current_categories),
         projected_matchup_score=_matchup_score_with_ties(projected_categories),
@@ -537,12 +548,9 @@ def build_outlook(
             projection_used=projection_used,
             season_id=season_id,
             scoring_period_ids=remaining_scoring_period_ids,
-            your_starters_missing_season_stats=_count_missing_season_stats(
-                you_team, season_id, remaining_games_map, starter_slot_counts
-            ),
-            opp_starters_missing_season_stats=_count_missing_season_stats(
-                opp_team, season_id, remaining_games_map, starter_slot_counts
-            ),
+            your_starters_missing_season_stats=you_analysis.missing_stats_count,
+            opp_starters_missing_season_stats=opp_analysis.missing_stats_count,
         ),
         outlook=_outlook(projected_favored, projected_at_risk, games_remaining_diff),
+        win_probability=win_probability,
     )
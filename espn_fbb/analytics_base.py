@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from typing import Any
 
 from espn_fbb.schema import (
@@ -146,21 +147,6 @@ def _extract_points_by_stat(side: dict[str, Any]) -> dict[str, float]:
     return {cat: by_stat.get(stat_id, 0.0) for cat, stat_id in STAT_ID_MAP.items()}
 
 
-def _find_matchup_for_period(league: dict[str, Any], team_id: int, matchup_period_id: int) -> tuple[dict[str, Any], dict[str, Any]]:
-    for matchup in league.get("schedule", []):
-        if _to_int(matchup.get("matchupPeriodId", -1), -1) != matchup_period_id:
-            continue
-        home = matchup.get("home", {})
-        away = matchup.get("away", {})
-        home_id = _to_int(home.get("teamId", -1), -1)
-        away_id = _to_int(away.get("teamId", -1), -1)
-        if home_id == team_id:
-            return home, away
-        if away_id == team_id:
-            return away, home
-    raise ValueError(f"No matchup found for team_id={team_id} matchup_period_id={matchup_period_id}")
-
-
 def _current_matchup_period_id(league: dict[str, Any]) -> int:
     status = league.get("status", {})
     current = status.get("currentMatchupPeriod")
@@ -239,55 +225,132 @@ def _team_standing(team: dict[str, Any]) -> TeamStanding | None:
     return TeamStanding(rank=rank, wins=wins, losses=losses, ties=ties, percentage=pct)
 
 
-def _player_stat_map(player: dict[str, Any], scoring_period_id: int | None = None) -> dict[int, float]:
-    stats = player.get("stats", [])
-    preferred: dict[str, Any] | None = None
+_DENSE_STAT_LIMIT = 128
+_MISSING = float("nan")
 
-    for row in stats:
-        stat_source_id = row.get("statSourceId")
-        if stat_source_id is not None and _to_int(stat_source_id, -1) != 0:
-            continue
-        if scoring_period_id is not None:
+
+class StatVector:
+    """ESPN stat row parsed once into a dense float array indexed by stat id (NaN = absent)."""
+
+    __slots__ = ("values", "extra", "count")
+
+    def __init__(self, values: array[float] | None = None, extra: dict[int, float] | None = None) -> None:
+        self.values = values if values is not None else array("d")
+        self.extra = extra or {}
+        self.count = sum(1 for v in self.values if v == v) + len(self.extra)
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> StatVector:
+        if not isinstance(raw, dict) or not raw:
+            return EMPTY_STATS
+        parsed: dict[int, float] = {}
+        for k, v in raw.items():
+            try:
+                parsed[int(k)] = _to_float(v)
+            except (TypeError, ValueError):
+                continue
+        dense_ids = [sid for sid in parsed if 0 <= sid < _DENSE_STAT_LIMIT]
+        values = array("d", [_MISSING]) * (max(dense_ids) + 1 if dense_ids else 0)
+        extra: dict[int, float] = {}
+        for sid, value in parsed.items():
+            if 0 <= sid < _DENSE_STAT_LIMIT:
+                values[sid] = value
+            else:
+                extra[sid] = value
+        return cls(values, extra)
+
+    def get(self, stat_id: int, default: Any = None) -> Any:
+        if 0 <= stat_id < len(self.values):
+            value = self.values[stat_id]
+            return default if value != value else value
+        return self.extra.get(stat_id, default)
+
+    def __contains__(self, stat_id: object) -> bool:
+        return isinstance(stat_id, int) and self.get(stat_id) is not None
+
+    def __getitem__(self, stat_id: int) -> float:
+        value = self.get(stat_id)
+        if value is None:
+            raise KeyError(stat_id)
+        return value
+
+    def __len__(self) -> int:
+        return self.count
+
+    def items(self) -> list[tuple[int, float]]:
+        out = [(sid, value) for sid, value in enumerate(self.values) if value == value]
+        out.extend(self.extra.items())
+        return out
+
+    def to_dict(self) -> dict[int, float]:
+        return dict(self.items())
+
+
+EMPTY_STATS = StatVector()
+
+
+def _row_key_int(value: Any) -> int | None:
+    return None if value is None else _to_int(value, -1)
+
+
+class PlayerStats:
+    """All stat rows for one player, keyed by (statSourceId, statSplitTypeId, seasonId, scoringPeriodId)."""
+
+    __slots__ = ("rows", "by_period", "first_nonempty", "max_season_id")
+
+    def __init__(self, stats: Any) -> None:
+        self.rows: dict[tuple[int | None, int | None, int | None, int | None], StatVector] = {}
+        self.by_period: dict[int, StatVector] = {}
+        self.first_nonempty: StatVector | None = None
+        self.max_season_id = 0
+        if not isinstance(stats, list):
+            return
+
+        for row in stats:
+            vector = StatVector.from_raw(row.get("stats"))
+            source = _row_key_int(row.get("statSourceId"))
+            season = _row_key_int(row.get("seasonId"))
+            key = (source, _row_key_int(row.get("statSplitTypeId")), season, _row_key_int(row.get("scoringPeriodId")))
+            self.rows.setdefault(key, vector)
+            self.max_season_id = max(self.max_season_id, season or 0)
+
+            # Actual stats: statSourceId 0, or rows that omit the source entirely.
+            if source not in (None, 0):
+                continue
+            if self.first_nonempty is None and row.get("stats"):
+                self.first_nonempty = vector
             row_period = row.get("scoringPeriodId")
             if isinstance(row_period, list):
                 row_period = row_period[0] if row_period else None
-            if row_period is not None and _to_int(row_period, -1) == scoring_period_id:
-                preferred = row
-                break
-            continue
-        if preferred is None and row.get("stats"):
-            preferred = row
-
-    if preferred is None:
-        return {}
-
-    raw = preferred.get("stats", {})
-    out: dict[int, float] = {}
-    for k, v in raw.items():
-        try:
-            out[int(k)] = _to_float(v)
-        except (TypeError, ValueError):
-            continue
-    return out
+            if row_period is not None:
+                self.by_period.setdefault(_to_int(row_period, -1), vector)
 
+    def season_totals(self, season_id: int) -> StatVector:
+        return self.rows.get((0, 0, season_id, 0), EMPTY_STATS)
+
+    def period(self, scoring_period_id: int | None) -> StatVector:
+        if scoring_period_id is None:
+            return self.first_nonempty or EMPTY_STATS
+        return self.by_period.get(scoring_period_id, EMPTY_STATS)
 
-def _has_stats_for_period(player: dict[str, Any], scoring_period_id: int) -> bool:
-    stats = player.get("stats", [])
-    for row in stats:
-        stat_source_id = row.get("statSourceId")
-        if stat_source_id is not None and _to_int(stat_source_id, -1) != 0:
-            continue
-        row_period = row.get("scoringPeriodId")
-        if isinstance(row_period, list):
-            row_period = row_period[0] if row_period else None
-        if row_period is None or _to_int(row_period, -1) != scoring_period_id:
-            continue
-        row_stats = row.get("stats", {})
-        return bool(row_stats)
-    return False
 
+class PlayerStatIndex:
+    """Per-payload cache of parsed player stats, keyed by player object identity."""
 
-def _fg_pct(stat_map: dict[int, float]) -> float:
+    def __init__(self) -> None:
+        self._players: dict[int, tuple[dict[str, Any], PlayerStats]] = {}
+
+    def player(self, player: dict[str, Any]) -> PlayerStats:
+        cached = self._players.get(id(player))
+        if cached is not None:
+            return cached[1]
+        stats = PlayerStats(player.get("stats", []))
+        # Holding the player dict keeps its id() from being reused while the index is alive.
+        self._players[id(player)] = (player, stats)
+        return stats
+
+
+def _fg_pct(stat_map: StatVector | dict[int, float]) -> float:
     if STAT_ID_MAP["FG%"] in stat_map:
         return stat_map[STAT_ID_MAP["FG%"]]
     fga = stat_map.get(FGA_STAT_ID, 0.0)
@@ -296,7 +359,7 @@ def _fg_pct(stat_map: dict[int, float]) -> float:
     return stat_map.get(FGM_STAT_ID, 0.0) / fga
 
 
-def _ft_pct(stat_map: dict[int, float]) -> float:
+def _ft_pct(stat_map: StatVector | dict[int, float]) -> float:
     if STAT_ID_MAP["FT%"] in stat_map:
         return stat_map[STAT_ID_MAP["FT%"]]
     fta = stat_map.get(FTA_STAT_ID, 0.0)
@@ -305,7 +368,7 @@ def _ft_pct(stat_map: dict[int, float]) -> float:
     return stat_map.get(FTM_STAT_ID, 0.0) / fta
 
 
-def _double_triple_counts(stat_map: dict[int, float]) -> tuple[bool, bool]:
+def _double_triple_counts(stat_map: StatVector | dict[int, float]) -> tuple[bool, bool]:
     major = [
         stat_map.get(STAT_ID_MAP["PTS"], 0.0),
         stat_map.get(STAT_ID_MAP["REB"], 0.0),
@@ -329,15 +392,6 @@ def _roster_entries(team: dict[str, Any]) -> list[dict[str, Any]]:
     return []
 
 
-def _active_count(team: dict[str, Any]) -> int:
-    count = 0
-    for entry in _roster_entries(team):
-        slot = _to_int(entry.get("lineupSlotId", -1), -1)
-        if 0 <= slot <= 12:
-            count += 1
-    return count
-
-
 def _compute_categories(you_side: dict[str, Any], opp_side: dict[str, Any]) -> list[CategoryStat]:
     you_scores = _extract_points_by_stat(you_side)
     opp_scores = _extract_points_by_stat(opp_side)
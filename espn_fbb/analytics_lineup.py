@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import erf, exp, pi, sqrt
+from typing import Any
+
+from espn_fbb.analytics_base import (
+    CATEGORY_ORDER,
+    FGA_STAT_ID,
+    FGM_STAT_ID,
+    FTA_STAT_ID,
+    FTM_STAT_ID,
+    STAT_ID_MAP,
+    PlayerStatIndex,
+    _to_float,
+)
+from espn_fbb.league_model import Team, _as_team
+from espn_fbb.schema import DailyLineup, LineupPlan, SlotAssignment
+
+SLOT_NAMES = {
+    0: "PG",
+    1: "SG",
+    2: "SF",
+    3: "PF",
+    4: "C",
+    5: "G",
+    6: "F",
+    7: "SG/SF",
+    8: "G/F",
+    9: "PF/C",
+    10: "F/C",
+    11: "UTIL",
+    12: "BE",
+    13: "IR",
+}
+IR_SLOTS = {13, 14, 15, 16, 17}
+COUNTING_CATEGORIES = ("PTS", "3PM", "REB", "AST", "STL", "BLK", "TO")
+RELINEARIZE_ROUNDS = 6
+
+_RATE_KEYS = (*COUNTING_CATEGORIES, "FGM", "FGA", "FTM", "FTA")
+_RATE_STAT_IDS = (*(STAT_ID_MAP[cat] for cat in COUNTING_CATEGORIES), FGM_STAT_ID, FGA_STAT_ID, FTM_STAT_ID, FTA_STAT_ID)
+_FORBIDDEN = 1e12
+_FILL_BONUS = 1e-6
+_MIN_PCT_SIGMA = 0.005
+
+
+@dataclass
+class _Candidate:
+    player_id: int
+    name: str
+    lineup_slot_id: int
+    eligible: frozenset[int] | None
+    pro_team_id: int
+    rates: dict[str, float]
+
+    def can_fill(self, slot: int) -> bool:
+        return self.eligible is None or slot in self.eligible
+
+
+def _candidates(team: Team, season_id: int) -> list[_Candidate]:
+    out: list[_Candidate] = []
+    for entry in team.entries:
+        player = entry.player
+        if entry.slot in IR_SLOTS or player.out or player.pro_team_id is None:
+            continue
+        totals = player.stats.season_totals(season_id)
+        gp = totals.get(42, 0.0)
+        rates = {key: (totals.get(sid, 0.0) / gp if gp > 0 else 0.0) for key, sid in zip(_RATE_KEYS, _RATE_STAT_IDS)}
+        out.append(
+            _Candidate(
+                player_id=player.id,
+                name=player.name,
+                lineup_slot_id=entry.slot,
+                eligible=player.eligible_slots,
+                pro_team_id=player.pro_team_id,
+                rates=rates,
+            )
+        )
+    out.sort(key=lambda c: c.player_id)
+    return out
+
+
+def _min_cost_assignment(cost: list[list[float]]) -> list[int]:
+    """Hungarian algorithm for an n x m cost matrix with n <= m; returns the column picked for each row."""
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        owner[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if used[j]:
+                    continue
+                cur = row[j - 1] - ui0 - v[j]
+                if cur < minv[j]:
+                    minv[j] = cur
+                    way[j] = j0
+                if minv[j] < delta:
+                    delta = minv[j]
+                    j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+    picked = [-1] * n
+    for j in range(1, m + 1):
+        if owner[j]:
+            picked[owner[j] - 1] = j - 1
+    return picked
+
+
+def _assign_day(seats: list[int], playing: list[_Candidate], values: dict[int, float]) -> dict[int, _Candidate]:
+    """Max-value assignment of playing candidates to starter seats; seats may stay empty."""
+    if not seats or not playing:
+        return {}
+    # Rows are seats, columns are players plus one "empty" column per seat.
+    cost = []
+    for slot in seats:
+        row = [-values[c.player_id] if c.can_fill(slot) else _FORBIDDEN for c in playing]
+        row.extend([0.0] * len(seats))
+        cost.append(row)
+    picked = _min_cost_assignment(cost)
+    out: dict[int, _Candidate] = {}
+    for seat_idx, col in enumerate(picked):
+        if col < len(playing) and cost[seat_idx][col] < _FORBIDDEN:
+            out[seat_idx] = playing[col]
+    return out
+
+
+def _lineup_totals(days: dict[int, dict[int, _Candidate]], daily_games: dict[int, dict[int, int]]) -> dict[str, float]:
+    sums = {key: 0.0 for key in _RATE_KEYS}
+    for pid, lineup in days.items():
+        games_today = daily_games.get(pid, {})
+        for cand in lineup.values():
+            games = games_today.get(cand.pro_team_id, 0)
+            for key in _RATE_KEYS:
+                sums[key] += cand.rates[key] * games
+    totals = {cat: sums[cat] for cat in COUNTING_CATEGORIES}
+    totals["FG%"] = sums["FGM"] / sums["FGA"] if sums["FGA"] > 0 else 0.0
+    totals["FT%"] = sums["FTM"] / sums["FTA"] if sums["FTA"] > 0 else 0.0
+    totals["FGA"] = sums["FGA"]
+    totals["FTA"] = sums["FTA"]
+    return totals
+
+
+def _binomial_variance(pct: float, attempts: float) -> float:
+    pct = min(max(pct, 0.0), 1.0)
+    return pct * (1.0 - pct) / attempts
+
+
+def _category_z(cat: str, you: dict[str, float], opp: dict[str, float]) -> tuple[float, float]:
+    # Normal approximation per category: counting stats use a Poisson-style variance, percentages a binomial one.
+    if cat in ("FG%", "FT%"):
+        attempts = "FGA" if cat == "FG%" else "FTA"
+        p_you, p_opp = you.get(cat, 0.0), _to_float(opp.get(cat))
+        a_you, a_opp = max(you.get(attempts, 0.0), 1.0), max(_to_float(opp.get(attempts)), 1.0)
+        sigma = max(sqrt(_binomial_variance(p_you, a_you) + _binomial_variance(p_opp, a_opp)), _MIN_PCT_SIGMA)
+    else:
+        sigma = sqrt(max(abs(you.get(cat, 0.0)) + abs(_to_float(opp.get(cat))), 1.0))
+    margin = you.get(cat, 0.0) - _to_float(opp.get(cat))
+    if cat == "TO":
+        margin = -margin
+    return margin / sigma, sigma
+
+
+def _expected_category_wins(you: dict[str, float], opp: dict[str, float]) -> float:
+    total = 0.0
+    for cat in CATEGORY_ORDER:
+        z, _ = _category_z(cat, you, opp)
+        total += 0.5 * (1.0 + erf(z / sqrt(2.0)))
+    return total
+
+
+def _marginal_values(candidates: list[_Candidate], you: dict[str, float], opp: dict[str, float]) -> dict[int, float]:
+    """Per-game gain in expected category wins from starting each candidate, linearized at the current totals."""
+    weights: dict[str, float] = {}
+    for cat in CATEGORY_ORDER:
+        z, sigma = _category_z(cat, you, opp)
+        weights[cat] = exp(-0.5 * z * z) / sqrt(2.0 * pi) / sigma
+    weights["TO"] = -weights["TO"]
+
+    fga = max(you.get("FGA", 0.0), 1.0)
+    fta = max(you.get("FTA", 0.0), 1.0)
+    out: dict[int, float] = {}
+    for cand in candidates:
+        r = cand.rates
+        value = sum(weights[cat] * r[cat] for cat in COUNTING_CATEGORIES)
+        value += weights["FG%"] * (r["FGM"] - you.get("FG%", 0.0) * r["FGA"]) / fga
+        value += weights["FT%"] * (r["FTM"] - you.get("FT%", 0.0) * r["FTA"]) / fta
+        out[cand.player_id] = value + _FILL_BONUS
+    return out
+
+
+def _plan_days(
+    seats: list[int],
+    candidates: list[_Candidate],
+    daily_games: dict[int, dict[int, int]],
+    values: dict[int, float],
+) -> dict[int, dict[int, _Candidate]]:
+    days: dict[int, dict[int, _Candidate]] = {}
+    solved: dict[tuple[int, ...], dict[int, _Candidate]] = {}
+    for pid in sorted(daily_games):
+        games_today = daily_games[pid]
+        playing = [c for c in candidates if games_today.get(c.pro_team_id, 0) > 0]
+        key = tuple(c.player_id for c in playing)
+        if key not in solved:
+            solved[key] = _assign_day(seats, playing, values)
+        days[pid] = solved[key]
+    return days
+
+
+def _games_started(days: dict[int, dict[int, _Candidate]], daily_games: dict[int, dict[int, int]]) -> int:
+    return sum(
+        daily_games.get(pid, {}).get(cand.pro_team_id, 0) for pid, lineup in days.items() for cand in lineup.values()
+    )
+
+
+def _baseline_days(
+    seats: list[int], candidates: list[_Candidate], daily_games: dict[int, dict[int, int]]
+) -> dict[int, dict[int, _Candidate]]:
+    # The lineup as currently set in ESPN, carried through every day of the window.
+    starters = [c for c in candidates if c.lineup_slot_id in set(seats)]
+    days: dict[int, dict[int, _Candidate]] = {}
+    for pid, games_today in daily_games.items():
+        days[pid] = {idx: c for idx, c in enumerate(starters) if games_today.get(c.pro_team_id, 0) > 0}
+    return days
+
+
+def optimize_daily_lineups(
+    team: Team | dict[str, Any],
+    season_id: int,
+    starter_slot_counts: dict[int, int],
+    daily_games: dict[int, dict[int, int]],
+    opp_totals: dict[str, float],
+    stats_index: PlayerStatIndex | None = None,
+    period_dates: dict[int, Any] | None = None,
+) -> LineupPlan | None:
+    seats = [slot for slot in sorted(starter_slot_counts) for _ in range(starter_slot_counts[slot])]
+    candidates = _candidates(_as_team(team, stats_index), season_id)
+    if not seats or not candidates or not daily_games:
+        return None
+
+    # Start from the games-maximizing lineup, then re-solve with values linearized around the current plan
+    # (a few rounds of successive linear assignment) and keep whichever maximizes expected category wins.
+    best_days = _plan_days(seats, candidates, daily_games, {c.player_id: 1.0 for c in candidates})
+    best_totals = _lineup_totals(best_days, daily_games)
+    best_wins = _expected_category_wins(best_totals, opp_totals)
+    totals = best_totals
+    for _ in range(RELINEARIZE_ROUNDS):
+        days = _plan_days(seats, candidates, daily_games, _marginal_values(candidates, totals, opp_totals))
+        totals = _lineup_totals(days, daily_games)
+        wins = _expected_category_wins(totals, opp_totals)
+        if wins <= best_wins + 1e-12:
+            break
+        best_days, best_totals, best_wins = days, totals, wins
+
+    baseline_days = _baseline_days(seats, candidates, daily_games)
+    baseline_wins = _expected_category_wins(_lineup_totals(baseline_days, daily_games), opp_totals)
+    dates = period_dates or {}
+
+    plan_days: list[DailyLineup] = []
+    for pid in sorted(best_days):
+        lineup = best_days[pid]
+        started = {cand.player_id for cand in lineup.values()}
+        plan_days.append(
+            DailyLineup(
+                scoring_period_id=pid,
+                date=dates[pid].isoformat() if pid in dates else None,
+                starters=[
+                    SlotAssignment(
+                        slot_id=seats[idx],
+                        slot=SLOT_NAMES.get(seats[idx], str(seats[idx])),
+                        player_id=cand.player_id,
+                        player_name=cand.name,
+                    )
+                    for idx, cand in sorted(lineup.items())
+                ],
+                benched_player_ids=[
+                    c.player_id
+                    for c in candidates
+                    if daily_games[pid].get(c.pro_team_id, 0) > 0 and c.player_id not in started
+                ],
+            )
+        )
+
+    return LineupPlan(
+        games_started=_games_started(best_days, daily_games),
+        baseline_games_started=_games_started(baseline_days, daily_games),
+        expected_category_wins=round(best_wins, 4),
+        baseline_expected_category_wins=round(baseline_wins, 4),
+        days=plan_days,
+    )
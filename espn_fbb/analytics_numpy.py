@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from espn_fbb.analytics_base import (
+    CATEGORY_ORDER,
+    FGA_STAT_ID,
+    FGM_STAT_ID,
+    FTA_STAT_ID,
+    FTM_STAT_ID,
+    STAT_ID_MAP,
+    StatVector,
+)
+from espn_fbb.utils import UNLOADED, optional_import
+
+# Imported on first use: NumPy is a large share of CLI startup and recap never touches it.
+np: Any = UNLOADED
+
+COUNTING_CATEGORIES = ("PTS", "3PM", "REB", "AST", "STL", "BLK", "TO")
+GP_STAT_ID = 42
+
+# Column layout of the players x stat-id matrix: counting cats, then makes/attempts, then games played.
+_PROJECTED_STAT_IDS = (
+    *(STAT_ID_MAP[cat] for cat in COUNTING_CATEGORIES),
+    FGM_STAT_ID,
+    FGA_STAT_ID,
+    FTM_STAT_ID,
+    FTA_STAT_ID,
+)
+_GP_COLUMN = len(_PROJECTED_STAT_IDS)
+_STAT_COLUMNS = [*_PROJECTED_STAT_IDS, GP_STAT_ID]
+
+
+def available() -> bool:
+    global np
+    if np is UNLOADED:
+        np = optional_import("numpy")
+    return np is not None
+
+
+def _stat_matrix(vectors: Sequence[StatVector]) -> Any:
+    width = max(_STAT_COLUMNS) + 1
+    dense = np.full((len(vectors), width), np.nan)
+    for row, vector in enumerate(vectors):
+        size = min(len(vector.values), width)
+        if size:
+            dense[row, :size] = vector.values[:size]
+    matrix = dense[:, _STAT_COLUMNS]
+    matrix[np.isnan(matrix)] = 0.0
+    return matrix
+
+
+def _projected_rows(vectors: Sequence[StatVector], games: Sequence[float]) -> tuple[Any, Any]:
+    """Per-player projected stat rows (stat / gp * games) and the mask of players that project at all."""
+    matrix = _stat_matrix(vectors)
+    game_counts = np.asarray(games, dtype=np.float64)
+    gp = matrix[:, _GP_COLUMN]
+    has_stats = np.fromiter((len(v) > 0 for v in vectors), dtype=bool, count=len(vectors))
+    valid = has_stats & (gp > 0) & (game_counts > 0)
+    rows = np.zeros((len(vectors), _GP_COLUMN), dtype=np.float64)
+    rows[valid] = matrix[valid, :_GP_COLUMN] / gp[valid, None] * game_counts[valid, None]
+    return rows, valid
+
+
+def _totals_from_rows(rows: Any) -> dict[str, float]:
+    # cumsum accumulates strictly in row order, matching the pure-Python running sums bit for bit
+    # (the trailing + 0.0 mirrors the Python sums starting from 0.0, which never end at -0.0).
+    summed = (np.cumsum(rows, axis=0)[-1] if len(rows) else np.zeros(_GP_COLUMN)) + 0.0
+    totals = {cat: 0.0 for cat in CATEGORY_ORDER}
+    for col, cat in enumerate(COUNTING_CATEGORIES):
+        totals[cat] = float(summed[col])
+    fgm, fga, ftm, fta = (float(v) for v in summed[len(COUNTING_CATEGORIES) :])
+    totals["FG%"] = (fgm / fga) if fga > 0 else 0.0
+    totals["FT%"] = (ftm / fta) if fta > 0 else 0.0
+    totals["FGM"] = fgm
+    totals["FGA"] = fga
+    totals["FTM"] = ftm
+    totals["FTA"] = fta
+    return totals
+
+
+def projected_team_totals(teams: Sequence[tuple[Sequence[StatVector], Sequence[float]]]) -> list[dict[str, float]]:
+    vectors = [v for team_vectors, _ in teams for v in team_vectors]
+    games = [g for _, team_games in teams for g in team_games]
+    rows, valid = _projected_rows(vectors, games)
+    out: list[dict[str, float]] = []
+    start = 0
+    for team_vectors, _ in teams:
+        end = start + len(team_vectors)
+        out.append(_totals_from_rows(rows[start:end][valid[start:end]]))
+        start = end
+    return out
+
+
+def projected_contribs(vectors: Sequence[StatVector], games: Sequence[float]) -> list[dict[str, float]]:
+    rows, _ = _projected_rows(vectors, games)
+    counting = rows[:, : len(COUNTING_CATEGORIES)].tolist()
+    return [dict(zip(COUNTING_CATEGORIES, row)) for row in counting]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
+from espn_fbb import analytics_numpy
 from espn_fbb.analytics_base import (
     CATEGORY_ORDER,
     FGA_STAT_ID,
@@ -9,144 +11,131 @@ from espn_fbb.analytics_base import (
     FTA_STAT_ID,
     FTM_STAT_ID,
     STAT_ID_MAP,
-    _roster_entries,
+    PlayerStatIndex,
+    StatVector,
     _status_for_category,
     _to_float,
     _to_int,
 )
+from espn_fbb.league_model import League, Player, RosterEntry, Team, _as_team
 from espn_fbb.schema import CategorySignal, CategoryStat, LineupAction
 
 
-def _entry_projected_games(entry: dict[str, Any], pro_team_games: dict[int, int]) -> int:
-    player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-    pro_team_id = player.get("proTeamId")
-    if pro_team_id is None:
-        return 0
-    return pro_team_games.get(_to_int(pro_team_id, -1), 0)
-
-
 def _projected_starter_entries(
-    team: dict[str, Any], pro_team_games: dict[int, int], starter_slot_counts: dict[int, int]
-) -> list[dict[str, Any]]:
+    team: Team, pro_team_games: dict[int, int], starter_slot_counts: dict[int, int]
+) -> list[RosterEntry]:
     starter_slots = set(starter_slot_counts.keys())
     starter_target = sum(starter_slot_counts.values())
     ir_slots = {13, 14, 15, 16, 17}
 
-    entries = _roster_entries(team)
-    locked_starters: list[dict[str, Any]] = []
-    bench_candidates: list[dict[str, Any]] = []
+    locked_starters: list[RosterEntry] = []
+    bench_candidates: list[RosterEntry] = []
 
-    for entry in entries:
-        slot = _to_int(entry.get("lineupSlotId", -1), -1)
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        injury = str(player.get("injuryStatus", "")).upper()
-        if slot in starter_slots:
-            if injury != "OUT":
+    for entry in team.entries:
+        if entry.slot in starter_slots:
+            if not entry.player.out:
                 locked_starters.append(entry)
-        elif slot not in ir_slots and injury != "OUT":
+        elif entry.slot not in ir_slots and not entry.player.out:
             bench_candidates.append(entry)
 
     selected = list(locked_starters)
-    selected_ids = {_to_int(((e.get("playerPoolEntry") or {}).get("player") or {}).get("id"), -1) for e in selected}
-    bench_candidates.sort(key=lambda e: _entry_projected_games(e, pro_team_games), reverse=True)
+    selected_ids = {e.player.id for e in selected}
+    bench_candidates.sort(key=lambda e: e.player.games(pro_team_games), reverse=True)
 
     for entry in bench_candidates:
         if len(selected) >= starter_target:
             break
-        pid = _to_int(((entry.get("playerPoolEntry") or {}).get("player") or {}).get("id"), -1)
-        if pid in selected_ids:
+        if entry.player.id in selected_ids:
             continue
         selected.append(entry)
-        selected_ids.add(pid)
+        selected_ids.add(entry.player.id)
 
     if len(selected) < starter_target:
-        for entry in entries:
-            slot = _to_int(entry.get("lineupSlotId", -1), -1)
-            if slot not in starter_slots:
+        for entry in team.entries:
+            if entry.slot not in starter_slots:
                 continue
-            pid = _to_int(((entry.get("playerPoolEntry") or {}).get("player") or {}).get("id"), -1)
-            if pid in selected_ids:
+            if entry.player.id in selected_ids:
                 continue
             selected.append(entry)
-            selected_ids.add(pid)
+            selected_ids.add(entry.player.id)
             if len(selected) >= starter_target:
                 break
 
     return selected
 
 
-def _team_projected_games(
-    team: dict[str, Any], pro_team_games: dict[int, int], starter_slot_counts: dict[int, int]
-) -> int:
-    selected = _projected_starter_entries(team, pro_team_games, starter_slot_counts)
-    return sum(_entry_projected_games(entry, pro_team_games) for entry in selected)
+@dataclass(slots=True)
+class RosterAnalysis:
+    """Projected starters for one team over one games map, shared by every projection consumer."""
+
+    starters: list[RosterEntry]
+    season_totals: list[StatVector]
+    games: list[float]
+    missing_stats: list[bool]
+    total_games: int
+
+    @classmethod
+    def build(
+        cls, team: Team, season_id: int, pro_team_games: dict[int, int], starter_slot_counts: dict[int, int]
+    ) -> RosterAnalysis:
+        starters = _projected_starter_entries(team, pro_team_games, starter_slot_counts)
+        season_totals = [entry.player.stats.season_totals(season_id) for entry in starters]
+        games = [entry.player.games(pro_team_games) for entry in starters]
+        return cls(
+            starters=starters,
+            season_totals=season_totals,
+            games=[float(g) for g in games],
+            missing_stats=[not totals for totals in season_totals],
+            total_games=sum(games),
+        )
 
+    @property
+    def missing_stats_count(self) -> int:
+        return sum(self.missing_stats)
 
-def _season_totals_stat_map(player: dict[str, Any], season_id: int) -> dict[int, float]:
-    for row in player.get("stats", []):
-        if _to_int(row.get("statSourceId"), -1) != 0:
-            continue
-        if _to_int(row.get("statSplitTypeId"), -1) != 0:
-            continue
-        if _to_int(row.get("seasonId"), -1) != season_id:
-            continue
-        if _to_int(row.get("scoringPeriodId"), -1) != 0:
-            continue
-        raw = row.get("stats", {})
-        out: dict[int, float] = {}
-        for k, v in raw.items():
-            out[_to_int(k, -1)] = _to_float(v)
-        return out
-    return {}
+
+def _roster_analysis(
+    team: RosterAnalysis | Team | dict[str, Any],
+    season_id: int,
+    pro_team_games: dict[int, int],
+    starter_slot_counts: dict[int, int],
+    stats_index: PlayerStatIndex | None = None,
+) -> RosterAnalysis:
+    if isinstance(team, RosterAnalysis):
+        return team
+    return RosterAnalysis.build(_as_team(team, stats_index), season_id, pro_team_games, starter_slot_counts)
 
 
-def _season_averages_stat_map(player: dict[str, Any], season_id: int) -> dict[int, float]:
-    stat_map = _season_totals_stat_map(player, season_id)
+def _season_averages_stat_map(player: Player, season_id: int) -> dict[int, float]:
+    stat_map = player.stats.season_totals(season_id)
     gp = stat_map.get(42, 0.0)
     if gp <= 0:
         return {}
     return {stat_id: value / gp for stat_id, value in stat_map.items()}
 
 
-def _projected_category_totals_from_starters(
-    team: dict[str, Any],
-    season_id: int,
-    pro_team_games: dict[int, int],
-    starter_slot_counts: dict[int, int],
-) -> dict[str, float]:
-    selected = _projected_starter_entries(team, pro_team_games, starter_slot_counts)
+def _projected_totals_from_vectors(vectors: list[StatVector], games_list: list[float]) -> dict[str, float]:
     totals = {cat: 0.0 for cat in CATEGORY_ORDER}
     fgm = 0.0
     fga = 0.0
     ftm = 0.0
     fta = 0.0
 
-    for entry in selected:
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        stat_map = _season_totals_stat_map(player, season_id)
+    for stat_map, games in zip(vectors, games_list):
         if not stat_map:
             continue
         gp = stat_map.get(42, 0.0)
         if gp <= 0:
             continue
-        games = float(_entry_projected_games(entry, pro_team_games))
         if games <= 0:
             continue
 
-        def per_game(stat_id: int) -> float:
-            return stat_map.get(stat_id, 0.0) / gp
-
-        totals["3PM"] += per_game(STAT_ID_MAP["3PM"]) * games
-        totals["REB"] += per_game(STAT_ID_MAP["REB"]) * games
-        totals["AST"] += per_game(STAT_ID_MAP["AST"]) * games
-        totals["STL"] += per_game(STAT_ID_MAP["STL"]) * games
-        totals["BLK"] += per_game(STAT_ID_MAP["BLK"]) * games
-        totals["TO"] += per_game(STAT_ID_MAP["TO"]) * games
-        totals["PTS"] += per_game(STAT_ID_MAP["PTS"]) * games
-        fgm += per_game(FGM_STAT_ID) * games
-        fga += per_game(FGA_STAT_ID) * games
-        ftm += per_game(FTM_STAT_ID) * games
-        fta += per_game(FTA_STAT_ID) * games
+        for cat in ("3PM", "REB", "AST", "STL", "BLK", "TO", "PTS"):
+            totals[cat] += stat_map.get(STAT_ID_MAP[cat], 0.0) / gp * games
+        fgm += stat_map.get(FGM_STAT_ID, 0.0) / gp * games
+        fga += stat_map.get(FGA_STAT_ID, 0.0) / gp * games
+        ftm += stat_map.get(FTM_STAT_ID, 0.0) / gp * games
+        fta += stat_map.get(FTA_STAT_ID, 0.0) / gp * games
 
     totals["FG%"] = (fgm / fga) if fga > 0 else 0.0
     totals["FT%"] = (ftm / fta) if fta > 0 else 0.0
@@ -157,6 +146,26 @@ def _projected_category_totals_from_starters(
     return totals
 
 
+def _projected_totals(analyses: list[RosterAnalysis]) -> list[dict[str, float]]:
+    inputs = [(analysis.season_totals, analysis.games) for analysis in analyses]
+    if analytics_numpy.available():
+        return analytics_numpy.projected_team_totals(inputs)
+    return [_projected_totals_from_vectors(vectors, games) for vectors, games in inputs]
+
+
+def _projected_team_totals(
+    teams: list[Team | dict[str, Any]],
+    season_id: int,
+    pro_team_games: dict[int, int],
+    starter_slot_counts: dict[int, int],
+    stats_index: PlayerStatIndex | None = None,
+) -> list[dict[str, float]]:
+    stats_index = stats_index or PlayerStatIndex()
+    return _projected_totals(
+        [_roster_analysis(team, season_id, pro_team_games, starter_slot_counts, stats_index) for team in teams]
+    )
+
+
 def _category_stats_from_totals(you_totals: dict[str, float], opp_totals: dict[str, float]) -> list[CategoryStat]:
     out: list[CategoryStat] = []
     for cat in CATEGORY_ORDER:
@@ -174,92 +183,72 @@ def _category_stats_from_totals(you_totals: dict[str, float], opp_totals: dict[s
     return out
 
 
-def _entry_name(entry: dict[str, Any]) -> str:
-    player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-    return str(player.get("fullName", "Unknown"))
-
+def _zero_contrib() -> dict[str, float]:
+    return {"PTS": 0.0, "3PM": 0.0, "REB": 0.0, "AST": 0.0, "STL": 0.0, "BLK": 0.0, "TO": 0.0}
 
-def _entry_player_id(entry: dict[str, Any]) -> int:
-    player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-    return _to_int(player.get("id"), 0)
 
-
-def _entry_injury(entry: dict[str, Any]) -> str:
-    player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-    return str(player.get("injuryStatus", "")).upper()
-
-
-def _entry_projected_contrib(
-    entry: dict[str, Any], season_id: int, pro_team_games: dict[int, int], *, treat_out_as_zero: bool
-) -> dict[str, float]:
-    if treat_out_as_zero and _entry_injury(entry) == "OUT":
-        return {"PTS": 0.0, "3PM": 0.0, "REB": 0.0, "AST": 0.0, "STL": 0.0, "BLK": 0.0, "TO": 0.0}
-
-    player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-    stat_map = _season_totals_stat_map(player, season_id)
+def _contrib_from_vector(stat_map: StatVector, games: float) -> dict[str, float]:
     gp = stat_map.get(42, 0.0)
-    games = float(_entry_projected_games(entry, pro_team_games))
     if not stat_map or gp <= 0 or games <= 0:
-        return {"PTS": 0.0, "3PM": 0.0, "REB": 0.0, "AST": 0.0, "STL": 0.0, "BLK": 0.0, "TO": 0.0}
+        return _zero_contrib()
+    return {cat: stat_map.get(STAT_ID_MAP[cat], 0.0) / gp * games for cat in analytics_numpy.COUNTING_CATEGORIES}
 
-    def per_game(stat_id: int) -> float:
-        return stat_map.get(stat_id, 0.0) / gp
 
-    return {
-        "PTS": per_game(STAT_ID_MAP["PTS"]) * games,
-        "3PM": per_game(STAT_ID_MAP["3PM"]) * games,
-        "REB": per_game(STAT_ID_MAP["REB"]) * games,
-        "AST": per_game(STAT_ID_MAP["AST"]) * games,
-        "STL": per_game(STAT_ID_MAP["STL"]) * games,
-        "BLK": per_game(STAT_ID_MAP["BLK"]) * games,
-        "TO": per_game(STAT_ID_MAP["TO"]) * games,
-    }
+def _entries_projected_contribs(
+    entries: list[RosterEntry], season_id: int, pro_team_games: dict[int, int], *, treat_out_as_zero: bool
+) -> list[dict[str, float]]:
+    vectors: list[StatVector] = []
+    games: list[float] = []
+    for entry in entries:
+        if treat_out_as_zero and entry.player.out:
+            vectors.append(StatVector())
+            games.append(0.0)
+            continue
+        vectors.append(entry.player.stats.season_totals(season_id))
+        games.append(float(entry.player.games(pro_team_games)))
+    if analytics_numpy.available():
+        return analytics_numpy.projected_contribs(vectors, games)
+    return [_contrib_from_vector(vector, g) for vector, g in zip(vectors, games)]
 
 
 def _lineup_swap_actions(
-    team: dict[str, Any],
+    team: Team | dict[str, Any],
     season_id: int,
     pro_team_games: dict[int, int],
     starter_slot_counts: dict[int, int],
     categories: list[CategoryStat],
     at_risk: list[CategorySignal],
+    stats_index: PlayerStatIndex | None = None,
 ) -> list[LineupAction]:
     starter_slots = set(starter_slot_counts.keys())
     ir_slots = {13, 14, 15, 16, 17}
-    entries = _roster_entries(team)
+    entries = _as_team(team, stats_index).entries
 
-    starters = [e for e in entries if _to_int(e.get("lineupSlotId", -1), -1) in starter_slots]
-    bench = [
-        e
-        for e in entries
-        if _to_int(e.get("lineupSlotId", -1), -1) not in starter_slots
-        and _to_int(e.get("lineupSlotId", -1), -1) not in ir_slots
-        and _entry_injury(e) != "OUT"
-    ]
+    starters = [e for e in entries if e.slot in starter_slots]
+    bench = [e for e in entries if e.slot not in starter_slots and e.slot not in ir_slots and not e.player.out]
 
     at_risk_keys = {x.key for x in at_risk}
     to_margin = next((c.margin for c in categories if c.key == "TO"), 0.0)
     suggestions: list[tuple[int, float, LineupAction]] = []
     relaxed: list[tuple[int, float, LineupAction]] = []
 
-    for st in starters:
-        st_games = float(_entry_projected_games(st, pro_team_games))
-        if _entry_injury(st) == "OUT":
+    starter_contribs = _entries_projected_contribs(starters, season_id, pro_team_games, treat_out_as_zero=True)
+    bench_contribs = _entries_projected_contribs(bench, season_id, pro_team_games, treat_out_as_zero=False)
+
+    for st, st_contrib in zip(starters, starter_contribs):
+        st_games = float(st.player.games(pro_team_games))
+        if st.player.out:
             st_games = 0.0
-        st_contrib = _entry_projected_contrib(st, season_id, pro_team_games, treat_out_as_zero=True)
 
-        for bn in bench:
-            if _to_int(((bn.get("playerPoolEntry") or {}).get("player") or {}).get("id"), -1) == _to_int(
-                ((st.get("playerPoolEntry") or {}).get("player") or {}).get("id"), -1
-            ):
+        for bn, bn_contrib in zip(bench, bench_contribs):
+            if bn.player.id == st.player.id:
                 continue
 
-            bn_games = float(_entry_projected_games(bn, pro_team_games))
+            bn_games = float(bn.player.games(pro_team_games))
             games_delta = bn_games - st_games
             if games_delta < 2.0:
                 continue
 
-            bn_contrib = _entry_projected_contrib(bn, season_id, pro_team_games, treat_out_as_zero=False)
             delta = {k: bn_contrib[k] - st_contrib[k] for k in st_contrib.keys()}
 
             improved_at_risk = 0
@@ -278,10 +267,10 @@ def _lineup_swap_actions(
 
             action = LineupAction(
                 type="swap",
-                out_player_id=_entry_player_id(st),
-                out_player_name=_entry_name(st),
-                in_player_id=_entry_player_id(bn),
-                in_player_name=_entry_name(bn),
+                out_player_id=st.player.id,
+                out_player_name=st.player.name,
+                in_player_id=bn.player.id,
+                in_player_name=bn.player.name,
                 games_delta=round(games_delta, 1),
                 category_deltas={k: round(v, 2) for k, v in delta.items()},
                 score=net_score,
@@ -337,26 +326,11 @@ def _outlook(favored: list[CategorySignal], at_risk: list[CategorySignal], games
     return {"label": label, "reason": reason}
 
 
-def _infer_season_id(league_payload: dict[str, Any], you_team: dict[str, Any]) -> int:
-    season_id = _to_int((league_payload.get("status") or {}).get("seasonId"), 0)
+def _infer_season_id(league: League, you_team: Team) -> int:
+    season_id = _to_int((league.payload.get("status") or {}).get("seasonId"), 0)
     if season_id <= 0:
-        season_id = _to_int((league_payload.get("seasonId")), 0)
+        season_id = _to_int((league.payload.get("seasonId")), 0)
     if season_id > 0:
         return season_id
-    max_season = 0
-    for entry in _roster_entries(you_team):
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        for row in player.get("stats", []):
-            max_season = max(max_season, _to_int(row.get("seasonId"), 0))
-    return max_season
-
-
-def _count_missing_season_stats(
-    team: dict[str, Any], season_id: int, pro_team_games: dict[int, int], starter_slot_counts: dict[int, int]
-) -> int:
-    missing = 0
-    for entry in _projected_starter_entries(team, pro_team_games, starter_slot_counts):
-        player = (entry.get("playerPoolEntry") or {}).get("player") or {}
-        if not _season_totals_stat_map(player, season_id):
-            missing += 1
-    return missing
+    return max((entry.player.stats.max_season_id for entry in you_team.entries), default=0)
+
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from espn_fbb.analytics_base import _current_matchup_period_id, _to_int
+from espn_fbb.analytics_base import _current_matchup_period_id, _to_float, _to_int
 
 
 def _matchup_scoring_period_ids(league_payload: dict[str, Any], matchup_period_id: int) -> list[int]:
@@ -78,85 +79,276 @@ def _matchup_scoring_period_ids(league_payload: dict[str, Any], matchup_period_i
     return []
 
 
-def _games_by_pro_team(
-    schedule_payload: dict[str, Any], matchup_period_id: int, scoring_period_ids: list[int] | None = None
-) -> dict[int, int]:
+_SHAPE_NONE = 0
+_SHAPE_DICT = 1
+_SHAPE_SCALAR_LIST = 2
+_SHAPE_OTHER_LIST = 3
+
+
+def _games_profile(value: Any) -> tuple[int, dict[int, int]]:
+    # Game count for a schedule value as `const + tagged[period_id]`, so it can be evaluated for any period later.
+    if value is None:
+        return 0, {}
+    if isinstance(value, (int, float, str)):
+        return _to_int(value, 0), {}
+    if isinstance(value, list):
+        if not value:
+            return 0, {}
+        if all(isinstance(item, dict) for item in value):
+            const = 0
+            tagged: dict[int, int] = {}
+            for item in value:
+                item_period = item.get("matchupPeriodId", item.get("scoringPeriodId"))
+                if item_period is None:
+                    const += 1
+                    continue
+                try:
+                    tag = int(item_period)
+                except (TypeError, ValueError):
+                    const += 1
+                    continue
+                tagged[tag] = tagged.get(tag, 0) + 1
+            return const, tagged
+        return len(value), {}
+    if isinstance(value, dict):
+        if "value" in value:
+            return _games_profile(value.get("value"))
+        if "gameCount" in value:
+            return _to_int(value.get("gameCount"), 0), {}
+        const = 0
+        tagged = {}
+        for nested in value.values():
+            nested_const, nested_tagged = _games_profile(nested)
+            const += nested_const
+            for tag, count in nested_tagged.items():
+                tagged[tag] = tagged.get(tag, 0) + count
+        return const, tagged
+    return 0, {}
+
+
+def _games_from_value(value: Any, period_id: int) -> int:
+    const, tagged = _games_profile(value)
+    return const + tagged.get(period_id, 0)
+
+
+def _period_keyed(mapping: dict[Any, Any]) -> dict[int, Any]:
+    # Mirrors `mapping.get(str(pid), mapping.get(pid))`: exact string keys win over int keys.
+    out: dict[int, Any] = {}
+    for key, value in mapping.items():
+        if not isinstance(key, str) and isinstance(key, int):
+            out[key] = value
+    for key, value in mapping.items():
+        if isinstance(key, str):
+            pid = _to_int(key, -1)
+            if str(pid) == key:
+                out[pid] = value
+    return out
+
+
+def _schedule_rows(schedule_payload: dict[str, Any]) -> list[Any]:
     sources = schedule_payload.get("proTeams")
     if not isinstance(sources, list):
         sources = (schedule_payload.get("settings") or {}).get("proTeams", [])
+    return sources if isinstance(sources, list) else []
 
-    def _games_from_value(value: Any, period_id: int) -> int:
-        if value is None:
-            return 0
-        if isinstance(value, (int, float, str)):
-            return _to_int(value, 0)
-        if isinstance(value, list):
-            if not value:
-                return 0
-            if all(isinstance(item, dict) for item in value):
-                count = 0
-                for item in value:
-                    item_period = item.get("matchupPeriodId", item.get("scoringPeriodId"))
-                    if item_period is None or _to_int(item_period, period_id) == period_id:
-                        count += 1
-                return count
-            return len(value)
-        if isinstance(value, dict):
-            if "value" in value:
-                return _games_from_value(value.get("value"), period_id)
-            if "gameCount" in value:
-                return _to_int(value.get("gameCount"), 0)
-            return sum(_games_from_value(nested, period_id) for nested in value.values())
-        return 0
 
-    out: dict[int, int] = {}
-    for row in sources:
-        pro_id = row.get("id")
-        if pro_id is None:
-            continue
+def _first_game_date(value: Any, et: ZoneInfo) -> str | None:
+    if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+        return None
+    ts = value[0].get("date")
+    if not ts:
+        return None
+    millis = _to_float(ts, -1.0)
+    if millis < 0:
+        return None
+    return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).astimezone(et).date().isoformat()
+
+
+@dataclass
+class ScheduleIndex:
+    """Pro-team schedule compiled once into a dense pro_team x scoring_period game-count matrix."""
+
+    VERSION = 1
 
-        games = 0
-        matchup_map = row.get("proGamesByMatchupPeriod", {})
-        if isinstance(matchup_map, dict):
-            if str(matchup_period_id) in matchup_map:
-                games = _games_from_value(matchup_map[str(matchup_period_id)], matchup_period_id)
-            elif matchup_period_id in matchup_map:
-                games = _games_from_value(matchup_map[matchup_period_id], matchup_period_id)
+    pro_team_ids: list[int] = field(default_factory=list)
+    period_games: list[list[int]] = field(default_factory=list)
+    period_dates: list[str | None] = field(default_factory=list)
+    scoring_shapes: list[int] = field(default_factory=list)
+    scoring_periods: list[set[int]] = field(default_factory=list)
+    fallback_const: list[int] = field(default_factory=list)
+    fallback_tagged: list[dict[int, int]] = field(default_factory=list)
+    matchup_games: list[dict[int, int]] = field(default_factory=list)
+    schedule_games: list[dict[int, int]] = field(default_factory=list)
 
-        if not games:
+    @classmethod
+    def from_payload(cls, schedule_payload: dict[str, Any]) -> ScheduleIndex:
+        index = cls()
+        et = ZoneInfo("America/New_York")
+        dates: dict[int, str] = {}
+        for row in _schedule_rows(schedule_payload):
+            if not isinstance(row, dict):
+                continue
             scoring_map = row.get("proGamesByScoringPeriod", {})
             if isinstance(scoring_map, dict):
-                period_ids = scoring_period_ids or []
-                if period_ids:
-                    games = sum(
-                        _games_from_value(
-                            scoring_map.get(str(period_id), scoring_map.get(period_id)),
-                            period_id,
-                        )
-                        for period_id in period_ids
-                    )
-                elif str(matchup_period_id) in scoring_map or matchup_period_id in scoring_map:
-                    games = _games_from_value(
-                        scoring_map.get(str(matchup_period_id), scoring_map.get(matchup_period_id)),
-                        matchup_period_id,
-                    )
-                else:
-                    games = sum(_games_from_value(v, matchup_period_id) for v in scoring_map.values())
+                for pid, value in _period_keyed(scoring_map).items():
+                    if pid > 0 and pid not in dates:
+                        first_date = _first_game_date(value, et)
+                        if first_date:
+                            dates[pid] = first_date
+
+            pro_id = row.get("id")
+            if pro_id is None:
+                continue
+
+            matchup_games: dict[int, int] = {}
+            matchup_map = row.get("proGamesByMatchupPeriod", {})
+            if isinstance(matchup_map, dict):
+                for mp, value in _period_keyed(matchup_map).items():
+                    matchup_games[mp] = _games_from_value(value, mp)
+
+            dense: list[int] = []
+            present: set[int] = set()
+            shape = _SHAPE_NONE
+            fallback: tuple[int, dict[int, int]] = (0, {})
+            if isinstance(scoring_map, dict):
+                shape = _SHAPE_DICT
+                keyed = {pid: value for pid, value in _period_keyed(scoring_map).items() if pid >= 0}
+                present = set(keyed)
+                dense = [0] * (max(keyed) + 1 if keyed else 0)
+                for pid, value in keyed.items():
+                    dense[pid] = _games_from_value(value, pid)
+                const = 0
+                tagged: dict[int, int] = {}
+                for value in scoring_map.values():
+                    value_const, value_tagged = _games_profile(value)
+                    const += value_const
+                    for tag, count in value_tagged.items():
+                        tagged[tag] = tagged.get(tag, 0) + count
+                fallback = (const, tagged)
             elif isinstance(scoring_map, list):
-                period_ids = scoring_period_ids or []
-                if period_ids and all(isinstance(item, (int, float, str, type(None))) for item in scoring_map):
-                    for period_id in period_ids:
-                        if 0 <= period_id < len(scoring_map):
-                            games += _to_int(scoring_map[period_id], 0)
+                if all(isinstance(item, (int, float, str, type(None))) for item in scoring_map):
+                    shape = _SHAPE_SCALAR_LIST
+                    dense = [_to_int(item, 0) for item in scoring_map]
                 else:
-                    games = _games_from_value(scoring_map, matchup_period_id)
-        if not games:
+                    shape = _SHAPE_OTHER_LIST
+                fallback = _games_profile(scoring_map)
+
+            schedule_games: dict[int, int] = {}
             sched = row.get("schedule", [])
             if isinstance(sched, list):
-                games = sum(1 for g in sched if _to_int(g.get("matchupPeriodId", -1), -1) == matchup_period_id)
+                for game in sched:
+                    mp = _to_int(game.get("matchupPeriodId", -1), -1)
+                    schedule_games[mp] = schedule_games.get(mp, 0) + 1
 
-        out[_to_int(pro_id, -1)] = games
-    return out
+            index.pro_team_ids.append(_to_int(pro_id, -1))
+            index.period_games.append(dense)
+            index.scoring_shapes.append(shape)
+            index.scoring_periods.append(present)
+            index.fallback_const.append(fallback[0])
+            index.fallback_tagged.append(fallback[1])
+            index.matchup_games.append(matchup_games)
+            index.schedule_games.append(schedule_games)
+
+        if dates:
+            index.period_dates = [None] * (max(dates) + 1)
+            for pid, iso in dates.items():
+                index.period_dates[pid] = iso
+        return index
+
+    def _period_sum(self, row: int, scoring_period_ids: list[int]) -> int:
+        dense = self.period_games[row]
+        size = len(dense)
+        return sum(dense[pid] for pid in scoring_period_ids if 0 <= pid < size)
+
+    def games_by_pro_team(self, matchup_period_id: int, scoring_period_ids: list[int] | None = None) -> dict[int, int]:
+        period_ids = scoring_period_ids or []
+        out: dict[int, int] = {}
+        for row, pro_id in enumerate(self.pro_team_ids):
+            games = self.matchup_games[row].get(matchup_period_id, 0)
+            if not games:
+                shape = self.scoring_shapes[row]
+                fallback = self.fallback_const[row] + self.fallback_tagged[row].get(matchup_period_id, 0)
+                if shape == _SHAPE_DICT:
+                    if period_ids:
+                        games = self._period_sum(row, period_ids)
+                    elif matchup_period_id in self.scoring_periods[row]:
+                        games = self.period_games[row][matchup_period_id]
+                    else:
+                        games = fallback
+                elif shape == _SHAPE_SCALAR_LIST:
+                    games = self._period_sum(row, period_ids) if period_ids else fallback
+                elif shape == _SHAPE_OTHER_LIST:
+                    games = fallback
+            if not games:
+                games = self.schedule_games[row].get(matchup_period_id, 0)
+            out[pro_id] = games
+        return out
+
+    def daily_games_by_pro_team(
+        self, matchup_period_id: int, scoring_period_ids: list[int]
+    ) -> dict[int, dict[int, int]] | None:
+        # Day-level counts only exist for dense scoring-period rows; when they don't add back up to the window
+        # totals (matchup-level or schedule fallbacks), there is no trustworthy per-day breakdown.
+        if not scoring_period_ids:
+            return None
+        daily: dict[int, dict[int, int]] = {pid: {} for pid in scoring_period_ids}
+        window = self.games_by_pro_team(matchup_period_id, scoring_period_ids)
+        for row, pro_id in enumerate(self.pro_team_ids):
+            dense = self.period_games[row] if self.scoring_shapes[row] in (_SHAPE_DICT, _SHAPE_SCALAR_LIST) else []
+            total = 0
+            for pid in scoring_period_ids:
+                games = dense[pid] if 0 <= pid < len(dense) else 0
+                if games:
+                    daily[pid][pro_id] = games
+                    total += games
+            if total != window.get(pro_id, 0):
+                return None
+        return daily
+
+    def scoring_period_dates(self) -> dict[int, date]:
+        return {pid: date.fromisoformat(iso) for pid, iso in enumerate(self.period_dates) if iso}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": self.VERSION,
+            "pro_team_ids": self.pro_team_ids,
+            "period_games": self.period_games,
+            "period_dates": self.period_dates,
+            "scoring_shapes": self.scoring_shapes,
+            "scoring_periods": [sorted(x) for x in self.scoring_periods],
+            "fallback_const": self.fallback_const,
+            "fallback_tagged": [sorted(x.items()) for x in self.fallback_tagged],
+            "matchup_games": [sorted(x.items()) for x in self.matchup_games],
+            "schedule_games": [sorted(x.items()) for x in self.schedule_games],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ScheduleIndex | None:
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return None
+        return cls(
+            pro_team_ids=list(data["pro_team_ids"]),
+            period_games=[list(row) for row in data["period_games"]],
+            period_dates=list(data["period_dates"]),
+            scoring_shapes=list(data["scoring_shapes"]),
+            scoring_periods=[set(x) for x in data["scoring_periods"]],
+            fallback_const=list(data["fallback_const"]),
+            fallback_tagged=[{k: v for k, v in pairs} for pairs in data["fallback_tagged"]],
+            matchup_games=[{k: v for k, v in pairs} for pairs in data["matchup_games"]],
+            schedule_games=[{k: v for k, v in pairs} for pairs in data["schedule_games"]],
+        )
+
+
+def _as_schedule_index(schedule: dict[str, Any] | ScheduleIndex) -> ScheduleIndex:
+    if isinstance(schedule, ScheduleIndex):
+        return schedule
+    return ScheduleIndex.from_payload(schedule)
+
+
+def _games_by_pro_team(
+    schedule_payload: dict[str, Any] | ScheduleIndex, matchup_period_id: int, scoring_period_ids: list[int] | None = None
+) -> dict[int, int]:
+    return _as_schedule_index(schedule_payload).games_by_pro_team(matchup_period_id, scoring_period_ids)
 
 
 def _starter_slot_counts(league_payload: dict[str, Any]) -> dict[int, int]:
@@ -175,31 +367,11 @@ def _starter_slot_counts(league_payload: dict[str, Any]) -> dict[int, int]:
     return out
 
 
-def _scoring_period_dates(schedule_payload: dict[str, Any]) -> dict[int, date]:
-    pro_rows = schedule_payload.get("proTeams")
-    if not isinstance(pro_rows, list):
-        pro_rows = (schedule_payload.get("settings") or {}).get("proTeams", [])
-    if not isinstance(pro_rows, list):
-        return {}
-
-    et = ZoneInfo("America/New_York")
-    out: dict[int, date] = {}
-    for row in pro_rows:
-        mapping = row.get("proGamesByScoringPeriod", {})
-        if not isinstance(mapping, dict):
-            continue
-        for period_id, value in mapping.items():
-            pid = _to_int(period_id, -1)
-            if pid <= 0 or pid in out:
-                continue
-            if isinstance(value, list) and value:
-                ts = value[0].get("date")
-                if ts:
-                    out[pid] = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).astimezone(et).date()
-    return out
+def _scoring_period_dates(schedule_payload: dict[str, Any] | ScheduleIndex) -> dict[int, date]:
+    return _as_schedule_index(schedule_payload).scoring_period_dates()
 
 
-def _calendar_week_period_ids(schedule_payload: dict[str, Any], week: str, base_date: date | None = None) -> list[int]:
+def _calendar_week_period_ids(schedule_payload: dict[str, Any] | ScheduleIndex, week: str, base_date: date | None = None) -> list[int]:
     period_dates = _scoring_period_dates(schedule_payload)
     if not period_dates:
         return []
@@ -212,7 +384,7 @@ def _calendar_week_period_ids(schedule_payload: dict[str, Any], week: str, base_
 
 
 def _resolve_matchup_window(
-    league_payload: dict[str, Any], schedule_payload: dict[str, Any], week: str
+    league_payload: dict[str, Any], schedule_payload: dict[str, Any] | ScheduleIndex, week: str
 ) -> tuple[int, list[int], int]:
     current_matchup = _current_matchup_period_id(league_payload)
     schedule_settings = (league_payload.get("settings") or {}).get("scheduleSettings", {})
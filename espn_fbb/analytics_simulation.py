@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from espn_fbb import analytics_numpy
+from espn_fbb.analytics_base import (
+    CATEGORY_ORDER,
+    FGA_STAT_ID,
+    FGM_STAT_ID,
+    FTA_STAT_ID,
+    FTM_STAT_ID,
+    STAT_ID_MAP,
+    PlayerStatIndex,
+    _to_float,
+)
+from espn_fbb.analytics_projection import RosterAnalysis, _roster_analysis
+from espn_fbb.league_model import Team
+from espn_fbb.schema import CategoryWinProbability, WinProbability
+DEFAULT_SIMULATIONS = 10_000
+MIN_GAME_LOGS = 5
+
+# Drawn directly as per-game counts; FGM/FTM are then drawn as binomial makes out of the simulated attempts.
+_COUNT_STATS = (
+    ("PTS", STAT_ID_MAP["PTS"]),
+    ("3PM", STAT_ID_MAP["3PM"]),
+    ("REB", STAT_ID_MAP["REB"]),
+    ("AST", STAT_ID_MAP["AST"]),
+    ("STL", STAT_ID_MAP["STL"]),
+    ("BLK", STAT_ID_MAP["BLK"]),
+    ("TO", STAT_ID_MAP["TO"]),
+    ("FGA", FGA_STAT_ID),
+    ("FTA", FTA_STAT_ID),
+)
+_OVERDISPERSION_EPS = 1e-9
+
+
+class SimulationUnavailableError(RuntimeError):
+    pass
+
+
+@dataclass
+class _SimPlayer:
+    games: float
+    mean: dict[str, float]
+    variance: dict[str, float]
+    fg_pct: float
+    ft_pct: float
+
+
+@dataclass
+class _SimTeam:
+    players: list[_SimPlayer] = field(default_factory=list)
+
+
+def _sim_team(analysis: RosterAnalysis) -> _SimTeam:
+    out = _SimTeam()
+    for entry, totals, games in zip(analysis.starters, analysis.season_totals, analysis.games):
+        stats = entry.player.stats
+        gp = totals.get(42, 0.0)
+        if not totals or gp <= 0 or games <= 0:
+            continue
+
+        mean = {key: max(totals.get(sid, 0.0) / gp, 0.0) for key, sid in _COUNT_STATS}
+        # Per-game variance from single-period game logs when there are enough of them, else Poisson (var = mean).
+        logs = [vector for pid, vector in stats.by_period.items() if pid > 0 and vector]
+        variance = dict(mean)
+        if len(logs) >= MIN_GAME_LOGS:
+            for key, sid in _COUNT_STATS:
+                values = [log.get(sid, 0.0) for log in logs]
+                avg = sum(values) / len(values)
+                variance[key] = sum((v - avg) ** 2 for v in values) / (len(values) - 1)
+
+        fga = totals.get(FGA_STAT_ID, 0.0)
+        fta = totals.get(FTA_STAT_ID, 0.0)
+        out.players.append(
+            _SimPlayer(
+                games=games,
+                mean=mean,
+                variance=variance,
+                fg_pct=min(max(totals.get(FGM_STAT_ID, 0.0) / fga, 0.0), 1.0) if fga > 0 else 0.0,
+                ft_pct=min(max(totals.get(FTM_STAT_ID, 0.0) / fta, 0.0), 1.0) if fta > 0 else 0.0,
+            )
+        )
+    return out
+
+
+def _draw_counts(rng: Any, mean: Any, variance: Any, games: Any, simulations: int) -> Any:
+    """Window totals for k games per player: Poisson(k*mean), or negative binomial when over-dispersed."""
+    np = analytics_numpy.np
+    over = (variance > mean + _OVERDISPERSION_EPS) & (mean > 0)
+    draws = np.empty((simulations, mean.size), dtype=np.float64)
+    poisson_cols = ~over
+    if poisson_cols.any():
+        draws[:, poisson_cols] = rng.poisson((mean * games)[poisson_cols], size=(simulations, int(poisson_cols.sum())))
+    if over.any():
+        # NB per game with r = mean^2 / (var - mean); a sum of k iid NB(r, p) is NB(k*r, p).
+        m, v = mean[over], variance[over]
+        r = m * m / (v - m)
+        draws[:, over] = rng.negative_binomial(r * games[over], r / (r + m), size=(simulations, int(over.sum())))
+    return draws
+
+
+def simulate_matchup(
+    you_team: RosterAnalysis | Team | dict[str, Any],
+    opp_team: RosterAnalysis | Team | dict[str, Any],
+    *,
+    season_id: int,
+    pro_team_games: dict[int, int],
+    starter_slot_counts: dict[int, int],
+    you_current: dict[str, float],
+    opp_current: dict[str, float],
+    stats_index: PlayerStatIndex | None = None,
+    simulations: int = DEFAULT_SIMULATIONS,
+    seed: int = 0,
+) -> WinProbability:
+    # NumPy is imported lazily, through the same switch the projection code uses.
+    if not analytics_numpy.available():
+        raise SimulationUnavailableError("Win-probability simulation requires NumPy (install the 'fast' extra)")
+    if simulations < 1:
+        raise ValueError("simulations must be >= 1")
+    stats_index = stats_index or PlayerStatIndex()
+    you = _sim_team(_roster_analysis(you_team, season_id, pro_team_games, starter_slot_counts, stats_index))
+    opp = _sim_team(_roster_analysis(opp_team, season_id, pro_team_games, starter_slot_counts, stats_index))
+    return _simulate(you, opp, you_current, opp_current, simulations, seed)
+
+
+def _simulate(
+    you: _SimTeam,
+    opp: _SimTeam,
+    you_current: dict[str, float],
+    opp_current: dict[str, float],
+    simulations: int,
+    seed: int,
+) -> WinProbability:
+    np = analytics_numpy.np
+    rng = np.random.default_rng(seed)
+    players = you.players + opp.players
+    split = len(you.players)
+    games = np.array([p.games for p in players], dtype=np.float64)
+
+    # Both rosters are drawn together: every array below is (simulations, players).
+    drawn: dict[str, Any] = {}
+    for key, _ in _COUNT_STATS:
+        mean = np.array([p.mean[key] for p in players], dtype=np.float64)
+        variance = np.array([p.variance[key] for p in players], dtype=np.float64)
+        drawn[key] = _draw_counts(rng, mean, variance, games, simulations)
+    drawn["FGM"] = rng.binomial(drawn["FGA"].astype(np.int64), np.array([p.fg_pct for p in players])).astype(np.float64)
+    drawn["FTM"] = rng.binomial(drawn["FTA"].astype(np.int64), np.array([p.ft_pct for p in players])).astype(np.float64)
+
+    def _team_totals(cols: slice, current: dict[str, float]) -> dict[str, Any]:
+        totals = {key: values[:, cols].sum(axis=1) + _to_float(current.get(key)) for key, values in drawn.items()}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            totals["FG%"] = np.where(totals["FGA"] > 0, totals["FGM"] / totals["FGA"], 0.0)
+            totals["FT%"] = np.where(totals["FTA"] > 0, totals["FTM"] / totals["FTA"], 0.0)
+        return totals
+
+    you_totals = _team_totals(slice(0, split), you_current)
+    opp_totals = _team_totals(slice(split, None), opp_current)
+
+    won = np.zeros(simulations, dtype=np.int64)
+    lost = np.zeros(simulations, dtype=np.int64)
+    categories: dict[str, CategoryWinProbability] = {}
+    for cat in CATEGORY_ORDER:
+        margin = you_totals[cat] - opp_totals[cat]
+        if cat == "TO":
+            margin = -margin
+        cat_won = margin > 0
+        cat_lost = margin < 0
+        won += cat_won
+        lost += cat_lost
+        win = float(cat_won.mean())
+        loss = float(cat_lost.mean())
+        categories[cat] = CategoryWinProbability(win=round(win, 4), tie=round(1.0 - win - loss, 4), loss=round(loss, 4))
+
+    win = float((won > lost).mean())
+    loss = float((won < lost).mean())
+    return WinProbability(
+        simulations=simulations,
+        seed=seed,
+        win=round(win, 4),
+        tie=round(1.0 - win - loss, 4),
+        loss=round(loss, 4),
+        expected_category_wins=round(float(won.mean()), 4),
+        categories=categories,
+    )
@@ -1,14 +1,153 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import struct
+import tempfile
 import time
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, Protocol
+
+from espn_fbb import timings
+from espn_fbb.config import ConfigError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from espn_fbb.snapshots import SnapshotStore
 
 
 DEFAULT_CACHE_DIR = Path("~/.cache/espn-fbb").expanduser()
+CACHE_BACKENDS = ("json", "sqlite")
+CACHE_BACKEND_ENV = "ESPN_FBB_CACHE_BACKEND"
+
+
+class CacheBackend(Protocol):
+    def lock(self, key: str) -> Any: ...
+
+    def get(self, key: str, ttl_seconds: int) -> Any | None: ...
+
+    def get_entry(self, key: str, ttl_seconds: int) -> CacheEntry | None: ...
+
+    # Returns the stored entry's size, measured as `CacheEntry.size`.
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> int: ...
+
+    def touch(self, key: str, ttl_seconds: int | None = None) -> bool: ...
+
+    def snapshot_store(self) -> SnapshotStore: ...
+
+    def purge_old_snapshots(self, retention_days: int, now_ts: float | None = None) -> None: ...
+
+
+def key_digest(key: str) -> str:
+    return sha256(key.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def flock_path(lock_path: Path) -> Iterator[None]:
+    # Advisory cross-process lock; a no-op where flock is unavailable.
+    if fcntl is None:
+        yield
+        return
+    with lock_path.open("a") as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+ENTRY_SUFFIX = ".cache"
+LEGACY_SUFFIX = ".json"
+ENTRY_MAGIC = b"EFBC"
+ENTRY_VERSION = 1
+CODEC_ZLIB = 1
+COMPRESSION_LEVEL = 6
+# magic, format version, codec, created_at, ttl (NaN = none), body length
+_HEADER = struct.Struct("<4sBB2xddQ")
+HEADER_SIZE = _HEADER.size
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    created_at: float
+    value: Any
+    size: int  # bytes of serialized JSON
+
+
+@dataclass(frozen=True)
+class EntryHeader:
+    created_at: float
+    ttl_seconds: float | None
+    body_length: int
+
+
+def _pack_header(created_at: float, ttl_seconds: float | None, body_length: int) -> bytes:
+    ttl = float("nan") if ttl_seconds is None else float(ttl_seconds)
+    return _HEADER.pack(ENTRY_MAGIC, ENTRY_VERSION, CODEC_ZLIB, created_at, ttl, body_length)
+
+
+def dump_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def encode_entry(raw: bytes, created_at: float, ttl_seconds: float | None = None) -> bytes:
+    body = zlib.compress(raw, COMPRESSION_LEVEL)
+    return _pack_header(created_at, ttl_seconds, len(body)) + body
+
+
+def read_entry_header(fh: BinaryIO) -> EntryHeader | None:
+    raw = fh.read(HEADER_SIZE)
+    if len(raw) != HEADER_SIZE:
+        return None
+    magic, version, codec, created_at, ttl, body_length = _HEADER.unpack(raw)
+    if magic != ENTRY_MAGIC or version != ENTRY_VERSION or codec != CODEC_ZLIB:
+        return None
+    return EntryHeader(created_at=created_at, ttl_seconds=None if ttl != ttl else ttl, body_length=body_length)
+
+
+def read_entry_body(fh: BinaryIO, header: EntryHeader) -> bytes:
+    # Map the file instead of reading it into a bytes object; zlib inflates straight from the mapping.
+    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return zlib.decompress(view[HEADER_SIZE : HEADER_SIZE + header.body_length])
+
+
+def record_read(entry: CacheEntry | None) -> CacheEntry | None:
+    # Per-command counters for `--timings`; a no-op unless a recorder is active.
+    if entry is None:
+        timings.count("cache_misses")
+    else:
+        timings.count("cache_hits")
+        timings.count("cache_bytes_read", entry.size)
+    return entry
+
+
+def read_entry(path: Path) -> CacheEntry | None:
+    """Read a cache file in either the binary or the legacy JSON format."""
+    try:
+        if path.suffix == LEGACY_SUFFIX:
+            raw = path.read_bytes()
+            payload = json.loads(raw)
+            if not isinstance(payload, dict) or "value" not in payload:
+                return None
+            return CacheEntry(float(payload.get("created_at", 0)), payload["value"], len(raw))
+        with path.open("rb") as fh:
+            header = read_entry_header(fh)
+            if header is None:
+                return None
+            body = read_entry_body(fh, header)
+            return CacheEntry(header.created_at, json.loads(body), len(body))
+    except (OSError, ValueError, zlib.error):
+        return None
 
 
 @dataclass
@@ -19,45 +158,110 @@ class JsonCache:
         self.root.mkdir(parents=True, exist_ok=True)
 
     def _path_for_key(self, key: str) -> Path:
-        digest = sha256(key.encode("utf-8")).hexdigest()
-        return self.root / f"{digest}.json"
+        return self.root / f"{key_digest(key)}{ENTRY_SUFFIX}"
+
+    def lock(self, key: str) -> Any:
+        return flock_path(self._path_for_key(key).with_suffix(".lock"))
 
     def get(self, key: str, ttl_seconds: int) -> Any | None:
+        entry = self.get_entry(key, ttl_seconds)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str, ttl_seconds: int) -> CacheEntry | None:
+        with timings.stage("cache_read"):
+            return record_read(self._read(key, ttl_seconds))
+
+    def _read(self, key: str, ttl_seconds: int) -> CacheEntry | None:
         path = self._path_for_key(key)
-        if not path.exists():
-            return None
         now = time.time()
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                payload = json.load(fh)
-        except (OSError, json.JSONDecodeError):
+            # Entry mtimes are pinned to `created_at`, so a stale hit costs a single stat() and never opens the file.
+            if os.stat(path).st_mtime + ttl_seconds < now:
+                return None
+            with path.open("rb") as fh:
+                header = read_entry_header(fh)
+                if header is None or header.created_at + ttl_seconds < now:
+                    return None
+                body = read_entry_body(fh, header)
+            return CacheEntry(header.created_at, json.loads(body), len(body))
+        except FileNotFoundError:
+            return self._get_legacy(key, ttl_seconds, now)
+        except (OSError, ValueError, zlib.error):
             return None
-        expires_at = payload.get("created_at", 0) + ttl_seconds
-        if expires_at < now:
+
+    def _get_legacy(self, key: str, ttl_seconds: int, now: float) -> CacheEntry | None:
+        # Entries written before the binary format stay readable until they are rewritten or purged.
+        entry = read_entry(self._path_for_key(key).with_suffix(LEGACY_SUFFIX))
+        if entry is None or entry.created_at + ttl_seconds < now:
             return None
-        return payload.get("value")
+        return entry
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> int:
         path = self._path_for_key(key)
-        payload = {
-            "created_at": time.time(),
-            "value": value,
-        }
-        with path.open("w", encoding="utf-8") as fh:
-            json.dump(payload, fh)
+        created_at = time.time()
+        raw = dump_json(value)
+        data = encode_entry(raw, created_at, ttl_seconds)
+        # Write-then-rename so concurrent readers never observe a partially written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=f"{ENTRY_SUFFIX}.part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.utime(tmp_name, (created_at, created_at))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        path.with_suffix(LEGACY_SUFFIX).unlink(missing_ok=True)
+        return len(raw)
+
+    def touch(self, key: str, ttl_seconds: int | None = None) -> bool:
+        """Restart an entry's TTL clock by rewriting only its header; the body is left untouched."""
+        path = self._path_for_key(key)
+        now = time.time()
+        try:
+            with path.open("r+b") as fh:
+                header = read_entry_header(fh)
+                if header is None:
+                    return False
+                ttl = header.ttl_seconds if ttl_seconds is None else ttl_seconds
+                fh.seek(0)
+                fh.write(_pack_header(now, ttl, header.body_length))
+            os.utime(path, (now, now))
+        except OSError:
+            return False
+        return True
 
-    def snapshot_key(self, league_id: str, team_id: int, matchup_period_id: int, et_date: str) -> str:
-        return f"snapshot:{league_id}:{team_id}:{matchup_period_id}:{et_date}"
+    def snapshot_store(self) -> SnapshotStore:
+        from espn_fbb.snapshots import SNAPSHOT_DIRNAME, SnapshotStore
+
+        return SnapshotStore(self.root / SNAPSHOT_DIRNAME)
 
     def purge_old_snapshots(self, retention_days: int, now_ts: float | None = None) -> None:
         now = now_ts or time.time()
         cutoff = now - (retention_days * 24 * 60 * 60)
-        for path in self.root.glob("*.json"):
-            try:
-                with path.open("r", encoding="utf-8") as fh:
-                    payload = json.load(fh)
-            except (OSError, json.JSONDecodeError):
-                continue
-            created_at = payload.get("created_at", 0)
-            if created_at < cutoff:
-                path.unlink(missing_ok=True)
+        # scandir hands back cached stat results, so the scan never opens an entry; mtime is the write time.
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if not entry.name.endswith((ENTRY_SUFFIX, LEGACY_SUFFIX)):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+        self.snapshot_store().purge_old(retention_days, now_ts=now)
+
+
+def cache_backend_name(backend: str | None = None) -> str:
+    name = (backend or os.environ.get(CACHE_BACKEND_ENV) or "json").strip().lower()
+    if name not in CACHE_BACKENDS:
+        raise ConfigError(f"{CACHE_BACKEND_ENV} must be one of: {', '.join(CACHE_BACKENDS)}")
+    return name
+
+
+def open_cache(backend: str | None = None, root: Path | None = None) -> CacheBackend:
+    if cache_backend_name(backend) == "sqlite":
+        from espn_fbb.cache_sqlite import SqliteCache
+
+        return SqliteCache(root or DEFAULT_CACHE_DIR)
+    return JsonCache(root or DEFAULT_CACHE_DIR)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from espn_fbb import timings
+from espn_fbb.cache import CacheBackend, CacheEntry
+
+if TYPE_CHECKING:
+    from espn_fbb.snapshots import SnapshotStore
+
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class TierStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class TieredCache:
+    """Bounded in-process LRU in front of a disk `CacheBackend`.
+
+    Entries are sized by their serialized JSON bytes. Values are shared with callers, who treat payloads as read-only.
+    """
+
+    backend: CacheBackend
+    max_bytes: int = DEFAULT_MEMORY_BYTES
+    memory: TierStats = field(default_factory=TierStats, init=False)
+    disk: TierStats = field(default_factory=TierStats, init=False)
+    _entries: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    def lock(self, key: str) -> Any:
+        return self.backend.lock(key)
+
+    def get(self, key: str, ttl_seconds: int) -> Any | None:
+        entry = self.get_entry(key, ttl_seconds)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str, ttl_seconds: int) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            # TTLs vary per call, so a resident entry can still be too old for this caller.
+            if entry is not None and entry.created_at + ttl_seconds >= time.time():
+                self._entries.move_to_end(key)
+                self.memory.hits += 1
+                timings.count("memory_hits")
+                return entry
+            self.memory.misses += 1
+        timings.count("memory_misses")
+
+        entry = self.backend.get_entry(key, ttl_seconds)
+        with self._lock:
+            if entry is None:
+                self.disk.misses += 1
+                return None
+            self.disk.hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> int:
+        size = self.backend.set(key, value, ttl_seconds=ttl_seconds)
+        with self._lock:
+            self._insert(key, CacheEntry(time.time(), value, size))
+        return size
+
+    def touch(self, key: str, ttl_seconds: int | None = None) -> bool:
+        touched = self.backend.touch(key, ttl_seconds=ttl_seconds)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if touched:
+                    self._entries[key] = CacheEntry(time.time(), entry.value, entry.size)
+                else:
+                    self._bytes -= self._entries.pop(key).size
+        return touched
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.memory.evictions += 1
+
+    def snapshot_store(self) -> SnapshotStore:
+        return self.backend.snapshot_store()
+
+    def purge_old_snapshots(self, retention_days: int, now_ts: float | None = None) -> None:
+        self.backend.purge_old_snapshots(retention_days, now_ts=now_ts)
+        cutoff = (now_ts or time.time()) - (retention_days * 24 * 60 * 60)
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.created_at < cutoff]:
+                self._bytes -= self._entries.pop(key).size
+
+    def stats(self) -> dict[str, TierStats]:
+        with self._lock:
+            return {"memory": TierStats(**vars(self.memory)), "disk": TierStats(**vars(self.disk))}
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from espn_fbb import timings
+from espn_fbb.cache import (
+    DEFAULT_CACHE_DIR,
+    ENTRY_SUFFIX,
+    LEGACY_SUFFIX,
+    CacheEntry,
+    dump_json,
+    flock_path,
+    key_digest,
+    read_entry,
+    record_read,
+)
+from espn_fbb.snapshots import SNAPSHOT_DIRNAME, SnapshotStore
+
+DB_FILENAME = "cache.sqlite3"
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT_SECONDS = 30.0
+COMPRESSION_LEVEL = 6
+LEGACY_KEY_PREFIX = "legacy:"
+_LEGACY_KEY_END = "legacy;"  # first string sorting after every "legacy:..." key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    ttl REAL,
+    expires_at REAL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_created_at ON entries (created_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at) WHERE expires_at IS NOT NULL;
+"""
+
+
+def _encode(raw: bytes) -> bytes:
+    return zlib.compress(raw, COMPRESSION_LEVEL)
+
+
+@dataclass
+class SqliteCache:
+    """Cache entries in one SQLite database (WAL mode) with zlib-compressed JSON values."""
+
+    root: Path = DEFAULT_CACHE_DIR
+    migrate_json: bool = True
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.path = self.root / DB_FILENAME
+        conn = self._conn()
+        # Schema setup and the one-time JSON import run under the cross-process lock, so two processes opening a
+        # fresh cache directory never import the same files twice.
+        with flock_path(self.root / f"{DB_FILENAME}.lock"):
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                conn.executescript(_SCHEMA)
+                if self.migrate_json:
+                    self.import_json_dir(self.root)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._has_legacy = self._legacy_remaining(conn)
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shared across threads; each thread gets its own.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def lock(self, key: str) -> Any:
+        return flock_path(self.root / f"{key_digest(key)}.lock")
+
+    def get(self, key: str, ttl_seconds: int) -> Any | None:
+        entry = self.get_entry(key, ttl_seconds)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str, ttl_seconds: int) -> CacheEntry | None:
+        with timings.stage("cache_read"):
+            return record_read(self._read(key, ttl_seconds))
+
+    def _read(self, key: str, ttl_seconds: int) -> CacheEntry | None:
+        conn = self._conn()
+        min_created_at = time.time() - ttl_seconds
+        row = self._select(conn, key, min_created_at)
+        if row is None and self._has_legacy:
+            row = self._adopt_legacy(conn, key, min_created_at)
+        if row is None:
+            return None
+        try:
+            body = zlib.decompress(row[0])
+            return CacheEntry(row[1], json.loads(body), len(body))
+        except (zlib.error, ValueError):
+            return None
+
+    def _adopt_legacy(self, conn: sqlite3.Connection, key: str, min_created_at: float) -> tuple[bytes, float] | None:
+        self._claim_legacy(conn, key)
+        return self._select(conn, key, min_created_at)
+
+    def _claim_legacy(self, conn: sqlite3.Connection, key: str) -> None:
+        # Imported JSON files only know the SHA-256 of their key; claim the row under its real key on first use.
+        # Misses only read, so they never take the WAL write lock; the flag clears once every row is claimed.
+        legacy_key = f"{LEGACY_KEY_PREFIX}{key_digest(key)}"
+        if conn.execute("SELECT 1 FROM entries WHERE key = ?", (legacy_key,)).fetchone() is None:
+            return
+        conn.execute("UPDATE OR IGNORE entries SET key = ? WHERE key = ?", (key, legacy_key))
+        self._has_legacy = self._legacy_remaining(conn)
+
+    @staticmethod
+    def _legacy_remaining(conn: sqlite3.Connection) -> bool:
+        return (
+            conn.execute(
+                "SELECT 1 FROM entries WHERE key >= ? AND key < ? LIMIT 1", (LEGACY_KEY_PREFIX, _LEGACY_KEY_END)
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _select(conn: sqlite3.Connection, key: str, min_created_at: float) -> tuple[bytes, float] | None:
+        return conn.execute(
+            "SELECT value, created_at FROM entries WHERE key = ? AND created_at >= ?", (key, min_created_at)
+        ).fetchone()
+
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> int:
+        return self._put(key, value, time.time(), ttl_seconds)
+
+    def _put(self, key: str, value: Any, created_at: float, ttl_seconds: float | None) -> int:
+        raw = dump_json(value)
+        expires_at = created_at + ttl_seconds if ttl_seconds is not None else None
+        self._conn().execute(
+            "INSERT INTO entries (key, created_at, ttl, expires_at, value) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET created_at = excluded.created_at, ttl = excluded.ttl, "
+            "expires_at = excluded.expires_at, value = excluded.value",
+            (key, created_at, ttl_seconds, expires_at, _encode(raw)),
+        )
+        return len(raw)
+
+    def touch(self, key: str, ttl_seconds: int | None = None) -> bool:
+        conn = self._conn()
+        if self._has_legacy:
+            self._claim_legacy(conn, key)
+        now = time.time()
+        return (
+            conn.execute(
+                "UPDATE entries SET created_at = ?, ttl = COALESCE(?, ttl), expires_at = ? + COALESCE(?, ttl) "
+                "WHERE key = ?",
+                (now, ttl_seconds, now, ttl_seconds, key),
+            ).rowcount
+            > 0
+        )
+
+    def snapshot_store(self) -> SnapshotStore:
+        # Snapshot series are append-only files next to the database, the same layout `JsonCache` uses.
+        return SnapshotStore(self.root / SNAPSHOT_DIRNAME)
+
+    def purge_old_snapshots(self, retention_days: int, now_ts: float | None = None) -> None:
+        now = now_ts or time.time()
+        cutoff = now - (retention_days * 24 * 60 * 60)
+        self._conn().execute("DELETE FROM entries WHERE created_at < ?", (cutoff,))
+        self.snapshot_store().purge_old(retention_days, now_ts=now)
+
+    def purge_expired(self, now_ts: float | None = None) -> int:
+        now = now_ts or time.time()
+        return self._conn().execute("DELETE FROM entries WHERE expires_at < ?", (now,)).rowcount
+
+    def import_json_dir(self, json_root: Path, remove: bool = True) -> int:
+        """Import `JsonCache` files (keeping their `created_at`) under `legacy:{digest}` keys."""
+        imported = []
+        conn = self._conn()
+        paths = sorted(
+            path for suffix in (LEGACY_SUFFIX, ENTRY_SUFFIX) for path in Path(json_root).glob(f"*{suffix}")
+        )
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for path in paths:
+                entry = read_entry(path)
+                if entry is None:
+                    continue
+                self._put(f"{LEGACY_KEY_PREFIX}{path.stem}", entry.value, entry.created_at, None)
+                imported.append(path)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if remove:
+            # Files `read_entry` could not parse stay on disk for the JSON cache (or a human) to deal with.
+            for path in imported:
+                path.unlink(missing_ok=True)
+        return len(imported)
+
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import importlib
 import json
-from datetime import timedelta
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import typer
 
-from espn_fbb.analytics import build_outlook, build_preview, build_recap, build_snapshot
-from espn_fbb.cache import JsonCache
-from espn_fbb.config import ConfigError, load_config
-from espn_fbb.fetch import AuthError, ESPNClient, ESPNError, RequestLimitError
-from espn_fbb.utils import et_date_str, now_et
+from espn_fbb import timings
+from espn_fbb.cache import CacheBackend, JsonCache, cache_backend_name, open_cache
+from espn_fbb.cache_memory import TieredCache
+from espn_fbb.config import AppConfig, BatchJob, ConfigError, load_batch_config, load_config
+from espn_fbb.fetch import ESPNClient, wait_for_refreshes
+
+# `commands` pulls in analytics, pydantic and NumPy. It is imported inside command bodies so `--help`, config
+# errors and shell completion never pay for it; see benchmarks/startup.py.
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from espn_fbb.analytics_schedule import ScheduleIndex
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 matchup_app = typer.Typer(add_completion=False, no_args_is_help=True)
@@ -22,60 +33,103 @@ def _exit(code: int, message: str) -> None:
     raise typer.Exit(code=code)
 
 
+def _open_cache() -> CacheBackend:
+    # JSON files stay the default store; ESPN_FBB_CACHE_BACKEND=sqlite switches to the SQLite store.
+    if cache_backend_name() == "json":
+        return JsonCache()
+    return open_cache()
+
+
+@contextmanager
+def _instrumented(command: str, timings_flag: bool, profile: Path | None) -> Iterator[None]:
+    # Timings and profiles go to stderr/a file so stdout keeps its JSON contract.
+    with timings.recording(command, enabled=timings.enabled(timings_flag)) as recorder, timings.profiling(profile):
+        try:
+            yield
+        finally:
+            if recorder is not None:
+                typer.echo(json.dumps({"timings": recorder.finish()}), err=True)
+
+
+def _run_command(
+    command: str,
+    build: Callable[[ESPNClient, CacheBackend, AppConfig], BaseModel],
+    *,
+    league_id: str | None,
+    team_id: int | None,
+    season: int | None,
+    timings_flag: bool,
+    profile: Path | None,
+    config_path: Path | None,
+) -> None:
+    # Shared body of the single-league commands: config, one client, one model printed as JSON, mapped exit codes.
+    with _instrumented(command, timings_flag, profile):
+        try:
+            with timings.stage("cache_open"):
+                cache = _open_cache()
+            with timings.stage("config"):
+                cfg = load_config(config_path=config_path, league_id=league_id, team_id=team_id, season=season)
+            with timings.stage("imports"):
+                # `build` imports its runner from here; loading it up front keeps import time in its own stage.
+                importlib.import_module("espn_fbb.commands")
+            client = ESPNClient(
+                league_id=cfg.league_id,
+                season=cfg.season,
+                espn_s2=cfg.espn_s2,
+                swid=cfg.swid,
+                cache=cache,
+            )
+
+            model = build(client, cache, cfg)
+            timings.note(budget=asdict(client.budget))
+
+            from espn_fbb.commands import SNAPSHOT_RETENTION_DAYS
+
+            # A cron of single-league runs has no batch to purge after it; the sweep is one scan of the cache dir.
+            with timings.stage("purge_snapshots"):
+                cache.purge_old_snapshots(retention_days=SNAPSHOT_RETENTION_DAYS)
+
+            with timings.stage("serialize"):
+                output = model.model_dump_json()
+            typer.echo(output)
+        except typer.Exit:
+            raise
+        except ConfigError as exc:
+            # Config errors exit before `commands` (and analytics/pydantic) is imported.
+            _exit(2, str(exc))
+        except Exception as exc:
+            from espn_fbb.commands import exit_code_for
+
+            code = exit_code_for(exc)
+            _exit(code, str(exc) if code != 5 else f"Unexpected runtime error: {exc}")
+
+
 @app.command()
 def recap(
     league_id: str | None = typer.Option(None, "--league-id"),
     team_id: int | None = typer.Option(None, "--team-id"),
     season: int | None = typer.Option(None, "--season"),
     no_cache: bool = typer.Option(False, "--no-cache"),
+    incremental: bool = typer.Option(False, "--incremental"),
+    timings_flag: bool = typer.Option(False, "--timings"),
+    profile: Path | None = typer.Option(None, "--profile"),
     config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
 ) -> None:
-    cache = JsonCache()
-
-    try:
-        cfg = load_config(config_path=config_path, league_id=league_id, team_id=team_id, season=season)
-        client = ESPNClient(
-            league_id=cfg.league_id,
-            season=cfg.season,
-            espn_s2=cfg.espn_s2,
-            swid=cfg.swid,
-            cache=cache,
-        )
-
-        views = ["mMatchupScore", "mScoreboard", "mTeam", "mRoster", "mSettings"]
-        league = client.get_league(views=views, use_cache=not no_cache, cache_ttl_seconds=3 * 60 * 60)
-
-        today = now_et()
-        yesterday = today - timedelta(days=1)
-        current_matchup = (league.get("status") or {}).get("currentMatchupPeriod", 1)
-        if isinstance(current_matchup, list):
-            current_matchup = current_matchup[0] if current_matchup else 1
-        matchup_period_id = int(current_matchup)
-        yesterday_key = cache.snapshot_key(cfg.league_id, cfg.team_id, matchup_period_id, et_date_str(yesterday))
-        yesterday_snapshot = cache.get(yesterday_key, ttl_seconds=10 * 24 * 60 * 60)
-
-        recap_model = build_recap(
-            league_payload=league,
-            team_id=cfg.team_id,
-            league_id=cfg.league_id,
-            yesterday_snapshot=yesterday_snapshot,
-        )
+    def build(client: ESPNClient, cache: CacheBackend, cfg: AppConfig) -> BaseModel:
+        from espn_fbb.commands import run_recap
 
-        today_key = cache.snapshot_key(cfg.league_id, cfg.team_id, recap_model.matchup_period_id, et_date_str(today))
-        cache.set(today_key, build_snapshot(recap_model.categories))
-        cache.purge_old_snapshots(retention_days=10)
+        return run_recap(client, cache, cfg.team_id, use_cache=not no_cache, incremental=incremental)
 
-        typer.echo(recap_model.model_dump_json())
-    except ConfigError as exc:
-        _exit(2, str(exc))
-    except AuthError as exc:
-        _exit(3, str(exc))
-    except (ESPNError, RequestLimitError) as exc:
-        _exit(4, str(exc))
-    except typer.Exit:
-        raise
-    except Exception as exc:  # pragma: no cover
-        _exit(5, f"Unexpected runtime error: {exc}")
+    _run_command(
+        "recap",
+        build,
+        league_id=league_id,
+        team_id=team_id,
+        season=season,
+        timings_flag=timings_flag,
+        profile=profile,
+        config_path=config_path,
+    )
 
 
 @matchup_app.command("preview")
@@ -84,84 +138,378 @@ def matchup_preview(
     team_id: int | None = typer.Option(None, "--team-id"),
     season: int | None = typer.Option(None, "--season"),
     no_cache: bool = typer.Option(False, "--no-cache"),
+    incremental: bool = typer.Option(False, "--incremental"),
+    timings_flag: bool = typer.Option(False, "--timings"),
+    profile: Path | None = typer.Option(None, "--profile"),
     config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
 ) -> None:
-    cache = JsonCache()
+    def build(client: ESPNClient, cache: CacheBackend, cfg: AppConfig) -> BaseModel:
+        from espn_fbb.commands import run_preview
 
-    try:
-        cfg = load_config(config_path=config_path, league_id=league_id, team_id=team_id, season=season)
-        client = ESPNClient(
-            league_id=cfg.league_id,
-            season=cfg.season,
-            espn_s2=cfg.espn_s2,
-            swid=cfg.swid,
-            cache=cache,
-        )
+        return run_preview(client, cfg.team_id, use_cache=not no_cache, incremental=incremental)
+
+    _run_command(
+        "matchup_preview",
+        build,
+        league_id=league_id,
+        team_id=team_id,
+        season=season,
+        timings_flag=timings_flag,
+        profile=profile,
+        config_path=config_path,
+    )
 
-        views = ["mMatchupScore", "mScoreboard", "mTeam", "mRoster", "mSettings", "mMatchup", "mStandings"]
-        league = client.get_league(views=views, use_cache=not no_cache, cache_ttl_seconds=3 * 60 * 60)
-        schedule = client.get_pro_team_schedules(use_cache=not no_cache, cache_ttl_seconds=24 * 60 * 60)
 
-        preview_model = build_preview(
-            league_payload=league,
-            schedule_payload=schedule,
-            team_id=cfg.team_id,
-            league_id=cfg.league_id,
-            week="next",
+@matchup_app.command("outlook")
+def matchup_outlook(
+    league_id: str | None = typer.Option(None, "--league-id"),
+    team_id: int | None = typer.Option(None, "--team-id"),
+    season: int | None = typer.Option(None, "--season"),
+    no_cache: bool = typer.Option(False, "--no-cache"),
+    incremental: bool = typer.Option(False, "--incremental"),
+    simulate: int = typer.Option(0, "--simulate", min=0),
+    seed: int = typer.Option(0, "--seed"),
+    timings_flag: bool = typer.Option(False, "--timings"),
+    profile: Path | None = typer.Option(None, "--profile"),
+    config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
+) -> None:
+    def build(client: ESPNClient, cache: CacheBackend, cfg: AppConfig) -> BaseModel:
+        from espn_fbb.commands import run_outlook
+
+        return run_outlook(
+            client, cfg.team_id, use_cache=not no_cache, simulations=simulate, seed=seed, incremental=incremental
         )
 
-        typer.echo(preview_model.model_dump_json())
-    except ConfigError as exc:
-        _exit(2, str(exc))
-    except AuthError as exc:
-        _exit(3, str(exc))
-    except (ESPNError, RequestLimitError) as exc:
-        _exit(4, str(exc))
-    except typer.Exit:
-        raise
-    except Exception as exc:  # pragma: no cover
-        _exit(5, f"Unexpected runtime error: {exc}")
+    _run_command(
+        "matchup_outlook",
+        build,
+        league_id=league_id,
+        team_id=team_id,
+        season=season,
+        timings_flag=timings_flag,
+        profile=profile,
+        config_path=config_path,
+    )
 
 
-@matchup_app.command("outlook")
-def matchup_outlook(
+@app.command()
+def report(
     league_id: str | None = typer.Option(None, "--league-id"),
     team_id: int | None = typer.Option(None, "--team-id"),
     season: int | None = typer.Option(None, "--season"),
     no_cache: bool = typer.Option(False, "--no-cache"),
+    incremental: bool = typer.Option(False, "--incremental"),
+    simulate: int = typer.Option(0, "--simulate", min=0),
+    seed: int = typer.Option(0, "--seed"),
+    timings_flag: bool = typer.Option(False, "--timings"),
+    profile: Path | None = typer.Option(None, "--profile"),
     config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
 ) -> None:
-    cache = JsonCache()
+    def build(client: ESPNClient, cache: CacheBackend, cfg: AppConfig) -> BaseModel:
+        from espn_fbb.commands import run_report
 
-    try:
-        cfg = load_config(config_path=config_path, league_id=league_id, team_id=team_id, season=season)
-        client = ESPNClient(
-            league_id=cfg.league_id,
-            season=cfg.season,
-            espn_s2=cfg.espn_s2,
-            swid=cfg.swid,
-            cache=cache,
+        return run_report(
+            client,
+            cache,
+            cfg.team_id,
+            use_cache=not no_cache,
+            simulations=simulate,
+            seed=seed,
+            incremental=incremental,
         )
 
-        views = ["mMatchupScore", "mScoreboard", "mTeam", "mRoster", "mSettings", "mMatchup", "mStandings"]
-        league = client.get_league(views=views, use_cache=not no_cache, cache_ttl_seconds=3 * 60 * 60)
-        schedule = client.get_pro_team_schedules(use_cache=not no_cache, cache_ttl_seconds=24 * 60 * 60)
+    _run_command(
+        "report",
+        build,
+        league_id=league_id,
+        team_id=team_id,
+        season=season,
+        timings_flag=timings_flag,
+        profile=profile,
+        config_path=config_path,
+    )
+
+
+def _job_client(job: BatchJob, cache: CacheBackend, client_options: dict[str, Any] | None = None) -> ESPNClient:
+    return ESPNClient(
+        league_id=job.league_id,
+        season=job.season,
+        espn_s2=job.espn_s2,
+        swid=job.swid,
+        cache=cache,
+        **(client_options or {}),
+    )
 
-        outlook_model = build_outlook(
-            league_payload=league,
-            schedule_payload=schedule,
-            team_id=cfg.team_id,
-            league_id=cfg.league_id,
+
+def _warm_batch(
+    jobs: list[BatchJob], cache: CacheBackend, *, workers: int, client_options: dict[str, Any] | None = None
+) -> dict[int, dict[str, Any]]:
+    import asyncio
+
+    from espn_fbb.commands import (
+        LEAGUE_TTL_SECONDS,
+        MATCHUP_VIEWS,
+        RECAP_VIEWS,
+        SCHEDULE_TTL_SECONDS,
+        schedule_index_key,
+    )
+    from espn_fbb.fetch_async import fetch_leagues
+
+    # Fetch each league once, concurrently, into the cache the jobs read from. The matchup views are a superset of
+    # recap's, so they serve a recap job too, except for pruned (stream-parsed) payloads, which are never shared.
+    by_views: dict[bool, dict[tuple[str, int], BatchJob]] = {True: {}, False: {}}
+    for job in jobs:
+        by_views[job.command != "recap"].setdefault((job.league_id, job.season), job)
+    if not (client_options or {}).get("stream_parse"):
+        by_views[False] = {key: job for key, job in by_views[False].items() if key not in by_views[True]}
+
+    # A season whose compiled schedule index is cached needs no raw schedule at all.
+    uncompiled = {
+        season for _, season in by_views[True] if cache.get(schedule_index_key(season), SCHEDULE_TTL_SECONDS) is None
+    }
+
+    async def _fetch() -> list[Any]:
+        results = []
+        for matchup, leagues in by_views.items():
+            if leagues:
+                results += await fetch_leagues(
+                    [_job_client(job, cache, client_options) for job in leagues.values()],
+                    MATCHUP_VIEWS if matchup else RECAP_VIEWS,
+                    concurrency=workers,
+                    include_schedule=matchup and bool(uncompiled),
+                    league_ttl_seconds=LEAGUE_TTL_SECONDS,
+                    schedule_ttl_seconds=SCHEDULE_TTL_SECONDS,
+                )
+        return results
+
+    # Failures are not reported here: the job re-fetches and reports its own error.
+    seasons = [season for leagues in by_views.values() for _, season in leagues]
+    return {
+        season: result.schedule
+        for season, result in zip(seasons, asyncio.run(_fetch()))
+        if result.schedule is not None
+    }
+
+
+def _batch_schedules(
+    jobs: list[BatchJob],
+    cache: CacheBackend,
+    *,
+    use_cache: bool,
+    client_options: dict[str, Any] | None = None,
+    fetched: dict[int, dict[str, Any]] | None = None,
+) -> dict[int, ScheduleIndex | Exception]:
+    from espn_fbb.commands import load_schedule_index, schedule_index_from_payload
+
+    # The pro-team schedule is season-wide, so compile it once per season for every job.
+    schedules: dict[int, ScheduleIndex | Exception] = {}
+    for job in jobs:
+        if job.command == "recap" or job.season in schedules:
+            continue
+        try:
+            client = _job_client(job, cache, client_options)
+            if fetched and job.season in fetched:
+                schedules[job.season] = schedule_index_from_payload(client, fetched[job.season], use_cache=use_cache)
+            else:
+                schedules[job.season] = load_schedule_index(client, use_cache=use_cache)
+        except Exception as exc:
+            schedules[job.season] = exc
+    return schedules
+
+
+def _run_batch_job(
+    job: BatchJob,
+    cache: CacheBackend,
+    schedules: dict[int, ScheduleIndex | Exception],
+    *,
+    use_cache: bool,
+    client_options: dict[str, Any] | None = None,
+    incremental: bool = False,
+    timed: bool = False,
+) -> dict[str, Any]:
+    from espn_fbb.commands import exit_code_for, run_outlook, run_preview, run_recap, run_report
+
+    line: dict[str, Any] = {"league_id": job.league_id, "team_id": job.team_id, "command": job.command}
+    # Worker threads do not inherit the caller's recorder, so each job records its own tree.
+    with timings.recording(job.command, enabled=timed) as recorder:
+        try:
+            client = _job_client(job, cache, client_options)
+            if job.command == "recap":
+                model = run_recap(client, cache, job.team_id, use_cache=use_cache, incremental=incremental)
+            else:
+                schedule = schedules.get(job.season)
+                if isinstance(schedule, Exception):
+                    raise schedule
+                if job.command == "report":
+                    model = run_report(
+                        client,
+                        cache,
+                        job.team_id,
+                        use_cache=use_cache,
+                        schedule=schedule,
+                        incremental=incremental,
+                    )
+                else:
+                    runner = run_preview if job.command == "preview" else run_outlook
+                    model = runner(
+                        client, job.team_id, use_cache=use_cache, schedule=schedule, incremental=incremental
+                    )
+            timings.note(budget=asdict(client.budget))
+            line["exit_code"] = 0
+            with timings.stage("serialize"):
+                line["result"] = model.model_dump(mode="json")
+        except Exception as exc:
+            code = exit_code_for(exc)
+            line["exit_code"] = code
+            line["error"] = str(exc) if code != 5 else f"Unexpected runtime error: {exc}"
+    if recorder is not None:
+        line["timings"] = recorder.finish()
+    return line
+
+
+@app.command()
+def batch(
+    no_cache: bool = typer.Option(False, "--no-cache"),
+    workers: int = typer.Option(4, "--workers", min=1),
+    cache_stats: bool = typer.Option(False, "--cache-stats"),
+    stale_while_revalidate: bool = typer.Option(False, "--stale-while-revalidate"),
+    incremental: bool = typer.Option(False, "--incremental"),
+    stream_parse: bool = typer.Option(False, "--stream-parse"),
+    timings_flag: bool = typer.Option(False, "--timings"),
+    config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
+) -> None:
+    timed = timings.enabled(timings_flag)
+    try:
+        # Jobs for the same league re-read the same payloads; keep recently used entries parsed in memory.
+        cache = TieredCache(_open_cache())
+        jobs = load_batch_config(config_path=config_path)
+    except ConfigError as exc:
+        _exit(2, str(exc))
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    use_cache = not no_cache
+    options = {"stale_while_revalidate": stale_while_revalidate, "stream_parse": stream_parse}
+    with timings.recording("batch", enabled=timed) as recorder:
+        fetched: dict[int, dict[str, Any]] = {}
+        # Incremental jobs fetch per scoring period, and `--no-cache` leaves nothing for the jobs to read back.
+        if use_cache and not incremental:
+            with timings.stage("fetch"):
+                fetched = _warm_batch(jobs, cache, workers=workers, client_options=options)
+        with timings.stage("schedules"):
+            schedules = _batch_schedules(jobs, cache, use_cache=use_cache, client_options=options, fetched=fetched)
+
+        worst = 0
+        with timings.stage("jobs"), ThreadPoolExecutor(max_workers=workers) as pool:
+            lines = pool.map(
+                lambda job: _run_batch_job(
+                    job,
+                    cache,
+                    schedules,
+                    use_cache=use_cache,
+                    client_options=options,
+                    incremental=incremental,
+                    timed=timed,
+                ),
+                jobs,
+            )
+            for line in lines:
+                worst = max(worst, line["exit_code"])
+                job_timings = line.pop("timings", None)
+                typer.echo(json.dumps(line))
+                if job_timings is not None:
+                    job_key = {key: line[key] for key in ("league_id", "team_id", "command")}
+                    typer.echo(json.dumps({**job_key, "timings": job_timings}), err=True)
+        # Let background refreshes land in the cache before the process exits.
+        with timings.stage("wait_for_refreshes"):
+            wait_for_refreshes()
+
+        if any(job.command in ("recap", "report") for job in jobs):
+            from espn_fbb.commands import SNAPSHOT_RETENTION_DAYS
+
+            with timings.stage("purge_snapshots"):
+                cache.purge_old_snapshots(retention_days=SNAPSHOT_RETENTION_DAYS)
+    if recorder is not None:
+        typer.echo(json.dumps({"timings": recorder.finish()}), err=True)
+    if cache_stats:
+        tiers = {name: vars(tier) for name, tier in cache.stats().items()}
+        typer.echo(json.dumps({"cache": tiers, "memory_bytes": cache.memory_bytes}), err=True)
+    if worst:
+        raise typer.Exit(code=worst)
+
+
+@app.command()
+def prefetch(
+    max_requests: int = typer.Option(4, "--max-requests", min=0),
+    lead_minutes: float = typer.Option(10.0, "--lead-minutes", min=0),
+    stats_final_hour: int = typer.Option(3, "--stats-final-hour", min=0, max=23),
+    dry_run: bool = typer.Option(False, "--dry-run"),
+    timings_flag: bool = typer.Option(False, "--timings"),
+    config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
+) -> None:
+    worst = 0
+    with _instrumented("prefetch", timings_flag, None):
+        try:
+            with timings.stage("cache_open"):
+                cache = _open_cache()
+            with timings.stage("imports"):
+                from espn_fbb.prefetch import PrefetchScheduler, targets_from_config
+            with timings.stage("config"):
+                targets = targets_from_config(config_path)
+        except ConfigError as exc:
+            _exit(2, str(exc))
+            return
+
+        scheduler = PrefetchScheduler(
+            cache,
+            max_league_requests=max_requests,
+            lead_seconds=lead_minutes * 60,
+            stats_final_hour=stats_final_hour,
         )
+        if dry_run:
+            now = time.time()
+            lines = [
+                {**task.describe(), "status": "due" if task.due_at <= now else "scheduled"}
+                for task in scheduler.plan(targets, now)
+            ]
+        else:
+            lines = scheduler.run(targets)
+        for line in lines:
+            worst = max(worst, line.get("exit_code", 0))
+            typer.echo(json.dumps(line))
+    if worst:
+        raise typer.Exit(code=worst)
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host"),
+    port: int = typer.Option(8765, "--port", min=0),
+    socket_path: Path | None = typer.Option(None, "--socket"),
+    refresh_minutes: float = typer.Option(30.0, "--refresh-minutes", min=0),
+    prefetch_max_requests: int = typer.Option(4, "--prefetch-max-requests", min=0),
+    stale_while_revalidate: bool = typer.Option(False, "--stale-while-revalidate"),
+    config_path: Path | None = typer.Option(None, "--config-path", hidden=True),
+) -> None:
+    try:
+        from espn_fbb.serve import LeagueService, make_server, run
 
-        typer.echo(outlook_model.model_dump_json())
+        # Parsed payloads stay in the memory tier between queries, like a long-running batch.
+        service = LeagueService(
+            cache=TieredCache(_open_cache()),
+            config_path=config_path,
+            client_options={"stale_while_revalidate": stale_while_revalidate},
+            prefetch_options={"max_league_requests": prefetch_max_requests},
+        )
+        server = make_server(service, host=host, port=port, socket_path=socket_path)
     except ConfigError as exc:
         _exit(2, str(exc))
-    except AuthError as exc:
-        _exit(3, str(exc))
-    except (ESPNError, RequestLimitError) as exc:
-        _exit(4, str(exc))
-    except typer.Exit:
-        raise
-    except Exception as exc:  # pragma: no cover
-        _exit(5, f"Unexpected runtime error: {exc}")
+        return
+    except OSError as exc:
+        _exit(2, f"Cannot listen: {exc}")
+        return
+
+    address = str(socket_path) if socket_path is not None else "http://{}:{}".format(*server.server_address[:2])
+    typer.echo(json.dumps({"listening": address}), err=True)
+    run(server, service, refresh_seconds=refresh_minutes * 60)
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from espn_fbb import timings
+from espn_fbb.analytics import build_outlook, build_preview, build_recap, build_snapshot
+from espn_fbb.analytics_schedule import ScheduleIndex
+from espn_fbb.analytics_simulation import SimulationUnavailableError
+from espn_fbb.cache import CacheBackend
+from espn_fbb.config import ConfigError
+from espn_fbb.fetch import AuthError, ESPNClient, ESPNError, RequestLimitError
+from espn_fbb.league_delta import merge_league_delta
+from espn_fbb.league_model import League
+from espn_fbb.schema import OutlookResponse, PreviewResponse, RecapResponse, ReportResponse
+from espn_fbb.utils import iso_ts, now_et
+
+RECAP_VIEWS = ["mMatchupScore", "mScoreboard", "mTeam", "mRoster", "mSettings"]
+MATCHUP_VIEWS = ["mMatchupScore", "mScoreboard", "mTeam", "mRoster", "mSettings", "mMatchup", "mStandings"]
+# Current matchup period's schedule rows plus current scoring period roster stats, merged over a cached base payload.
+DELTA_VIEWS = ["mMatchupScore", "mScoreboard", "mTeam", "mRoster"]
+
+LEAGUE_TTL_SECONDS = 3 * 60 * 60
+SCHEDULE_TTL_SECONDS = 24 * 60 * 60
+SNAPSHOT_RETENTION_DAYS = 10
+BASE_LEAGUE_TTL_SECONDS = 24 * 60 * 60
+
+
+def exit_code_for(exc: Exception) -> int:
+    # Same mapping as the single-league commands' exit codes; shared by batch lines and `serve` responses.
+    if isinstance(exc, (ConfigError, SimulationUnavailableError)):
+        return 2
+    if isinstance(exc, AuthError):
+        return 3
+    if isinstance(exc, (ESPNError, RequestLimitError)):
+        return 4
+    return 5
+
+
+def _current_matchup_from_status(league: dict[str, Any]) -> int:
+    current_matchup = (league.get("status") or {}).get("currentMatchupPeriod", 1)
+    if isinstance(current_matchup, list):
+        current_matchup = current_matchup[0] if current_matchup else 1
+    return int(current_matchup)
+
+
+def _current_scoring_period_from_status(league: dict[str, Any]) -> int | None:
+    current = (league.get("status") or {}).get("currentScoringPeriod", league.get("scoringPeriodId"))
+    if isinstance(current, list):
+        current = current[0] if current else None
+    return int(current) if current is not None else None
+
+
+def _base_league_ttl_seconds() -> int:
+    # The base payload is refetched on the first run of each ET day so its scoring period is never a day behind.
+    now = now_et()
+    since_midnight = (now - now.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds()
+    return min(BASE_LEAGUE_TTL_SECONDS, int(since_midnight))
+
+
+def load_league(
+    client: ESPNClient,
+    views: list[str],
+    *,
+    use_cache: bool = True,
+    incremental: bool = False,
+) -> dict[str, Any]:
+    with timings.stage("load_league"):
+        return _load_league(client, views, use_cache=use_cache, incremental=incremental)
+
+
+def _load_league(client: ESPNClient, views: list[str], *, use_cache: bool, incremental: bool) -> dict[str, Any]:
+    if not (incremental and use_cache):
+        return client.get_league(views=views, use_cache=use_cache, cache_ttl_seconds=LEAGUE_TTL_SECONDS)
+
+    base = client.get_league(views=views, cache_ttl_seconds=_base_league_ttl_seconds())
+    scoring_period_id = _current_scoring_period_from_status(base)
+    if scoring_period_id is None:
+        return base
+    delta = client.get_league(
+        views=DELTA_VIEWS,
+        scoring_period_id=scoring_period_id,
+        matchup_period_id=_current_matchup_from_status(base),
+        cache_ttl_seconds=LEAGUE_TTL_SECONDS,
+    )
+    return merge_league_delta(base, delta)
+
+
+def run_recap(
+    client: ESPNClient,
+    cache: CacheBackend,
+    team_id: int,
+    *,
+    use_cache: bool = True,
+    incremental: bool = False,
+) -> RecapResponse:
+    league = load_league(client, RECAP_VIEWS, use_cache=use_cache, incremental=incremental)
+    return _recap(client, cache, team_id, league)
+
+
+def _recap(
+    client: ESPNClient,
+    cache: CacheBackend,
+    team_id: int,
+    league: dict[str, Any] | League,
+) -> RecapResponse:
+    today = now_et().date()
+    payload = league.payload if isinstance(league, League) else league
+    matchup_period_id = _current_matchup_from_status(payload)
+    store = cache.snapshot_store()
+    yesterday = today - timedelta(days=1)
+    with timings.stage("snapshots"):
+        series = store.load(client.league_id, team_id)
+        yesterday_snapshot = series.get(matchup_period_id, yesterday) if series is not None else None
+        period_start_snapshot = series.first(matchup_period_id, end=yesterday) if series is not None else None
+
+    with timings.stage("analytics"):
+        recap_model = build_recap(
+            league_payload=league,
+            team_id=team_id,
+            league_id=client.league_id,
+            yesterday_snapshot=yesterday_snapshot,
+            period_start_snapshot=period_start_snapshot,
+        )
+
+    with timings.stage("snapshots"):
+        # Appending also drops rows older than the retention window from this series; nothing else is scanned.
+        store.append(
+            client.league_id,
+            team_id,
+            recap_model.matchup_period_id,
+            today,
+            build_snapshot(recap_model.categories),
+            retention_days=SNAPSHOT_RETENTION_DAYS,
+        )
+    return recap_model
+
+
+def fetch_schedule(client: ESPNClient, *, use_cache: bool = True, refresh: bool = False) -> dict[str, Any]:
+    return client.get_pro_team_schedules(use_cache=use_cache, cache_ttl_seconds=SCHEDULE_TTL_SECONDS, refresh=refresh)
+
+
+def schedule_index_key(season: int) -> str:
+    return f"schedule_index:v{ScheduleIndex.VERSION}:{season}"
+
+
+def load_schedule_index(client: ESPNClient, *, use_cache: bool = True, refresh: bool = False) -> ScheduleIndex:
+    with timings.stage("load_schedule"):
+        return _load_schedule_index(client, use_cache=use_cache, refresh=refresh)
+
+
+def _load_schedule_index(client: ESPNClient, *, use_cache: bool, refresh: bool = False) -> ScheduleIndex:
+    # The compiled index is cached beside the raw schedule, so warm runs skip parsing the raw payload entirely.
+    key = schedule_index_key(client.season)
+    if use_cache and not refresh:
+        cached = client.cache.get(key, ttl_seconds=SCHEDULE_TTL_SECONDS)
+        index = ScheduleIndex.from_dict(cached) if cached is not None else None
+        if index is not None:
+            return index
+
+    payload = fetch_schedule(client, use_cache=use_cache, refresh=refresh)
+    return schedule_index_from_payload(client, payload, use_cache=use_cache)
+
+
+def schedule_index_from_payload(
+    client: ESPNClient, payload: dict[str, Any], *, use_cache: bool = True
+) -> ScheduleIndex:
+    """Compile an already fetched schedule payload, caching the index for `load_schedule_index`."""
+    index = ScheduleIndex.from_payload(payload)
+    if use_cache:
+        client.cache.set(schedule_index_key(client.season), index.to_dict(), ttl_seconds=SCHEDULE_TTL_SECONDS)
+    return index
+
+
+def run_preview(
+    client: ESPNClient,
+    team_id: int,
+    *,
+    use_cache: bool = True,
+    schedule: dict[str, Any] | ScheduleIndex | None = None,
+    incremental: bool = False,
+) -> PreviewResponse:
+    league = load_league(client, MATCHUP_VIEWS, use_cache=use_cache, incremental=incremental)
+    if schedule is None:
+        schedule = load_schedule_index(client, use_cache=use_cache)
+
+    with timings.stage("analytics"):
+        return build_preview(
+            league_payload=league,
+            schedule_payload=schedule,
+            team_id=team_id,
+            league_id=client.league_id,
+            week="next",
+        )
+
+
+def run_outlook(
+    client: ESPNClient,
+    team_id: int,
+    *,
+    use_cache: bool = True,
+    schedule: dict[str, Any] | ScheduleIndex | None = None,
+    simulations: int = 0,
+    seed: int = 0,
+    incremental: bool = False,
+) -> OutlookResponse:
+    league = load_league(client, MATCHUP_VIEWS, use_cache=use_cache, incremental=incremental)
+    if schedule is None:
+        schedule = load_schedule_index(client, use_cache=use_cache)
+
+    with timings.stage("analytics"):
+        return build_outlook(
+            league_payload=league,
+            schedule_payload=schedule,
+            team_id=team_id,
+            league_id=client.league_id,
+            simulations=simulations,
+            seed=seed,
+        )
+
+
+def run_report(
+    client: ESPNClient,
+    cache: CacheBackend,
+    team_id: int,
+    *,
+    use_cache: bool = True,
+    schedule: dict[str, Any] | ScheduleIndex | None = None,
+    simulations: int = 0,
+    seed: int = 0,
+    incremental: bool = False,
+) -> ReportResponse:
+    """Recap, preview and outlook from one league fetch, one parsed `League` and one schedule index."""
+    # RECAP_VIEWS is a subset of MATCHUP_VIEWS, so the matchup payload answers all three.
+    payload = load_league(client, MATCHUP_VIEWS, use_cache=use_cache, incremental=incremental)
+    if schedule is None:
+        schedule = load_schedule_index(client, use_cache=use_cache)
+    with timings.stage("league_model"):
+        league = League.from_payload(payload)
+
+    recap = _recap(client, cache, team_id, league)
+    with timings.stage("analytics"):
+        preview = build_preview(
+            league_payload=league,
+            schedule_payload=schedule,
+            team_id=team_id,
+            league_id=client.league_id,
+            week="next",
+        )
+        outlook = build_outlook(
+            league_payload=league,
+            schedule_payload=schedule,
+            team_id=team_id,
+            league_id=client.league_id,
+            simulations=simulations,
+            seed=seed,
+        )
+    return ReportResponse(
+        schema_version="1.0",
+        command="report",
+        generated_at=iso_ts(),
+        league_id=client.league_id,
+        team_id=team_id,
+        recap=recap,
+        preview=preview,
+        outlook=outlook,
+    )
@@ -20,7 +20,18 @@ class AppConfig:
     swid: str | None = None
 
 
+@dataclass(frozen=True)
+class BatchJob:
+    league_id: str
+    team_id: int
+    season: int
+    command: str
+    espn_s2: str | None = None
+    swid: str | None = None
+
+
 DEFAULT_CONFIG_PATH = Path("~/.config/espn-fbb/config.toml").expanduser()
+BATCH_COMMANDS = ("recap", "preview", "outlook", "report")
 
 
 def _read_toml(path: Path) -> dict[str, Any]:
@@ -68,3 +79,46 @@ def load_config(
         espn_s2=data.get("espn_s2"),
         swid=data.get("swid"),
     )
+
+
+def _require_int(value: Any, name: str) -> int:
+    if value is None:
+        raise ConfigError(f"{name} is required")
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise ConfigError(f"{name} must be an integer") from exc
+
+
+def load_batch_config(config_path: Path | None = None) -> list[BatchJob]:
+    path = config_path or DEFAULT_CONFIG_PATH
+    data = _read_toml(path)
+
+    raw_jobs = data.get("jobs")
+    if not isinstance(raw_jobs, list) or not raw_jobs:
+        raise ConfigError("jobs must be a non-empty array of tables")
+
+    jobs: list[BatchJob] = []
+    for idx, raw in enumerate(raw_jobs):
+        if not isinstance(raw, dict):
+            raise ConfigError(f"jobs[{idx}] must be a table")
+
+        league_id = str(raw.get("league_id", data.get("league_id", ""))).strip()
+        if not league_id:
+            raise ConfigError(f"jobs[{idx}].league_id is required")
+
+        command = str(raw.get("command", "")).strip().lower()
+        if command not in BATCH_COMMANDS:
+            raise ConfigError(f"jobs[{idx}].command must be one of: {', '.join(BATCH_COMMANDS)}")
+
+        jobs.append(
+            BatchJob(
+                league_id=league_id,
+                team_id=_require_int(raw.get("team_id", data.get("team_id")), f"jobs[{idx}].team_id"),
+                season=_require_int(raw.get("season", data.get("season")), f"jobs[{idx}].season"),
+                command=command,
+                espn_s2=raw.get("espn_s2", data.get("espn_s2")),
+                swid=raw.get("swid", data.get("swid")),
+            )
+        )
+    return jobs
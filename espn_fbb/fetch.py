@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
-import requests
+from espn_fbb import fetch_stream, timings
+from espn_fbb.cache import CacheBackend, JsonCache
 
-from espn_fbb.cache import JsonCache
+if TYPE_CHECKING:
+    import requests
 
 
 PRIMARY_BASE = "https://fantasy.espn.com/apis/v3/games/fba"
 FALLBACK_BASE = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba"
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# How long a stale payload and its ETag/Last-Modified stay usable for revalidation or stale-while-revalidate.
+REVALIDATE_WINDOW_SECONDS = 7 * 24 * 60 * 60
 
 
 class ESPNError(RuntimeError):
@@ -43,15 +50,253 @@ class RequestBudget:
             raise RequestLimitError("Exceeded schedule request budget")
 
 
+@dataclass
+class TransportStats:
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+
+class HttpTransport:
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 8,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        keep_alive: bool = True,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.keep_alive = keep_alive
+        self._session = session
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections = 0
+
+    @property
+    def session(self) -> requests.Session:
+        # Built (and `requests` imported) on first use, so cache-only runs never load the HTTP stack.
+        with self._lock:
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    def _build_session(self) -> requests.Session:
+        from http.cookiejar import DefaultCookiePolicy
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # Credentials are passed per request; never let server cookies leak between leagues.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        adapter = _counting_adapter(HTTPAdapter, self._count_connection)(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        with self._lock:
+            self._requests += 1
+        return self.session.get(url, **kwargs)
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self._connections += 1
+
+    def stats(self) -> TransportStats:
+        with self._lock:
+            return TransportStats(requests=self._requests, connections_opened=self._connections)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
+def _counting_adapter(base: type, on_new_connection: Callable[[], None]) -> type:
+    # Count connections as urllib3 opens them; pools evicted from the PoolManager's LRU would take their own
+    # `num_connections` with them.
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def counting(pool_cls: type) -> type:
+        class CountingPool(pool_cls):  # type: ignore[misc, valid-type]
+            def _new_conn(self) -> Any:
+                on_new_connection()
+                return super()._new_conn()
+
+        return CountingPool
+
+    pool_classes = {"http": counting(HTTPConnectionPool), "https": counting(HTTPSConnectionPool)}
+
+    class CountingAdapter(base):  # type: ignore[misc, valid-type]
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = pool_classes
+
+        def proxy_manager_for(self, *args: Any, **kwargs: Any) -> Any:
+            manager = super().proxy_manager_for(*args, **kwargs)
+            manager.pool_classes_by_scheme = pool_classes
+            return manager
+
+    return CountingAdapter
+
+
+class _InFlightCall:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapses concurrent calls for the same key into one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _InFlightCall] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+_schedule_flights = SingleFlight()
+_refreshes: dict[str, threading.Thread] = {}
+_refreshes_lock = threading.Lock()
+_default_transport: HttpTransport | None = None
+_default_transport_lock = threading.Lock()
+
+
+def default_transport() -> HttpTransport:
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
+
+
+def _start_refresh(key: str, refresh: Callable[[], Any]) -> None:
+    with _refreshes_lock:
+        if key in _refreshes:
+            return
+
+        def _run() -> None:
+            try:
+                refresh()
+            except Exception:
+                pass  # the stale entry stays cached; the next caller revalidates again
+            finally:
+                with _refreshes_lock:
+                    _refreshes.pop(key, None)
+
+        thread = threading.Thread(target=_run, name="espn-fbb-refresh", daemon=True)
+        _refreshes[key] = thread
+    thread.start()
+
+
+def wait_for_refreshes(timeout: float | None = None) -> None:
+    """Block until background stale-while-revalidate refreshes have finished."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        with _refreshes_lock:
+            threads = list(_refreshes.values())
+        if not threads:
+            return
+        for thread in threads:
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0.0))
+        if deadline is not None and time.monotonic() >= deadline:
+            return
+
+
+def _validators_key(key: str) -> str:
+    return f"validators:{key}"
+
+
+def _response_validators(response: requests.Response) -> dict[str, str]:
+    headers = getattr(response, "headers", None) or {}
+    validators = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+    return {name: value for name, value in validators.items() if value}
+
+
+def _json_body(response: requests.Response, fields: dict[str, Any] | None = None) -> dict[str, Any]:
+    length = (getattr(response, "headers", None) or {}).get("Content-Length")
+    if length and length.isdigit():
+        timings.count("http_bytes", int(length))
+    with timings.stage("json_parse"):
+        return _parse_body(response, fields)
+
+
+def _parse_body(response: requests.Response, fields: dict[str, Any] | None = None) -> dict[str, Any]:
+    if fields is None:
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise ESPNError("Invalid JSON response from ESPN") from exc
+    # Streamed: the raw body is parsed incrementally and never held in memory alongside the full tree.
+    response.raw.decode_content = True
+    try:
+        return fetch_stream.parse_pruned(response.raw, fields)
+    except (ValueError, fetch_stream.ijson.JSONError) as exc:
+        raise ESPNError("Invalid JSON response from ESPN") from exc
+    finally:
+        response.close()
+
+
 @dataclass
 class ESPNClient:
     league_id: str
     season: int
     espn_s2: str | None = None
     swid: str | None = None
-    cache: JsonCache = field(default_factory=JsonCache)
+    cache: CacheBackend = field(default_factory=JsonCache)
     timeout_seconds: int = 20
     budget: RequestBudget = field(default_factory=RequestBudget)
+    transport: HttpTransport = field(default_factory=default_transport)
+    stale_while_revalidate: bool = False
+    stream_parse: bool = False
 
     def _cookies(self) -> dict[str, str]:
         cookies: dict[str, str] = {}
@@ -73,29 +318,57 @@ class ESPNClient:
             sort_keys=True,
         )
 
-    def _request_with_fallback(
+    def _schedule_cache_key(self, endpoint: str, params: list[tuple[str, Any]]) -> str:
+        # The pro-team schedule is identical for every league in a season, so it is not keyed by league.
+        return json.dumps(
+            {
+                "season": self.season,
+                "endpoint": endpoint,
+                "params": params,
+            },
+            sort_keys=True,
+        )
+
+    def _response_with_fallback(
         self,
         endpoint: str,
         params: list[tuple[str, Any]],
         filter_header: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+        validators: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
         headers: dict[str, str] = {}
         if filter_header:
             headers["x-fantasy-filter"] = json.dumps(filter_header, separators=(",", ":"))
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        import requests
 
         bases = [PRIMARY_BASE, FALLBACK_BASE]
         last_response: requests.Response | None = None
         for idx, base in enumerate(bases):
             url = f"{base}{endpoint}"
-            response = requests.get(
-                url,
-                params=params,
-                headers=headers,
-                cookies=self._cookies(),
-                timeout=self.timeout_seconds,
-            )
+            try:
+                with timings.stage("http"):
+                    response = self.transport.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        cookies=self._cookies(),
+                        timeout=self.timeout_seconds,
+                        stream=stream,
+                    )
+            except requests.RequestException as exc:
+                raise ESPNError(f"ESPN request failed: {exc.__class__.__name__}") from exc
+            timings.count("http_requests")
             last_response = response
             if response.status_code == 403 and idx == 0:
+                if stream:
+                    response.close()
                 continue
             break
 
@@ -105,22 +378,58 @@ class ESPNClient:
             raise AuthError(f"Authentication failed ({last_response.status_code})")
         if last_response.status_code >= 400:
             raise ESPNError(f"ESPN API error ({last_response.status_code})")
+        return last_response
 
-        try:
-            return last_response.json()
-        except ValueError as exc:
-            raise ESPNError("Invalid JSON response from ESPN") from exc
+    def _request_with_fallback(
+        self,
+        endpoint: str,
+        params: list[tuple[str, Any]],
+        filter_header: dict[str, Any] | None = None,
+        fields: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        response = self._response_with_fallback(endpoint, params, filter_header, stream=fields is not None)
+        return _json_body(response, fields)
 
-    def get_league(
+    def _fetch_into_cache(
         self,
-        views: list[str],
-        *,
-        scoring_period_id: int | None = None,
-        matchup_period_id: int | None = None,
-        use_cache: bool = True,
-        cache_ttl_seconds: int = 3 * 60 * 60,
+        key: str,
+        endpoint: str,
+        params: list[tuple[str, Any]],
+        filter_header: dict[str, Any] | None,
+        ttl_seconds: int,
+        fields: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        self.budget.consume_espn()
+        # A stale entry is revalidated with the ETag/Last-Modified stored next to it instead of re-downloaded.
+        validators_key = _validators_key(key)
+        validators = self.cache.get(validators_key, ttl_seconds=REVALIDATE_WINDOW_SECONDS)
+        stream = fields is not None
+        response = self._response_with_fallback(endpoint, params, filter_header, validators, stream=stream)
+        if response.status_code == 304:
+            # Nothing to read, but a streamed response only returns its connection to the pool once closed.
+            response.close()
+            if self.cache.touch(key, ttl_seconds=ttl_seconds):
+                cached = self.cache.get(key, ttl_seconds=ttl_seconds)
+                if cached is not None:
+                    self.cache.touch(validators_key)
+                    return cached
+            # The body we revalidated is gone (purged or unreadable); fetch it unconditionally.
+            response = self._response_with_fallback(endpoint, params, filter_header, stream=stream)
+        fresh_validators = _response_validators(response)
+        payload = _json_body(response, fields)
+        self.cache.set(key, payload, ttl_seconds=ttl_seconds)
+        if fresh_validators or validators:
+            self.cache.set(validators_key, fresh_validators)
+        return payload
+
+    def _serve_stale(self, key: str, refresh: Callable[[], Any]) -> dict[str, Any] | None:
+        stale = self.cache.get(key, ttl_seconds=REVALIDATE_WINDOW_SECONDS)
+        if stale is not None:
+            _start_refresh(f"{id(self.cache)}:{key}", refresh)
+        return stale
+
+    def _league_request(
+        self, views: list[str], scoring_period_id: int | None, matchup_period_id: int | None
+    ) -> tuple[str, list[tuple[str, Any]], dict[str, Any] | None]:
         endpoint = f"/seasons/{self.season}/segments/0/leagues/{self.league_id}"
         params: list[tuple[str, Any]] = [("view", view) for view in views]
         if scoring_period_id is not None:
@@ -135,35 +444,125 @@ class ESPNClient:
                     }
                 }
             }
+        return endpoint, params, filter_header
 
-        key = self._cache_key(endpoint, params, filter_header)
-        if use_cache:
-            cached = self.cache.get(key, ttl_seconds=cache_ttl_seconds)
+    def league_cache_key(
+        self, views: list[str], *, scoring_period_id: int | None = None, matchup_period_id: int | None = None
+    ) -> str:
+        return self._cache_key(*self._league_request(views, scoring_period_id, matchup_period_id))
+
+    def _views_index_key(self, scoring_period_id: int | None, matchup_period_id: int | None) -> str:
+        # Lists every view list cached for one request shape (league, season, scoring period, matchup filter).
+        shape = self.league_cache_key([], scoring_period_id=scoring_period_id, matchup_period_id=matchup_period_id)
+        return f"league_views:{shape}"
+
+    def _cached_superset(
+        self, views: list[str], scoring_period_id: int | None, matchup_period_id: int | None, ttl_seconds: int
+    ) -> dict[str, Any] | None:
+        # ESPN views only add fields, so a fresh payload fetched with more views answers a request for fewer.
+        known = self.cache.get(self._views_index_key(scoring_period_id, matchup_period_id), REVALIDATE_WINDOW_SECONDS)
+        wanted = set(views)
+        for cached_views in known or []:
+            if not wanted < set(cached_views):
+                continue
+            key = self.league_cache_key(
+                cached_views, scoring_period_id=scoring_period_id, matchup_period_id=matchup_period_id
+            )
+            cached = self.cache.get(key, ttl_seconds=ttl_seconds)
             if cached is not None:
+                timings.count("superset_hits")
                 return cached
+        return None
 
-        payload = self._request_with_fallback(endpoint, params, filter_header)
-        if use_cache:
-            self.cache.set(key, payload)
-        return payload
+    def _remember_views(self, views: list[str], scoring_period_id: int | None, matchup_period_id: int | None) -> None:
+        key = self._views_index_key(scoring_period_id, matchup_period_id)
+        known = self.cache.get(key, REVALIDATE_WINDOW_SECONDS) or []
+        if list(views) not in known:
+            self.cache.set(key, [*known, list(views)], ttl_seconds=REVALIDATE_WINDOW_SECONDS)
+
+    def get_league(
+        self,
+        views: list[str],
+        *,
+        scoring_period_id: int | None = None,
+        matchup_period_id: int | None = None,
+        use_cache: bool = True,
+        cache_ttl_seconds: int = 3 * 60 * 60,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch a league payload. `refresh=True` skips the fresh-entry read and revalidates into the cache now.
+
+        A fresh cached payload for a superset of `views` (same scoring period and matchup filter) is served as is.
+        """
+        self.budget.consume_espn()
+        endpoint, params, filter_header = self._league_request(views, scoring_period_id, matchup_period_id)
+
+        # Opt-in: keep only the fields the analytics layer reads, parsed straight off the socket.
+        fields = fetch_stream.LEAGUE_FIELDS if self.stream_parse and fetch_stream.available() else None
+        if not use_cache:
+            return self._request_with_fallback(endpoint, params, filter_header, fields)
+
+        key = self._cache_key(endpoint, params, filter_header)
+        # Pruned payloads get their own key and are never offered as supersets: every other caller of the cache
+        # expects the full response.
+        store_key = f"pruned:v{fetch_stream.LEAGUE_FIELDS_VERSION}:{key}" if fields is not None else key
+
+        def _refresh() -> dict[str, Any]:
+            payload = self._fetch_into_cache(store_key, endpoint, params, filter_header, cache_ttl_seconds, fields)
+            if fields is None:
+                self._remember_views(views, scoring_period_id, matchup_period_id)
+            return payload
+
+        if refresh:
+            return _refresh()
+        cached = self.cache.get(store_key, ttl_seconds=cache_ttl_seconds)
+        if cached is None and fields is not None:
+            # A full payload carries every field a pruned one keeps.
+            cached = self.cache.get(key, ttl_seconds=cache_ttl_seconds)
+        if cached is None:
+            cached = self._cached_superset(views, scoring_period_id, matchup_period_id, cache_ttl_seconds)
+        if cached is not None:
+            return cached
+
+        if self.stale_while_revalidate:
+            stale = self._serve_stale(store_key, _refresh)
+            if stale is not None:
+                return stale
+        return _refresh()
 
     def get_pro_team_schedules(
         self,
         *,
         use_cache: bool = True,
         cache_ttl_seconds: int = 24 * 60 * 60,
+        refresh: bool = False,
     ) -> dict[str, Any]:
         self.budget.consume_schedule()
         endpoint = f"/seasons/{self.season}"
         params = [("view", "proTeamSchedules_wl")]
 
-        key = self._cache_key(endpoint, params, None)
-        if use_cache:
+        key = self._schedule_cache_key(endpoint, params)
+        if use_cache and not refresh:
             cached = self.cache.get(key, ttl_seconds=cache_ttl_seconds)
             if cached is not None:
                 return cached
 
-        payload = self._request_with_fallback(endpoint, params)
-        if use_cache:
-            self.cache.set(key, payload)
-        return payload
+        def _load() -> dict[str, Any]:
+            if not use_cache:
+                return self._request_with_fallback(endpoint, params)
+            with self.cache.lock(key):
+                # Another thread or process may have filled the entry while we waited.
+                cached = None if refresh else self.cache.get(key, ttl_seconds=cache_ttl_seconds)
+                if cached is not None:
+                    return cached
+                return self._fetch_into_cache(key, endpoint, params, None, cache_ttl_seconds)
+
+        def _refresh() -> dict[str, Any]:
+            # Flights are process-wide; only clients sharing a cache instance may share a leader's result.
+            return _schedule_flights.do(f"{id(self.cache)}:{use_cache}:{refresh}:{key}", _load)
+
+        if use_cache and self.stale_while_revalidate and not refresh:
+            stale = self._serve_stale(key, _refresh)
+            if stale is not None:
+                return stale
+        return _refresh()
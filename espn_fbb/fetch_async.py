@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from espn_fbb.fetch import ESPNClient
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass
+class AsyncESPNClient:
+    """Asyncio front for `ESPNClient`; requests run on worker threads through the wrapped client.
+
+    Without an `executor` the loop's default executor is used, which caps parallelism at its worker count
+    (`min(32, cpu_count + 4)`) whatever the semaphore allows.
+    """
+
+    client: ESPNClient
+    semaphore: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(DEFAULT_CONCURRENCY))
+    executor: Executor | None = None
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Like `asyncio.to_thread`, but on `executor`; the context is copied so timings reach the worker.
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+    @property
+    def league_id(self) -> str:
+        return self.client.league_id
+
+    @property
+    def season(self) -> int:
+        return self.client.season
+
+    async def get_league(
+        self,
+        views: list[str],
+        *,
+        scoring_period_id: int | None = None,
+        matchup_period_id: int | None = None,
+        use_cache: bool = True,
+        cache_ttl_seconds: int = 3 * 60 * 60,
+    ) -> dict[str, Any]:
+        async with self.semaphore:
+            return await self._run(
+                self.client.get_league,
+                views,
+                scoring_period_id=scoring_period_id,
+                matchup_period_id=matchup_period_id,
+                use_cache=use_cache,
+                cache_ttl_seconds=cache_ttl_seconds,
+            )
+
+    async def get_pro_team_schedules(
+        self,
+        *,
+        use_cache: bool = True,
+        cache_ttl_seconds: int = 24 * 60 * 60,
+    ) -> dict[str, Any]:
+        async with self.semaphore:
+            return await self._run(
+                self.client.get_pro_team_schedules,
+                use_cache=use_cache,
+                cache_ttl_seconds=cache_ttl_seconds,
+            )
+
+
+@dataclass
+class LeagueFetchResult:
+    league_id: str
+    league: dict[str, Any] | None = None
+    schedule: dict[str, Any] | None = None
+    error: Exception | None = None
+
+
+async def _fetch_one(
+    client: AsyncESPNClient,
+    views: list[str],
+    schedule: Awaitable[dict[str, Any]] | None,
+    *,
+    use_cache: bool,
+    league_ttl_seconds: int,
+) -> LeagueFetchResult:
+    result = LeagueFetchResult(league_id=client.league_id)
+    try:
+        league_task = client.get_league(views, use_cache=use_cache, cache_ttl_seconds=league_ttl_seconds)
+        if schedule is not None:
+            result.league, result.schedule = await asyncio.gather(league_task, schedule)
+        else:
+            result.league = await league_task
+    except Exception as exc:
+        # Any failure stays with its league; the other fetches in the gather carry on.
+        result.error = exc
+    return result
+
+
+async def fetch_leagues(
+    clients: list[ESPNClient],
+    views: list[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    include_schedule: bool = False,
+    use_cache: bool = True,
+    league_ttl_seconds: int = 3 * 60 * 60,
+    schedule_ttl_seconds: int = 24 * 60 * 60,
+) -> list[LeagueFetchResult]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+    # A dedicated pool, so `concurrency` is not capped by the default executor's worker count.
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="espn-fbb-fetch") as executor:
+        wrapped = [AsyncESPNClient(client=client, semaphore=semaphore, executor=executor) for client in clients]
+        # The pro-team schedule is season-wide: fetch it once per season and share it between that season's leagues.
+        schedules: dict[int, asyncio.Task[dict[str, Any]]] = {}
+        if include_schedule:
+            for client in wrapped:
+                if client.season not in schedules:
+                    schedules[client.season] = asyncio.ensure_future(
+                        client.get_pro_team_schedules(use_cache=use_cache, cache_ttl_seconds=schedule_ttl_seconds)
+                    )
+        return list(
+            await asyncio.gather(
+                *(
+                    _fetch_one(
+                        client,
+                        views,
+                        schedules.get(client.season),
+                        use_cache=use_cache,
+                        league_ttl_seconds=league_ttl_seconds,
+                    )
+                    for client in wrapped
+                )
+            )
+        )
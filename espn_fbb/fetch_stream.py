@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, BinaryIO, Iterator
+
+from espn_fbb.utils import UNLOADED, optional_import
+
+# Imported on first use, so runs without --stream-parse never pay for it.
+ijson: Any = UNLOADED
+
+# Field specs: `_ALL` keeps a whole subtree, a dict keeps only the listed keys, and a spec applied to an array is
+# applied to each element. Everything else (appliedStats, ratings, ownership, per-matchup rosters, ...) is skipped
+# as it streams past and never becomes a Python object.
+_ALL = True
+_SIDE = {"teamId": _ALL, "cumulativeScore": _ALL, "totalPoints": _ALL, "pointsByStat": _ALL}
+_STAT_ROW = {"statSourceId": _ALL, "statSplitTypeId": _ALL, "seasonId": _ALL, "scoringPeriodId": _ALL, "stats": _ALL}
+_PLAYER = {
+    "id": _ALL,
+    "fullName": _ALL,
+    "proTeamId": _ALL,
+    "injuryStatus": _ALL,
+    "eligibleSlots": _ALL,
+    "stats": _STAT_ROW,
+}
+_ENTRY = {"playerId": _ALL, "lineupSlotId": _ALL, "playerPoolEntry": {"id": _ALL, "player": _PLAYER}}
+_TEAM = {
+    "id": _ALL,
+    "name": _ALL,
+    "location": _ALL,
+    "nickname": _ALL,
+    "abbrev": _ALL,
+    "record": _ALL,
+    "rankCalculatedFinal": _ALL,
+    "overallRank": _ALL,
+    "playoffSeed": _ALL,
+    "seed": _ALL,
+    "roster": {"entries": _ENTRY},
+}
+# Tags cached pruned payloads; bump whenever LEAGUE_FIELDS changes so older pruned entries stop matching.
+LEAGUE_FIELDS_VERSION = 1
+LEAGUE_FIELDS: dict[str, Any] = {
+    "id": _ALL,
+    "seasonId": _ALL,
+    "scoringPeriodId": _ALL,
+    "status": _ALL,
+    "settings": {"scheduleSettings": _ALL, "rosterSettings": {"lineupSlotCounts": _ALL}},
+    "schedule": {"id": _ALL, "matchupPeriodId": _ALL, "home": _SIDE, "away": _SIDE},
+    "teams": _TEAM,
+}
+
+
+def available() -> bool:
+    global ijson
+    if ijson is UNLOADED:
+        ijson = optional_import("ijson")
+    return ijson is not None
+
+
+def _skip(events: Iterator[tuple[str, Any]], event: str) -> None:
+    if event not in ("start_map", "start_array"):
+        return
+    depth = 1
+    for event, _ in events:
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _value(events: Iterator[tuple[str, Any]], event: str, value: Any, spec: Any) -> Any:
+    if event == "start_map":
+        out: dict[str, Any] = {}
+        for event, value in events:
+            if event == "end_map":
+                return out
+            sub = spec if spec is _ALL else spec.get(value)
+            key = value
+            event, value = next(events)
+            if sub is None:
+                _skip(events, event)
+            else:
+                out[key] = _value(events, event, value, sub)
+    if event == "start_array":
+        items: list[Any] = []
+        for event, value in events:
+            if event == "end_array":
+                return items
+            items.append(_value(events, event, value, spec))
+    return value
+
+
+def parse_pruned(fp: BinaryIO, fields: dict[str, Any] = LEAGUE_FIELDS) -> Any:
+    """Stream-parse a JSON document, building only the subtrees named in `fields`."""
+    if not available():
+        raise ImportError("Streaming parse requires ijson (install the 'stream' extra)")
+    events = iter(ijson.basic_parse(fp, use_float=True))
+    event, value = next(events)
+    return _value(events, event, value, fields)
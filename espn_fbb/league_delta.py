@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Top-level keys a delta payload refreshes outright; everything else (settings, members, ...) comes from the base.
+_DELTA_TOP_LEVEL_KEYS = ("status", "scoringPeriodId")
+
+
+def _matchup_key(row: dict[str, Any]) -> Any:
+    if row.get("id") is not None:
+        return ("id", row["id"])
+    home = (row.get("home") or {}).get("teamId")
+    away = (row.get("away") or {}).get("teamId")
+    return ("teams", row.get("matchupPeriodId"), home, away)
+
+
+def _stat_row_key(row: dict[str, Any]) -> tuple[Any, ...]:
+    return (row.get("statSourceId"), row.get("statSplitTypeId"), row.get("seasonId"), row.get("scoringPeriodId"))
+
+
+def _entry_player_id(entry: dict[str, Any]) -> Any:
+    return entry.get("playerId", ((entry.get("playerPoolEntry") or {}).get("player") or {}).get("id"))
+
+
+def _merge_stats(base_stats: Any, delta_stats: Any) -> list[dict[str, Any]]:
+    # Delta rows go first: stat lookups keep the first row seen for a key.
+    delta_rows = [row for row in delta_stats or [] if isinstance(row, dict)]
+    seen = {_stat_row_key(row) for row in delta_rows}
+    return delta_rows + [row for row in base_stats or [] if isinstance(row, dict) and _stat_row_key(row) not in seen]
+
+
+def _merge_entry(base_entry: dict[str, Any] | None, delta_entry: dict[str, Any]) -> dict[str, Any]:
+    base_player = ((base_entry or {}).get("playerPoolEntry") or {}).get("player") or {}
+    delta_pool = delta_entry.get("playerPoolEntry") or {}
+    delta_player = delta_pool.get("player") or {}
+    if not base_player or not delta_player:
+        return delta_entry
+    player = {**base_player, **delta_player, "stats": _merge_stats(base_player.get("stats"), delta_player.get("stats"))}
+    return {**delta_entry, "playerPoolEntry": {**delta_pool, "player": player}}
+
+
+def _merge_team(base_team: dict[str, Any], delta_team: dict[str, Any]) -> dict[str, Any]:
+    merged = {**base_team, **delta_team}
+    delta_entries = (delta_team.get("roster") or {}).get("entries")
+    if not isinstance(delta_entries, list):
+        merged["roster"] = base_team.get("roster")
+        return merged
+    # The delta roster is authoritative for who is rostered and where; base rows keep the stat history.
+    base_entries = {_entry_player_id(e): e for e in (base_team.get("roster") or {}).get("entries") or []}
+    entries = [_merge_entry(base_entries.get(_entry_player_id(e)), e) for e in delta_entries]
+    merged["roster"] = {**(delta_team.get("roster") or {}), "entries": entries}
+    return merged
+
+
+def merge_league_delta(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Overlay a current-period league payload onto a cached full one without mutating either."""
+    merged = dict(base)
+    for key in _DELTA_TOP_LEVEL_KEYS:
+        if key in delta:
+            merged[key] = delta[key]
+
+    delta_rows = {_matchup_key(row): row for row in delta.get("schedule") or [] if isinstance(row, dict)}
+    schedule = [delta_rows.pop(_matchup_key(row), row) for row in base.get("schedule") or []]
+    merged["schedule"] = schedule + list(delta_rows.values())
+
+    delta_teams = {team.get("id"): team for team in delta.get("teams") or [] if isinstance(team, dict)}
+    merged["teams"] = [
+        _merge_team(team, delta_teams[team.get("id")]) if team.get("id") in delta_teams else team
+        for team in base.get("teams") or []
+    ]
+    return merged
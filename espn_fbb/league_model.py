@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from espn_fbb.analytics_base import (
+    PlayerStatIndex,
+    PlayerStats,
+    _fantasy_team_name,
+    _normalize_injury_status,
+    _roster_entries,
+    _team_map,
+    _team_standing,
+    _to_int,
+)
+from espn_fbb.schema import TeamStanding
+
+
+def _optional_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class Player:
+    id: int
+    name: str
+    pro_team_id: int | None
+    status: str
+    status_raw: str | None
+    out: bool
+    eligible_slots: frozenset[int] | None
+    raw: dict[str, Any]
+    stats_index: PlayerStatIndex
+    _stats: PlayerStats | None = None
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any], stats_index: PlayerStatIndex) -> Player:
+        status, status_raw = _normalize_injury_status(raw.get("injuryStatus"))
+        pro_team_id = raw.get("proTeamId")
+        eligible_raw = raw.get("eligibleSlots")
+        return cls(
+            id=_to_int(raw.get("id"), 0),
+            name=str(raw.get("fullName", "Unknown")),
+            pro_team_id=None if pro_team_id is None else _to_int(pro_team_id, -1),
+            status=status,
+            status_raw=status_raw,
+            out=str(raw.get("injuryStatus", "")).upper() == "OUT",
+            eligible_slots=frozenset(_to_int(s, -1) for s in eligible_raw)
+            if isinstance(eligible_raw, list) and eligible_raw
+            else None,
+            raw=raw,
+            stats_index=stats_index,
+        )
+
+    @property
+    def stats(self) -> PlayerStats:
+        # Stat rows are the expensive part of a player; parse them only for players a command actually reads.
+        if self._stats is None:
+            self._stats = self.stats_index.player(self.raw)
+        return self._stats
+
+    def games(self, games_by_pro_team: dict[int, int]) -> int:
+        if self.pro_team_id is None:
+            return 0
+        return games_by_pro_team.get(self.pro_team_id, 0)
+
+
+@dataclass(slots=True)
+class RosterEntry:
+    # None when ESPN omits the slot or sends something unparseable; `slot` and the roster output pick the fallback.
+    lineup_slot_id: int | None
+    player: Player
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any], stats_index: PlayerStatIndex) -> RosterEntry:
+        player = (raw.get("playerPoolEntry") or {}).get("player") or {}
+        return cls(lineup_slot_id=_optional_int(raw.get("lineupSlotId")), player=Player.from_raw(player, stats_index))
+
+    @property
+    def slot(self) -> int:
+        return -1 if self.lineup_slot_id is None else self.lineup_slot_id
+
+
+@dataclass(slots=True)
+class Team:
+    id: int
+    name: str | None
+    standing: TeamStanding | None
+    entries: list[RosterEntry]
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any], stats_index: PlayerStatIndex | None = None) -> Team:
+        stats_index = stats_index or PlayerStatIndex()
+        return cls(
+            id=_to_int(raw.get("id"), -1),
+            name=_fantasy_team_name(raw),
+            standing=_team_standing(raw),
+            entries=[RosterEntry.from_raw(entry, stats_index) for entry in _roster_entries(raw)],
+        )
+
+
+@dataclass(slots=True)
+class Matchup:
+    matchup_period_id: int
+    home_team_id: int
+    away_team_id: int
+    home: dict[str, Any]
+    away: dict[str, Any]
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any]) -> Matchup:
+        home = raw.get("home") or {}
+        away = raw.get("away") or {}
+        return cls(
+            matchup_period_id=_to_int(raw.get("matchupPeriodId", -1), -1),
+            home_team_id=_to_int(home.get("teamId", -1), -1),
+            away_team_id=_to_int(away.get("teamId", -1), -1),
+            home=home,
+            away=away,
+        )
+
+
+@dataclass(slots=True)
+class League:
+    """Typed view of a league payload; teams are normalized on first use, so unused rosters are never parsed."""
+
+    payload: dict[str, Any]
+    matchups: list[Matchup]
+    team_rows: dict[int, dict[str, Any]]
+    stats_index: PlayerStatIndex = field(default_factory=PlayerStatIndex)
+    teams: dict[int, Team] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> League:
+        matchups = [Matchup.from_raw(row) for row in payload.get("schedule", [])]
+        return cls(payload=payload, matchups=matchups, team_rows=_team_map(payload))
+
+    def team(self, team_id: int) -> Team:
+        team = self.teams.get(team_id)
+        if team is None:
+            team = self.teams[team_id] = Team.from_raw(self.team_rows.get(team_id, {}), self.stats_index)
+        return team
+
+    def find_matchup(self, team_id: int, matchup_period_id: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        for matchup in self.matchups:
+            if matchup.matchup_period_id != matchup_period_id:
+                continue
+            if matchup.home_team_id == team_id:
+                return matchup.home, matchup.away
+            if matchup.away_team_id == team_id:
+                return matchup.away, matchup.home
+        raise ValueError(f"No matchup found for team_id={team_id} matchup_period_id={matchup_period_id}")
+
+
+def _as_league(league: League | dict[str, Any]) -> League:
+    if isinstance(league, League):
+        return league
+    return League.from_payload(league)
+
+
+def _as_team(team: Team | dict[str, Any], stats_index: PlayerStatIndex | None = None) -> Team:
+    if isinstance(team, Team):
+        return team
+    return Team.from_raw(team, stats_index)
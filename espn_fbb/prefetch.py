@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterable
+
+from espn_fbb import timings
+from espn_fbb.analytics_schedule import ScheduleIndex
+from espn_fbb.cache import CacheBackend
+from espn_fbb.commands import (
+    LEAGUE_TTL_SECONDS,
+    MATCHUP_VIEWS,
+    RECAP_VIEWS,
+    SCHEDULE_TTL_SECONDS,
+    exit_code_for,
+    load_schedule_index,
+    schedule_index_key,
+)
+from espn_fbb.config import DEFAULT_CONFIG_PATH, _read_toml, load_batch_config, load_config
+from espn_fbb.fetch import REVALIDATE_WINDOW_SECONDS, ESPNClient, RequestBudget, RequestLimitError
+from espn_fbb.utils import ET_ZONE, iso_ts
+
+DEFAULT_LEAD_SECONDS = 10 * 60
+# ESPN has final box scores for the night's late West Coast games in by this ET hour the next morning.
+DEFAULT_STATS_FINAL_HOUR = 3
+DEFAULT_MAX_LEAGUE_REQUESTS = 4
+DEFAULT_MAX_SCHEDULE_REQUESTS = 1
+
+
+@dataclass(frozen=True)
+class PrefetchTarget:
+    """One cached league payload to keep warm: a league/season and the view list a command fetches."""
+
+    league_id: str
+    season: int
+    views: tuple[str, ...]
+    espn_s2: str | None = None
+    swid: str | None = None
+
+
+@dataclass(frozen=True)
+class PrefetchTask:
+    due_at: float
+    kind: str  # "league" or "schedule"
+    reason: str  # "missing", "ttl" or "stats_final"
+    target: PrefetchTarget
+
+    def describe(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"kind": self.kind, "season": self.target.season}
+        if self.kind == "league":
+            out["league_id"] = self.target.league_id
+            out["views"] = list(self.target.views)
+        out["reason"] = self.reason
+        out["due_at"] = iso_ts(datetime.fromtimestamp(self.due_at, tz=ET_ZONE))
+        return out
+
+
+def targets_from_config(config_path: Path | None = None) -> list[PrefetchTarget]:
+    """Batch `[[jobs]]` configs warm each job's payload; a single-league config warms recap and matchup."""
+    if "jobs" in _read_toml(config_path or DEFAULT_CONFIG_PATH):
+        jobs = load_batch_config(config_path=config_path)
+        targets = [
+            PrefetchTarget(
+                league_id=job.league_id,
+                season=job.season,
+                views=tuple(RECAP_VIEWS if job.command == "recap" else MATCHUP_VIEWS),
+                espn_s2=job.espn_s2,
+                swid=job.swid,
+            )
+            for job in jobs
+        ]
+    else:
+        cfg = load_config(config_path=config_path)
+        targets = [
+            PrefetchTarget(cfg.league_id, cfg.season, tuple(views), cfg.espn_s2, cfg.swid)
+            for views in (RECAP_VIEWS, MATCHUP_VIEWS)
+        ]
+    # Jobs for different teams in one league share a payload.
+    return list(dict.fromkeys(targets))
+
+
+def stats_final_times(game_dates: Iterable[date], hour: int = DEFAULT_STATS_FINAL_HOUR) -> list[float]:
+    """Epoch seconds at which each game night's stats are final: `hour` ET on the following morning."""
+    mornings = {day + timedelta(days=1) for day in game_dates}
+    return sorted(datetime(day.year, day.month, day.day, hour, tzinfo=ET_ZONE).timestamp() for day in mornings)
+
+
+def _covering(targets: list[PrefetchTarget]) -> list[PrefetchTarget]:
+    # A cached superset-view payload also answers smaller view lists (see `ESPNClient.get_league`).
+    def covered(target: PrefetchTarget) -> bool:
+        league = (target.league_id, target.season)
+        return any(
+            (other.league_id, other.season) == league and set(target.views) < set(other.views) for other in targets
+        )
+
+    return [target for target in targets if not covered(target)]
+
+
+@dataclass
+class PrefetchScheduler:
+    """Plans and runs cache refreshes ahead of TTL expiry and right after each game night's stats go final.
+
+    A league payload is due `lead_seconds` before its TTL runs out, or at the first stats-final boundary after it
+    was fetched, whichever comes first. Refreshes revalidate with the stored ETag, so an unchanged payload costs a
+    304. Each `run` spends at most `max_league_requests`/`max_schedule_requests`; the rest waits for the next run.
+    """
+
+    cache: CacheBackend
+    max_league_requests: int = DEFAULT_MAX_LEAGUE_REQUESTS
+    max_schedule_requests: int = DEFAULT_MAX_SCHEDULE_REQUESTS
+    lead_seconds: float = DEFAULT_LEAD_SECONDS
+    stats_final_hour: int = DEFAULT_STATS_FINAL_HOUR
+    client_options: dict[str, Any] = field(default_factory=dict)
+
+    def _client(self, target: PrefetchTarget, budget: RequestBudget | None = None) -> ESPNClient:
+        return ESPNClient(
+            league_id=target.league_id,
+            season=target.season,
+            espn_s2=target.espn_s2,
+            swid=target.swid,
+            cache=self.cache,
+            budget=budget or RequestBudget(),
+            **self.client_options,
+        )
+
+    def _due(
+        self, created_at: float | None, ttl_seconds: int, boundaries: list[float], now: float
+    ) -> tuple[float, str]:
+        if created_at is None:
+            return now, "missing"
+        due, reason = created_at + ttl_seconds - self.lead_seconds, "ttl"
+        # The first game night that went final after this payload was fetched.
+        idx = bisect.bisect_right(boundaries, created_at)
+        if idx < len(boundaries) and boundaries[idx] < due:
+            due, reason = boundaries[idx], "stats_final"
+        return due, reason
+
+    def plan(self, targets: Iterable[PrefetchTarget], now: float | None = None) -> list[PrefetchTask]:
+        """Every target's next refresh, plus one schedule refresh per season, ordered by due time."""
+        now = time.time() if now is None else now
+        targets = _covering(list(dict.fromkeys(targets)))
+        tasks = []
+        boundaries: dict[int, list[float]] = {}
+        # The schedule is season-wide; any target of the season can fetch it.
+        for target in {target.season: target for target in targets}.values():
+            # Stale-but-present entries still tell us when they were fetched, so read within the revalidate window.
+            entry = self.cache.get_entry(schedule_index_key(target.season), ttl_seconds=REVALIDATE_WINDOW_SECONDS)
+            index = ScheduleIndex.from_dict(entry.value) if entry is not None else None
+            dates = index.scoring_period_dates().values() if index is not None else ()
+            boundaries[target.season] = stats_final_times(dates, self.stats_final_hour)
+            created_at = entry.created_at if index is not None else None
+            due, reason = self._due(created_at, SCHEDULE_TTL_SECONDS, [], now)
+            tasks.append(PrefetchTask(due, "schedule", reason, target))
+        for target in targets:
+            key = self._client(target).league_cache_key(list(target.views))
+            entry = self.cache.get_entry(key, ttl_seconds=REVALIDATE_WINDOW_SECONDS)
+            created_at = entry.created_at if entry is not None else None
+            due, reason = self._due(created_at, LEAGUE_TTL_SECONDS, boundaries[target.season], now)
+            tasks.append(PrefetchTask(due, "league", reason, target))
+        # Schedules first on ties: they define the game nights the league refreshes line up with.
+        return sorted(tasks, key=lambda task: (task.due_at, task.kind != "schedule"))
+
+    def next_due(self, targets: Iterable[PrefetchTarget], now: float | None = None) -> float | None:
+        tasks = self.plan(targets, now)
+        return tasks[0].due_at if tasks else None
+
+    def run(self, targets: Iterable[PrefetchTarget], now: float | None = None) -> list[dict[str, Any]]:
+        """Refresh every due entry within the request budget; returns one status line per planned task."""
+        now = time.time() if now is None else now
+        budget = RequestBudget(
+            max_espn_requests=self.max_league_requests, max_schedule_requests=self.max_schedule_requests
+        )
+        lines = []
+        for task in self.plan(targets, now):
+            line = task.describe()
+            lines.append(line)
+            if task.due_at > now:
+                line["status"] = "scheduled"
+                continue
+            client = self._client(task.target, budget)
+            try:
+                with timings.stage(f"prefetch_{task.kind}"):
+                    if task.kind == "schedule":
+                        load_schedule_index(client, refresh=True)
+                    else:
+                        client.get_league(list(task.target.views), cache_ttl_seconds=LEAGUE_TTL_SECONDS, refresh=True)
+                line["status"] = "refreshed"
+            except RequestLimitError:
+                line["status"] = "deferred"
+            except Exception as exc:
+                line["status"] = "error"
+                line["exit_code"] = exit_code_for(exc)
+                line["error"] = str(exc)
+        return lines
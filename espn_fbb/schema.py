@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class CategoryStat(BaseModel):
+class _Model(BaseModel):
+    # Validators/serializers are built on first use instead of at import, which keeps CLI startup and --help fast.
+    model_config = ConfigDict(defer_build=True)
+
+
+class CategoryStat(_Model):
     key: str
     you: float
     opp: float
@@ -11,38 +16,40 @@ class CategoryStat(BaseModel):
     status: str
 
 
-class CategorySignal(BaseModel):
+class CategorySignal(_Model):
     key: str
     pdiff: float
 
 
-class Mover(BaseModel):
+class Mover(_Model):
     key: str
     kind: str
     delta_margin: float
     today_margin: float
     yesterday_margin: float
+    # Margin change since the earliest stored snapshot of this matchup period; null without one.
+    period_delta_margin: float | None = None
 
 
-class RosterMeta(BaseModel):
+class RosterMeta(_Model):
     source_scoring_period_id: int
     has_data: bool
     note: str | None = None
 
 
-class GamesBreakdown(BaseModel):
+class GamesBreakdown(_Model):
     you_total_games: int
     opp_total_games: int
     games_diff: int
 
 
-class GamesRemainingBreakdown(BaseModel):
+class GamesRemainingBreakdown(_Model):
     you_remaining_games: int
     opp_remaining_games: int
     games_remaining_diff: int
 
 
-class LineupAction(BaseModel):
+class LineupAction(_Model):
     type: str
     out_player_id: int
     out_player_name: str
@@ -53,7 +60,29 @@ class LineupAction(BaseModel):
     score: int
 
 
-class CategoryProjection(BaseModel):
+class SlotAssignment(_Model):
+    slot_id: int
+    slot: str
+    player_id: int
+    player_name: str
+
+
+class DailyLineup(_Model):
+    scoring_period_id: int
+    date: str | None = None
+    starters: list[SlotAssignment]
+    benched_player_ids: list[int]
+
+
+class LineupPlan(_Model):
+    games_started: int
+    baseline_games_started: int
+    expected_category_wins: float
+    baseline_expected_category_wins: float
+    days: list[DailyLineup]
+
+
+class CategoryProjection(_Model):
     projected_you: float
     projected_opp: float
     projected_margin: float
@@ -62,7 +91,7 @@ class CategoryProjection(BaseModel):
     projected_signal: str
 
 
-class CategoryOutlook(BaseModel):
+class CategoryOutlook(_Model):
     current_you: float
     current_opp: float
     current_margin: float
@@ -77,14 +106,14 @@ class CategoryOutlook(BaseModel):
     projected_signal: str
 
 
-class SummaryHints(BaseModel):
+class SummaryHints(_Model):
     closest_categories: list[str] = Field(default_factory=list)
     biggest_advantages: list[str] = Field(default_factory=list)
     biggest_disadvantages: list[str] = Field(default_factory=list)
     swing_categories: list[str] = Field(default_factory=list)
 
 
-class SeasonAverages(BaseModel):
+class SeasonAverages(_Model):
     pts: float | None = None
     threes: float | None = None
     reb: float | None = None
@@ -96,7 +125,7 @@ class SeasonAverages(BaseModel):
     ft_pct: float | None = None
 
 
-class PeriodStats(BaseModel):
+class PeriodStats(_Model):
     pts: float | None = None
     threes: float | None = None
     reb: float | None = None
@@ -108,7 +137,7 @@ class PeriodStats(BaseModel):
     ft_pct: float | None = None
 
 
-class RecapRosterEntry(BaseModel):
+class RecapRosterEntry(_Model):
     player_id: int
     player_name: str
     lineup_slot_id: int
@@ -119,7 +148,7 @@ class RecapRosterEntry(BaseModel):
     period_stats: PeriodStats | None = None
 
 
-class PreviewRosterEntry(BaseModel):
+class PreviewRosterEntry(_Model):
     player_id: int
     player_name: str
     lineup_slot_id: int
@@ -130,7 +159,7 @@ class PreviewRosterEntry(BaseModel):
     games_total: int | None = None
 
 
-class OutlookRosterEntry(BaseModel):
+class OutlookRosterEntry(_Model):
     player_id: int
     player_name: str
     lineup_slot_id: int
@@ -142,22 +171,22 @@ class OutlookRosterEntry(BaseModel):
     games_remaining: int | None = None
 
 
-class RecapRosterGroup(BaseModel):
+class RecapRosterGroup(_Model):
     you: list[RecapRosterEntry] = Field(default_factory=list)
     opp: list[RecapRosterEntry] = Field(default_factory=list)
 
 
-class PreviewRosterGroup(BaseModel):
+class PreviewRosterGroup(_Model):
     you: list[PreviewRosterEntry] = Field(default_factory=list)
     opp: list[PreviewRosterEntry] = Field(default_factory=list)
 
 
-class OutlookRosterGroup(BaseModel):
+class OutlookRosterGroup(_Model):
     you: list[OutlookRosterEntry] = Field(default_factory=list)
     opp: list[OutlookRosterEntry] = Field(default_factory=list)
 
 
-class RecapResponse(BaseModel):
+class RecapResponse(_Model):
     generated_at: str
     league_id: str
     team_id: int
@@ -173,7 +202,7 @@ class RecapResponse(BaseModel):
     active_players: dict[str, int]
 
 
-class DataQuality(BaseModel):
+class DataQuality(_Model):
     projection_basis: str
     projection_used: bool
     season_id: int
@@ -182,7 +211,7 @@ class DataQuality(BaseModel):
     opp_starters_missing_season_stats: int
 
 
-class TeamStanding(BaseModel):
+class TeamStanding(_Model):
     rank: int | None = None
     wins: int | None = None
     losses: int | None = None
@@ -190,7 +219,7 @@ class TeamStanding(BaseModel):
     percentage: float | None = None
 
 
-class PreviewResponse(BaseModel):
+class PreviewResponse(_Model):
     schema_version: str
     command: str
     generated_at: str
@@ -207,12 +236,29 @@ class PreviewResponse(BaseModel):
     categories: dict[str, CategoryProjection]
     games: GamesBreakdown
     lineup_actions: list[LineupAction]
+    lineup_plan: LineupPlan | None = None
     summary_hints: SummaryHints
     data_quality: DataQuality
     outlook: dict[str, str]
 
 
-class OutlookResponse(BaseModel):
+class CategoryWinProbability(_Model):
+    win: float
+    tie: float
+    loss: float
+
+
+class WinProbability(_Model):
+    simulations: int
+    seed: int
+    win: float
+    tie: float
+    loss: float
+    expected_category_wins: float
+    categories: dict[str, CategoryWinProbability]
+
+
+class OutlookResponse(_Model):
     schema_version: str
     command: str
     generated_at: str
@@ -232,3 +278,15 @@ class OutlookResponse(BaseModel):
     summary_hints: SummaryHints
     data_quality: DataQuality
     outlook: dict[str, str]
+    win_probability: WinProbability | None = None
+
+
+class ReportResponse(_Model):
+    schema_version: str
+    command: str
+    generated_at: str
+    league_id: str
+    team_id: int
+    recap: RecapResponse
+    preview: PreviewResponse
+    outlook: OutlookResponse
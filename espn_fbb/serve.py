@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from espn_fbb.analytics_schedule import ScheduleIndex
+from espn_fbb.cache import CacheBackend
+from espn_fbb.commands import (
+    MATCHUP_VIEWS,
+    RECAP_VIEWS,
+    SCHEDULE_TTL_SECONDS,
+    SNAPSHOT_RETENTION_DAYS,
+    exit_code_for,
+    load_schedule_index,
+    run_outlook,
+    run_preview,
+    run_recap,
+    run_report,
+)
+from espn_fbb.config import AppConfig, ConfigError, load_config
+from espn_fbb.fetch import ESPNClient
+from espn_fbb.prefetch import PrefetchScheduler, PrefetchTarget
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_REFRESH_SECONDS = 30 * 60
+# How long the refresh loop waits before retrying work that is already due (deferred by the budget, or failed).
+RETRY_SECONDS = 5 * 60
+ROUTES = {"/recap": "recap", "/matchup/preview": "preview", "/matchup/outlook": "outlook", "/report": "report"}
+HTTP_STATUS_FOR_EXIT_CODE = {2: 400, 3: 401, 4: 502, 5: 500}
+# Simulation arrays are (simulations x players) float64 per category and are built on the request thread.
+MAX_SIMULATIONS = 100_000
+
+
+def _int_param(params: dict[str, str], name: str) -> int | None:
+    if name not in params:
+        return None
+    try:
+        return int(params[name])
+    except ValueError as exc:
+        raise ConfigError(f"{name} must be an integer") from exc
+
+
+def _simulations(params: dict[str, str]) -> int:
+    simulations = _int_param(params, "simulate") or 0
+    if not 0 <= simulations <= MAX_SIMULATIONS:
+        raise ConfigError(f"simulate must be between 0 and {MAX_SIMULATIONS}")
+    return simulations
+
+
+@dataclass
+class LeagueService:
+    """Answers recap/preview/outlook queries from one warm process.
+
+    Parsed payloads stay in the cache's memory tier, compiled schedule indexes in `_schedules`, and HTTP
+    connections in the shared transport. Each query gets a fresh `ESPNClient`, so request budgets stay per query.
+    """
+
+    cache: CacheBackend
+    config_path: Path | None = None
+    client_options: dict[str, Any] = field(default_factory=dict)
+    prefetch_options: dict[str, Any] = field(default_factory=dict)
+    prefetcher: PrefetchScheduler = field(init=False, repr=False)
+    _schedules: dict[int, tuple[float, ScheduleIndex]] = field(default_factory=dict, init=False, repr=False)
+    # (league_id, season) -> (config, view lists) for every league served so far; the refresh loop keeps them warm.
+    _leagues: dict[tuple[str, int], tuple[AppConfig, set[tuple[str, ...]]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.prefetcher = PrefetchScheduler(self.cache, client_options=self.client_options, **self.prefetch_options)
+
+    def _client(self, cfg: AppConfig) -> ESPNClient:
+        return ESPNClient(
+            league_id=cfg.league_id,
+            season=cfg.season,
+            espn_s2=cfg.espn_s2,
+            swid=cfg.swid,
+            cache=self.cache,
+            **self.client_options,
+        )
+
+    def watch(self, cfg: AppConfig, views: list[str]) -> None:
+        with self._lock:
+            _, known = self._leagues.setdefault((cfg.league_id, cfg.season), (cfg, set()))
+            known.add(tuple(views))
+
+    def targets(self) -> list[PrefetchTarget]:
+        with self._lock:
+            leagues = [(cfg, sorted(view_lists)) for cfg, view_lists in self._leagues.values()]
+        # Recap and matchup view lists are separate cache entries; warm each one this league has been asked for.
+        return [
+            PrefetchTarget(cfg.league_id, cfg.season, views, cfg.espn_s2, cfg.swid)
+            for cfg, view_lists in leagues
+            for views in view_lists
+        ]
+
+    def schedule(self, client: ESPNClient) -> ScheduleIndex:
+        with self._lock:
+            entry = self._schedules.get(client.season)
+        if entry is not None and time.monotonic() - entry[0] < SCHEDULE_TTL_SECONDS:
+            return entry[1]
+        index = load_schedule_index(client)
+        with self._lock:
+            self._schedules[client.season] = (time.monotonic(), index)
+        return index
+
+    def query(self, command: str, params: dict[str, str]) -> str:
+        """Run one command and return its JSON body, exactly as the CLI prints it."""
+        cfg = load_config(
+            config_path=self.config_path,
+            league_id=params.get("league_id"),
+            team_id=_int_param(params, "team_id"),
+            season=_int_param(params, "season"),
+        )
+        client = self._client(cfg)
+        if command == "recap":
+            self.watch(cfg, RECAP_VIEWS)
+            model = run_recap(client, self.cache, cfg.team_id)
+        elif command == "preview":
+            self.watch(cfg, MATCHUP_VIEWS)
+            model = run_preview(client, cfg.team_id, schedule=self.schedule(client))
+        elif command == "report":
+            self.watch(cfg, MATCHUP_VIEWS)
+            model = run_report(
+                client,
+                self.cache,
+                cfg.team_id,
+                schedule=self.schedule(client),
+                simulations=_simulations(params),
+                seed=_int_param(params, "seed") or 0,
+            )
+        else:
+            self.watch(cfg, MATCHUP_VIEWS)
+            model = run_outlook(
+                client,
+                cfg.team_id,
+                schedule=self.schedule(client),
+                simulations=_simulations(params),
+                seed=_int_param(params, "seed") or 0,
+            )
+        return model.model_dump_json()
+
+    def refresh(self) -> list[dict[str, Any]]:
+        """Run every prefetch that is due for the watched leagues; returns the failures."""
+        lines = self.prefetcher.run(self.targets())
+        for line in lines:
+            if line["kind"] == "schedule" and line["status"] == "refreshed":
+                # The next query reloads the freshly cached index.
+                with self._lock:
+                    self._schedules.pop(line["season"], None)
+        self.cache.purge_old_snapshots(retention_days=SNAPSHOT_RETENTION_DAYS)
+        return [line for line in lines if line["status"] == "error"]
+
+    def refresh_delay(self, max_seconds: float) -> float:
+        """Seconds until the next prefetch is due, capped at `max_seconds`."""
+        due = self.prefetcher.next_due(self.targets())
+        if due is None:
+            return max_seconds
+        delay = due - time.time()
+        return min(max_seconds, delay if delay > 0 else RETRY_SECONDS)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _HTTPServer | _UnixServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/healthz":
+            self._send(200, json.dumps({"status": "ok"}))
+            return
+        command = ROUTES.get(url.path)
+        if command is None:
+            self._send(404, json.dumps({"error": f"Unknown path: {url.path}"}))
+            return
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            body = self.server.service.query(command, params)
+        except Exception as exc:
+            code = exit_code_for(exc)
+            message = str(exc) if code != 5 else f"Unexpected runtime error: {exc}"
+            self._send(HTTP_STATUS_FOR_EXIT_CODE[code], json.dumps({"error": message}))
+            return
+        self._send(200, body)
+
+    def _send(self, status: int, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix-socket peers have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        sys.stderr.write(f"{self.address_string()} {format % args}\n")
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: LeagueService) -> None:
+        self.service = service
+        super().__init__(address, _Handler)
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, service: LeagueService) -> None:
+        self.service = service
+        path.unlink(missing_ok=True)
+        super().__init__(str(path), _Handler)
+        # The daemon answers with the configured credentials; keep the socket private to this user.
+        os.chmod(path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+def make_server(
+    service: LeagueService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    if socket_path is not None:
+        return _UnixServer(socket_path, service)
+    return _HTTPServer((host, port), service)
+
+
+def _refresh_loop(service: LeagueService, interval_seconds: float, stop: threading.Event) -> None:
+    # Wake when the next prefetch is due (TTL edge or a game night going final), at least every `interval_seconds`.
+    while not stop.wait(service.refresh_delay(interval_seconds)):
+        for error in service.refresh():
+            sys.stderr.write(json.dumps({"refresh": error}) + "\n")
+
+
+def run(server: socketserver.BaseServer, service: LeagueService, refresh_seconds: float) -> None:
+    """Serve until interrupted, prefetching for watched leagues at least every `refresh_seconds` (0 disables it)."""
+    stop = threading.Event()
+    if refresh_seconds > 0:
+        threading.Thread(
+            target=_refresh_loop, args=(service, refresh_seconds, stop), name="espn-fbb-refresh-loop", daemon=True
+        ).start()
+    if threading.current_thread() is threading.main_thread():
+        # Service managers stop daemons with SIGTERM; unwind through `finally` so the socket file is removed.
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import bisect
+import os
+import struct
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from espn_fbb import timings
+from espn_fbb.cache import flock_path, key_digest
+
+SNAPSHOT_DIRNAME = "snapshots"
+SERIES_SUFFIX = ".snap"
+SERIES_MAGIC = b"EFBS"
+SERIES_VERSION = 1
+# magic, format version, category count; followed by the category keys, each a length byte plus UTF-8
+_HEADER = struct.Struct("<4sBH")
+_KEY_LENGTH = struct.Struct("<B")
+# Every row starts with the ET day (proleptic ordinal) and matchup period, then you/opp float64 per category.
+_ROW_PREFIX = struct.Struct("<II")
+
+Snapshot = dict[str, dict[str, float]]
+
+
+def _row_struct(category_count: int) -> struct.Struct:
+    return struct.Struct(f"<II{2 * category_count}d")
+
+
+def _encode_header(keys: list[str]) -> bytes:
+    out = bytearray(_HEADER.pack(SERIES_MAGIC, SERIES_VERSION, len(keys)))
+    for key in keys:
+        raw = key.encode("utf-8")
+        out += _KEY_LENGTH.pack(len(raw)) + raw
+    return bytes(out)
+
+
+def _decode_header(data: bytes) -> tuple[list[str], int] | None:
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != SERIES_MAGIC or version != SERIES_VERSION:
+        return None
+    keys, offset = [], _HEADER.size
+    for _ in range(count):
+        if offset >= len(data):
+            return None
+        (length,) = _KEY_LENGTH.unpack_from(data, offset)
+        offset += _KEY_LENGTH.size
+        keys.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+    return keys, offset
+
+
+def _encode_row(keys: list[str], day: int, matchup_period_id: int, snapshot: Snapshot) -> bytes:
+    values = []
+    for key in keys:
+        values += [float(snapshot[key]["you"]), float(snapshot[key]["opp"])]
+    return _row_struct(len(keys)).pack(day, matchup_period_id, *values)
+
+
+@dataclass
+class SnapshotSeries:
+    """Category totals for one league/team as columns: one day/period pair and you/opp value per row."""
+
+    keys: list[str]
+    days: array = field(default_factory=lambda: array("I"))
+    periods: array = field(default_factory=lambda: array("I"))
+    you: dict[str, array] = field(default_factory=dict)
+    opp: dict[str, array] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for key in self.keys:
+            self.you.setdefault(key, array("d"))
+            self.opp.setdefault(key, array("d"))
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def _append(self, row: tuple[float, ...]) -> None:
+        self.days.append(int(row[0]))
+        self.periods.append(int(row[1]))
+        for idx, key in enumerate(self.keys):
+            self.you[key].append(row[2 + 2 * idx])
+            self.opp[key].append(row[3 + 2 * idx])
+
+    def rows(self, matchup_period_id: int | None = None, start: date | None = None, end: date | None = None) -> range:
+        """Row indexes for days in `[start, end]` (binary search on the sorted day column), optionally one period."""
+        lo = bisect.bisect_left(self.days, start.toordinal()) if start is not None else 0
+        hi = bisect.bisect_right(self.days, end.toordinal()) if end is not None else len(self.days)
+        if matchup_period_id is None:
+            return range(lo, hi)
+        matching = [idx for idx in range(lo, hi) if self.periods[idx] == matchup_period_id]
+        return range(matching[0], matching[-1] + 1) if matching else range(0)
+
+    def snapshot(self, idx: int) -> Snapshot:
+        return {key: {"you": self.you[key][idx], "opp": self.opp[key][idx]} for key in self.keys}
+
+    def get(self, matchup_period_id: int, day: date) -> Snapshot | None:
+        rows = self.rows(matchup_period_id, day, day)
+        return self.snapshot(rows[-1]) if rows else None
+
+    def first(self, matchup_period_id: int, end: date) -> Snapshot | None:
+        """The earliest snapshot of a matchup period taken on or before `end`."""
+        rows = self.rows(matchup_period_id, end=end)
+        return self.snapshot(rows[0]) if rows else None
+
+    def margins(self, key: str, rows: range) -> list[float]:
+        you, opp = self.you[key], self.opp[key]
+        return [you[idx] - opp[idx] for idx in rows]
+
+    def deltas(self, key: str, rows: range, window: int = 1) -> list[float]:
+        """Margin change over `window` rows, for each row that has one `window` rows earlier."""
+        margins = self.margins(key, rows)
+        return [margins[idx] - margins[idx - window] for idx in range(window, len(margins))]
+
+    def trend(self, key: str, rows: range) -> float | None:
+        """Margin change from the first to the last row in `rows`."""
+        margins = self.margins(key, rows)
+        return margins[-1] - margins[0] if len(margins) > 1 else None
+
+
+@dataclass
+class SnapshotStore:
+    """Append-only recap snapshot series, one fixed-width binary file per league/team.
+
+    Recap appends one row per ET day (re-runs the same day overwrite the last row in place). Retention drops whole
+    rows from the head of a series on append; `purge_old` deletes series that are no longer appended to.
+    """
+
+    root: Path
+
+    def __post_init__(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, league_id: str, team_id: int) -> Path:
+        return self.root / f"{key_digest(f'{league_id}:{team_id}')}{SERIES_SUFFIX}"
+
+    def load(self, league_id: str, team_id: int) -> SnapshotSeries | None:
+        with timings.stage("snapshot_read"):
+            try:
+                data = self.path(league_id, team_id).read_bytes()
+            except FileNotFoundError:
+                return None
+            return _decode_series(data)
+
+    def get(self, league_id: str, team_id: int, matchup_period_id: int, day: date) -> Snapshot | None:
+        series = self.load(league_id, team_id)
+        return series.get(matchup_period_id, day) if series is not None else None
+
+    def purge_old(self, retention_days: int, now_ts: float | None = None) -> None:
+        """Delete series not appended to within the retention window (teams or leagues no longer recapped)."""
+        cutoff = (now_ts or time.time()) - retention_days * 24 * 60 * 60
+        # Every append rewrites or extends the file, so its mtime is the last snapshot's write time.
+        with os.scandir(self.root) as it:
+            expired = [
+                Path(entry.path) for entry in it if entry.name.endswith(SERIES_SUFFIX) and _mtime(entry) < cutoff
+            ]
+        for path in expired:
+            lock = path.with_suffix(".lock")
+            # Re-checked under the series lock, so a concurrent append is never unlinked mid-write.
+            with flock_path(lock):
+                try:
+                    if path.stat().st_mtime >= cutoff:
+                        continue
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                # Removed while still held: an append already waiting on it finds no series and starts a new one.
+                lock.unlink(missing_ok=True)
+
+    def append(
+        self,
+        league_id: str,
+        team_id: int,
+        matchup_period_id: int,
+        day: date,
+        snapshot: Snapshot,
+        retention_days: int,
+    ) -> None:
+        path = self.path(league_id, team_id)
+        ordinal = day.toordinal()
+        with timings.stage("snapshot_write"), flock_path(path.with_suffix(".lock")):
+            try:
+                fh = path.open("r+b")
+            except FileNotFoundError:
+                self._rewrite(path, list(snapshot), [(ordinal, matchup_period_id, snapshot)])
+                return
+            with fh:
+                if self._append_in_place(fh, ordinal, matchup_period_id, snapshot, retention_days):
+                    return
+            # Categories changed, an out-of-order day, or rows past retention: rewrite the (short) series.
+            series = _decode_series(path.read_bytes())
+            rows = list(_series_rows(series, list(snapshot))) if series is not None else []
+            rows = [row for row in rows if (row[0], row[1]) != (ordinal, matchup_period_id)]
+            rows.append((ordinal, matchup_period_id, snapshot))
+            rows = sorted((row for row in rows if row[0] > ordinal - retention_days), key=lambda row: row[0])
+            self._rewrite(path, list(snapshot), rows)
+
+    def _append_in_place(
+        self, fh: BinaryIO, ordinal: int, matchup_period_id: int, snapshot: Snapshot, retention_days: int
+    ) -> bool:
+        # O(1): read the header and first row, then overwrite or append only the last row.
+        head = fh.read(64 * 1024)
+        decoded = _decode_header(head)
+        if decoded is None or decoded[0] != list(snapshot):
+            return False
+        keys, header_size = decoded
+        row = _row_struct(len(keys))
+        size = fh.seek(0, os.SEEK_END)
+        count = (size - header_size) // row.size
+        if count == 0:
+            fh.truncate(header_size)
+            fh.write(_encode_row(keys, ordinal, matchup_period_id, snapshot))
+            return True
+        first_day, _ = _ROW_PREFIX.unpack_from(head, header_size)
+        if first_day <= ordinal - retention_days:
+            return False
+        last_offset = header_size + (count - 1) * row.size
+        fh.seek(last_offset)
+        last_day, last_period = _ROW_PREFIX.unpack(fh.read(_ROW_PREFIX.size))
+        if (last_day, last_period) == (ordinal, matchup_period_id):
+            fh.seek(last_offset)
+        elif last_day <= ordinal:
+            # Drop any partially written trailing row, then append.
+            fh.truncate(header_size + count * row.size)
+            fh.seek(0, os.SEEK_END)
+        else:
+            return False
+        fh.write(_encode_row(keys, ordinal, matchup_period_id, snapshot))
+        return True
+
+    def _rewrite(self, path: Path, keys: list[str], rows: list[tuple[int, int, Snapshot]]) -> None:
+        data = _encode_header(keys) + b"".join(_encode_row(keys, *row) for row in rows)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=f"{SERIES_SUFFIX}.part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _mtime(entry: os.DirEntry) -> float:
+    try:
+        return entry.stat().st_mtime
+    except FileNotFoundError:
+        return float("inf")
+
+
+def _decode_series(data: bytes) -> SnapshotSeries | None:
+    decoded = _decode_header(data)
+    if decoded is None:
+        return None
+    keys, offset = decoded
+    row = _row_struct(len(keys))
+    end = offset + (len(data) - offset) // row.size * row.size  # ignore a partially written trailing row
+    series = SnapshotSeries(keys)
+    for values in row.iter_unpack(data[offset:end]):
+        series._append(values)
+    return series
+
+
+def _series_rows(series: SnapshotSeries, keys: list[str]) -> Iterator[tuple[int, int, Snapshot]]:
+    # Rows of an existing series, kept only if they carry every category of the new layout.
+    if not set(keys) <= set(series.keys):
+        return
+    for idx in range(len(series)):
+        yield series.days[idx], series.periods[idx], series.snapshot(idx)
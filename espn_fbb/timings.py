@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+TIMINGS_ENV = "ESPN_FBB_TIMINGS"
+
+_current: ContextVar[Timings | None] = ContextVar("espn_fbb_timings", default=None)
+
+
+@dataclass
+class Stage:
+    name: str
+    seconds: float = 0.0
+    calls: int = 0
+    counters: dict[str, float] = field(default_factory=dict)
+    notes: dict[str, Any] = field(default_factory=dict)
+    children: dict[str, Stage] = field(default_factory=dict)
+
+    def child(self, name: str) -> Stage:
+        stage = self.children.get(name)
+        if stage is None:
+            stage = self.children[name] = Stage(name)
+        return stage
+
+    def totals(self) -> dict[str, float]:
+        out = dict(self.counters)
+        for child in self.children.values():
+            for name, value in child.totals().items():
+                out[name] = out.get(name, 0) + value
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"stage": self.name, "ms": round(self.seconds * 1000, 3), "calls": self.calls}
+        if self.counters:
+            out["counters"] = dict(self.counters)
+        if self.notes:
+            out.update(self.notes)
+        if self.children:
+            out["children"] = [child.to_dict() for child in self.children.values()]
+        return out
+
+
+class Timings:
+    """Per-command stage tree. Stages with the same name under the same parent are merged (`calls` counts them)."""
+
+    def __init__(self, name: str) -> None:
+        self.root = Stage(name, calls=1)
+        self._stack = [self.root]
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        stage = self._stack[-1].child(name)
+        self._stack.append(stage)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds += time.perf_counter() - start
+            stage.calls += 1
+            self._stack.pop()
+
+    def count(self, name: str, value: float = 1) -> None:
+        counters = self._stack[-1].counters
+        counters[name] = counters.get(name, 0) + value
+
+    def note(self, **values: Any) -> None:
+        self._stack[-1].notes.update(values)
+
+    def finish(self) -> dict[str, Any]:
+        self.root.seconds = time.perf_counter() - self._started
+        out = self.root.to_dict()
+        totals = self.root.totals()
+        if totals:
+            out["totals"] = totals
+        return out
+
+
+def enabled(flag: bool = False) -> bool:
+    return flag or os.environ.get(TIMINGS_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def current() -> Timings | None:
+    return _current.get()
+
+
+@contextmanager
+def recording(name: str, enabled: bool = True) -> Iterator[Timings | None]:
+    """Make a fresh `Timings` the current recorder for this thread/context; yields None when disabled."""
+    if not enabled:
+        yield None
+        return
+    timings = Timings(name)
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def stage(name: str) -> ContextManager[Any]:
+    timings = _current.get()
+    return timings.stage(name) if timings is not None else nullcontext()
+
+
+def count(name: str, value: float = 1) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.count(name, value)
+
+
+def note(**values: Any) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.note(**values)
+
+
+@contextmanager
+def profiling(path: Path | None) -> Iterator[None]:
+    """Run the block under cProfile and dump pstats to `path` (no-op without a path)."""
+    if path is None:
+        yield
+        return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(str(path))
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import importlib
 from datetime import datetime
+from typing import Any
 from zoneinfo import ZoneInfo
 
 ET_ZONE = ZoneInfo("America/New_York")
+# Placeholder for an optional dependency that has not been imported yet (None means "not installed").
+UNLOADED: Any = object()
+
+
+def optional_import(name: str) -> Any | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
 
 
 def now_et() -> datetime:
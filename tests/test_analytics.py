@@ -1,6 +1,19 @@
 from __future__ import annotations
 
+import io
+import json
+
+import pytest
+
+from espn_fbb import analytics_numpy, analytics_projection
 from espn_fbb.analytics import _lineup_swap_actions, build_outlook, build_preview, build_recap, build_snapshot
+from espn_fbb.analytics_lineup import optimize_daily_lineups
+from espn_fbb.analytics_simulation import simulate_matchup
+from espn_fbb.analytics_projection import _projected_team_totals
+from espn_fbb.analytics_schedule import ScheduleIndex
+from espn_fbb.fetch_stream import parse_pruned
+from espn_fbb.league_delta import merge_league_delta
+from espn_fbb.league_model import League
 from espn_fbb.schema import CategorySignal, CategoryStat
 
 
@@ -183,6 +196,22 @@ def test_build_recap_and_movers_with_ties_allowed():
     assert recap2.rosters_meta.has_data is True
 
 
+def test_build_recap_period_delta_margin():
+    league = _league_payload()
+    league["status"]["currentScoringPeriod"] = 81
+    snapshot = build_snapshot(build_recap(league, team_id=4, league_id="123").categories)
+    snapshot["3PM"] = {"you": 44, "opp": 44}
+
+    recap = build_recap(league, team_id=4, league_id="123", yesterday_snapshot=snapshot)
+    assert all(m.period_delta_margin is None for m in recap.movers)
+
+    # With an earlier snapshot of the matchup period, movers also carry the change since then.
+    start = {**snapshot, "3PM": {"you": 40, "opp": 44}}
+    recap = build_recap(league, team_id=4, league_id="123", yesterday_snapshot=snapshot, period_start_snapshot=start)
+    mover = next(m for m in recap.movers if m.key == "3PM")
+    assert mover.period_delta_margin == round(mover.today_margin + 4, 4)
+
+
 def test_build_preview_signals_and_outlook():
     preview = build_preview(
         league_payload=_league_payload(),
@@ -613,3 +642,292 @@ def test_preview_inverts_matchup_periods_when_keyed_by_scoring_period():
     )
     # Projected-starter replacement in this fixture resolves to 6.
     assert preview.games.you_total_games == 6
+
+
+def test_schedule_index_slices_scoring_periods_and_round_trips():
+    schedule_payload = {
+        "proTeams": [
+            {
+                "id": 1,
+                "proGamesByScoringPeriod": {
+                    "101": [{"date": 1771200000000}],
+                    "102": [],
+                    "103": [{"date": 1771372800000}],
+                },
+            },
+            {"id": 2, "proGamesByScoringPeriod": {"101": 1, "102": 1, "103": 0}},
+            {"id": 3, "proGamesByMatchupPeriod": {"6": 3}, "proGamesByScoringPeriod": {"101": 1}},
+        ]
+    }
+    index = ScheduleIndex.from_payload(schedule_payload)
+    restored = ScheduleIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+
+    for candidate in (index, restored):
+        assert candidate.games_by_pro_team(6, [101, 102, 103]) == {1: 2, 2: 2, 3: 3}
+        assert candidate.games_by_pro_team(7, [102, 103]) == {1: 1, 2: 1, 3: 0}
+        assert sorted(candidate.scoring_period_dates()) == [101, 103]
+        assert candidate.daily_games_by_pro_team(7, [102, 103]) == {102: {2: 1}, 103: {1: 1}}
+        assert candidate.daily_games_by_pro_team(6, [101, 102, 103]) is None
+
+    from_payload = build_preview(_league_payload(), _schedule_payload(), team_id=4, league_id="123", week="current")
+    compiled = ScheduleIndex.from_dict(ScheduleIndex.from_payload(_schedule_payload()).to_dict())
+    from_index = build_preview(_league_payload(), compiled, team_id=4, league_id="123", week="current")
+    assert from_index.games == from_payload.games
+    assert from_index.categories == from_payload.categories
+
+
+def test_schedule_index_rejects_other_versions():
+    assert ScheduleIndex.from_dict({"version": ScheduleIndex.VERSION + 1}) is None
+
+
+def test_player_stat_index_parses_rows_once_and_keys_lookups():
+    player = {
+        "id": 9,
+        "stats": [
+            {"statSourceId": 1, "scoringPeriodId": 80, "stats": {"0": 99}},
+            {"statSourceId": 0, "statSplitTypeId": 0, "seasonId": 2026, "scoringPeriodId": 0, "stats": {"0": 300, "42": 10}},
+            {"statSourceId": 0, "scoringPeriodId": [80], "stats": {"0": 31, "19": 0.5}},
+            {"statSourceId": 0, "scoringPeriodId": 80, "stats": {"0": 1}},
+            {"scoringPeriodId": 79, "stats": {}},
+        ],
+    }
+    league = League.from_payload({"teams": [{"id": 1, "roster": {"entries": [{"playerPoolEntry": {"player": player}}]}}]})
+    stats = league.team(1).entries[0].player.stats
+
+    assert league.stats_index.player(player) is stats
+    assert stats.max_season_id == 2026
+    assert stats.season_totals(2026).get(42) == 10.0
+    assert not stats.season_totals(2025)
+    assert stats.period(80).get(0) == 31.0
+    assert 19 in stats.period(80) and 20 not in stats.period(80)
+    assert not stats.period(79)
+    assert stats.period(None).to_dict() == {0: 300.0, 42: 10.0}
+
+
+def test_league_model_normalizes_used_teams_once():
+    player = {"id": "7", "fullName": "A", "proTeamId": "3", "injuryStatus": "out", "eligibleSlots": ["0", 12], "stats": []}
+    payload = {
+        "schedule": [{"matchupPeriodId": "5", "home": {"teamId": 1}, "away": {"teamId": "2"}}],
+        "teams": [
+            {"id": 1, "location": "Big", "nickname": "Shots", "roster": {"entries": [{"playerPoolEntry": {"player": player}}]}},
+            {"id": 2, "roster": {"entries": [{"lineupSlotId": 4, "playerPoolEntry": {}}]}},
+        ],
+    }
+    league = League.from_payload(payload)
+
+    assert league.find_matchup(2, 5) == (payload["schedule"][0]["away"], payload["schedule"][0]["home"])
+    team = league.team(1)
+    assert league.team(1) is team and list(league.teams) == [1]
+    assert team.name == "Big Shots"
+    entry = team.entries[0]
+    assert (entry.lineup_slot_id, entry.slot) == (None, -1)
+    assert (entry.player.id, entry.player.pro_team_id, entry.player.out) == (7, 3, True)
+    assert (entry.player.status, entry.player.status_raw) == ("out", "OUT")
+    assert entry.player.eligible_slots == frozenset({0, 12})
+    assert entry.player.games({3: 4}) == 4
+    assert league.team(2).entries[0].player.games({3: 4}) == 0
+    assert league.team(99).entries == [] and league.team(99).standing is None
+
+
+def test_preview_and_outlook_select_starters_once_per_team(monkeypatch):
+    calls = []
+    select = analytics_projection._projected_starter_entries
+
+    def counting(team, *args):
+        calls.append(team)
+        return select(team, *args)
+
+    monkeypatch.setattr(analytics_projection, "_projected_starter_entries", counting)
+    preview = build_preview(_league_payload(), _schedule_payload(), team_id=4, league_id="123", week="current")
+    assert len(calls) == 2
+    assert preview.games.you_total_games > 0
+
+    calls.clear()
+    build_outlook(_league_payload(), _schedule_payload(), team_id=4, league_id="123")
+    assert len(calls) == 2
+
+
+def test_numpy_projection_engine_matches_pure_python(monkeypatch):
+    pytest.importorskip("numpy")
+
+    def _team(offset: int) -> dict:
+        entries = []
+        for i in range(13):
+            totals = {str(sid): (sid + 1) * (i + offset) / 7.0 for sid in (0, 1, 2, 3, 6, 11, 13, 14, 15, 16, 17)}
+            totals["42"] = float(i % 5)
+            entries.append(
+                {
+                    "lineupSlotId": i if i < 10 else 12,
+                    "playerPoolEntry": {
+                        "player": {
+                            "id": offset * 100 + i,
+                            "proTeamId": i % 4,
+                            "injuryStatus": "OUT" if i == 3 else "ACTIVE",
+                            "stats": [] if i == 7 else [
+                                {"statSourceId": 0, "statSplitTypeId": 0, "seasonId": 2026, "scoringPeriodId": 0, "stats": totals}
+                            ],
+                        }
+                    },
+                }
+            )
+        return {"roster": {"entries": entries}}
+
+    teams = [_team(1), _team(2)]
+    pro_team_games = {0: 0, 1: 3, 2: 4, 3: 2}
+    starter_slot_counts = {slot: 1 for slot in range(10)}
+
+    def run() -> tuple:
+        totals = _projected_team_totals(teams, 2026, pro_team_games, starter_slot_counts)
+        actions = _lineup_swap_actions(teams[0], 2026, pro_team_games, starter_slot_counts, [], [])
+        return totals, [a.model_dump() for a in actions]
+
+    fast = run()
+    monkeypatch.setattr(analytics_numpy, "np", None)
+    slow = run()
+
+    assert fast[0][0]["PTS"] > 0
+    assert fast == slow
+
+
+def test_daily_lineup_optimizer_respects_eligibility_and_uses_off_days():
+    def _entry(player_id: int, slot: int, pro_team_id: int, eligible: list[int], pts: float) -> dict:
+        return {
+            "lineupSlotId": slot,
+            "playerPoolEntry": {
+                "player": {
+                    "id": player_id,
+                    "fullName": f"P{player_id}",
+                    "proTeamId": pro_team_id,
+                    "eligibleSlots": eligible,
+                    "stats": [
+                        {
+                            "statSourceId": 0,
+                            "statSplitTypeId": 0,
+                            "seasonId": 2026,
+                            "scoringPeriodId": 0,
+                            "stats": {"0": pts, "6": pts / 2, "13": pts / 3, "14": pts / 2, "42": 10},
+                        }
+                    ],
+                }
+            },
+        }
+
+    team = {
+        "roster": {
+            "entries": [
+                _entry(1, 0, 1, [0, 11, 12], 200),  # PG, plays day 1 only
+                _entry(2, 4, 2, [4, 11, 12], 150),  # C, plays day 2 only
+                _entry(3, 12, 3, [0, 4, 11, 12], 120),  # PG/C on the bench, plays both days
+                _entry(4, 12, 4, [4, 12], 300),  # C on the bench, plays day 1
+            ]
+        }
+    }
+    daily_games = {10: {1: 1, 3: 1, 4: 1}, 11: {2: 1, 3: 1}}
+    opp_totals = {"PTS": 100.0, "REB": 50.0, "FG%": 0.45, "FGA": 40.0}
+
+    plan = optimize_daily_lineups(team, 2026, {0: 1, 4: 1}, daily_games, opp_totals)
+
+    assert plan is not None
+    assert plan.games_started == 4
+    assert plan.baseline_games_started == 2
+    assert plan.expected_category_wins >= plan.baseline_expected_category_wins
+    by_day = {day.scoring_period_id: {a.slot: a.player_id for a in day.starters} for day in plan.days}
+    assert by_day[10] == {"PG": 1, "C": 4}
+    assert by_day[11] == {"PG": 3, "C": 2}
+    assert plan.days[0].benched_player_ids == [3]
+
+
+def test_simulate_matchup_is_seeded_and_favors_stronger_roster():
+    pytest.importorskip("numpy")
+
+    def _team(offset: int, pts: float) -> dict:
+        entries = []
+        for i in range(13):
+            stats = [
+                {
+                    "statSourceId": 0,
+                    "statSplitTypeId": 0,
+                    "seasonId": 2026,
+                    "scoringPeriodId": 0,
+                    "stats": {"0": pts, "6": 100, "3": 50, "2": 10, "1": 5, "11": 20, "17": 15, "13": 80, "14": 170, "15": 30, "16": 40, "42": 10},
+                }
+            ]
+            stats += [
+                {"statSourceId": 0, "scoringPeriodId": day, "stats": {"0": pts / 10 + (day % 3) * 4 - 4, "14": 17, "16": 4}}
+                for day in range(1, 7)
+            ]
+            entries.append({"lineupSlotId": i, "playerPoolEntry": {"player": {"id": offset + i, "proTeamId": i + 1, "stats": stats}}})
+        return {"roster": {"entries": entries}}
+
+    kwargs = dict(
+        season_id=2026,
+        pro_team_games={i: 3 for i in range(1, 14)},
+        starter_slot_counts={slot: 1 for slot in range(13)},
+        you_current={},
+        opp_current={},
+        simulations=2000,
+    )
+    first = simulate_matchup(_team(0, 300), _team(100, 200), seed=11, **kwargs)
+    again = simulate_matchup(_team(0, 300), _team(100, 200), seed=11, **kwargs)
+
+    assert first == again
+    assert first.categories["PTS"].win > 0.99
+    assert 0.3 < first.categories["REB"].win < 0.7
+    assert abs(first.win + first.tie + first.loss - 1.0) < 1e-6
+
+
+def test_merge_league_delta_overlays_current_period_without_mutating_base():
+    def entry(pid, slot, stats):
+        return {"playerId": pid, "lineupSlotId": slot, "playerPoolEntry": {"player": {"id": pid, "stats": stats}}}
+
+    season_row = {"statSourceId": 0, "statSplitTypeId": 0, "seasonId": 2026, "scoringPeriodId": 0, "stats": {"0": 100}}
+    old_day = {"statSourceId": 0, "statSplitTypeId": 1, "seasonId": 2026, "scoringPeriodId": 79, "stats": {"0": 10}}
+    new_season = dict(season_row, stats={"0": 120})
+    today = {"statSourceId": 0, "statSplitTypeId": 1, "seasonId": 2026, "scoringPeriodId": 80, "stats": {"0": 20}}
+    base = {
+        "settings": {"name": "L"},
+        "status": {"currentScoringPeriod": 79},
+        "schedule": [{"id": 1, "matchupPeriodId": 5}, {"id": 2, "matchupPeriodId": 6}],
+        "teams": [
+            {"id": 4, "name": "A", "roster": {"entries": [entry(10, 0, [season_row, old_day]), entry(11, 12, [])]}},
+            {"id": 7, "name": "B", "roster": {"entries": []}},
+        ],
+    }
+    snapshot = json.dumps(base, sort_keys=True)
+    delta = {
+        "status": {"currentScoringPeriod": 80},
+        "schedule": [{"id": 1, "matchupPeriodId": 5, "home": {"totalPoints": 3}}],
+        "teams": [{"id": 4, "roster": {"entries": [entry(10, 1, [new_season, today]), entry(12, 0, [today])]}}],
+    }
+
+    merged = merge_league_delta(base, delta)
+    assert json.dumps(base, sort_keys=True) == snapshot
+    assert merged["settings"] == base["settings"]
+    assert merged["status"]["currentScoringPeriod"] == 80
+    assert [row.get("home") for row in merged["schedule"]] == [{"totalPoints": 3}, None]
+    team = merged["teams"][0]
+    assert team["name"] == "A"
+    assert [(e["playerId"], e["lineupSlotId"]) for e in team["roster"]["entries"]] == [(10, 1), (12, 0)]
+    stats = team["roster"]["entries"][0]["playerPoolEntry"]["player"]["stats"]
+    assert stats == [new_season, today, old_day]
+    assert merged["teams"][1] is base["teams"][1]
+
+
+def test_pruned_stream_parse_preserves_analytics_output():
+    pytest.importorskip("ijson")
+    league = _league_payload()
+    league["members"] = [{"id": "owner"}]
+    for team in league["teams"]:
+        for entry in team["roster"]["entries"]:
+            entry["playerPoolEntry"]["ratings"] = {"0": {"positionalRanking": 3}}
+    pruned = parse_pruned(io.BytesIO(json.dumps(league).encode("utf-8")))
+    assert "members" not in pruned
+
+    def _preview(payload: dict) -> dict:
+        out = build_preview(
+            league_payload=payload, schedule_payload=_schedule_payload(), team_id=4, league_id="123", week="current"
+        ).model_dump(mode="json")
+        out.pop("generated_at")
+        return out
+
+    assert _preview(pruned) == _preview(league)
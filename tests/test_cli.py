@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import date
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
-from espn_fbb.cache import JsonCache
+from espn_fbb import analytics_numpy
+from espn_fbb.cache import ENTRY_SUFFIX, JsonCache, key_digest
 from espn_fbb.cli import app
+from espn_fbb.commands import MATCHUP_VIEWS
 
 runner = CliRunner()
 
@@ -91,6 +100,60 @@ def test_recap_outputs_json(monkeypatch, tmp_path: Path):
     assert "rosters_meta" in payload
 
 
+def test_recap_purges_entries_past_snapshot_retention(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    cache = JsonCache(tmp_path)
+    cache.set("league:old", {"teams": []})
+    store = cache.snapshot_store()
+    store.append("999", 1, 5, date(2026, 1, 1), {"PTS": {"you": 1.0, "opp": 2.0}}, retention_days=10)
+    stale = time.time() - 11 * 24 * 60 * 60
+    for path in (tmp_path / f"{key_digest('league:old')}{ENTRY_SUFFIX}", store.path("999", 1)):
+        os.utime(path, (stale, stale))
+
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", lambda self, *a, **k: LEAGUE_PAYLOAD)
+
+    result = runner.invoke(app, ["recap", "--config-path", str(cfg)])
+    assert result.exit_code == 0
+    assert cache.get("league:old", ttl_seconds=10**9) is None
+    assert not store.path("999", 1).exists()
+    assert not store.path("999", 1).with_suffix(".lock").exists()
+    assert store.path("123", 4).exists()  # the series this recap just appended to
+
+
+def test_recap_incremental_merges_current_period_delta_over_cached_base(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    calls = []
+    delta = {
+        "status": LEAGUE_PAYLOAD["status"],
+        "schedule": [
+            {
+                "matchupPeriodId": 5,
+                "home": {"teamId": 4, "cumulativeScore": {"scoreByStat": {"0": 750}}},
+                "away": {"teamId": 7, "cumulativeScore": {"scoreByStat": {"0": 660}}},
+            }
+        ],
+        "teams": [{"id": 4, "roster": {"entries": []}}],
+    }
+
+    def fake_get_league(self, views, **kwargs):
+        calls.append((views, kwargs.get("scoring_period_id"), kwargs.get("matchup_period_id")))
+        return delta if kwargs.get("scoring_period_id") is not None else LEAGUE_PAYLOAD
+
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", fake_get_league)
+
+    result = runner.invoke(app, ["recap", "--config-path", str(cfg), "--incremental"])
+    assert result.exit_code == 0
+    assert [(scoring, matchup) for _, scoring, matchup in calls] == [(None, None), (80, 5)]
+    assert "mSettings" not in calls[1][0]
+    payload = json.loads(result.stdout)
+    assert {c["key"]: c["you"] for c in payload["categories"]}["PTS"] == 750
+    assert payload["you_team_name"] == "Test Alpha"
+
+
 def test_matchup_preview_outputs_json(monkeypatch, tmp_path: Path):
     cfg = tmp_path / "config.toml"
     _write_config(cfg)
@@ -147,3 +210,246 @@ def test_matchup_outlook_outputs_json(monkeypatch, tmp_path: Path):
     assert payload["rosters"]["you"] == []
     assert payload["rosters"]["opp"] == []
     assert "games_remaining" in payload
+
+
+def test_report_builds_all_three_commands_from_one_league_fetch(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    league_calls = []
+
+    def fake_get_league(self, views, **kwargs):
+        league_calls.append(list(views))
+        return LEAGUE_PAYLOAD
+
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", fake_get_league)
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_pro_team_schedules", lambda self, *a, **k: SCHEDULE_PAYLOAD)
+
+    result = runner.invoke(app, ["report", "--config-path", str(cfg)])
+    assert result.exit_code == 0
+    report = json.loads(result.stdout)
+    assert report["command"] == "report"
+    assert len(league_calls) == 1 and "mStandings" in league_calls[0]
+
+    # Each section is exactly what the single-league command prints.
+    commands = {"recap": ["recap"], "preview": ["matchup", "preview"], "outlook": ["matchup", "outlook"]}
+    for section, args in commands.items():
+        alone = json.loads(runner.invoke(app, [*args, "--config-path", str(cfg)]).stdout)
+        assert {**report[section], "generated_at": None} == {**alone, "generated_at": None}
+
+
+def test_matchup_outlook_simulation_is_seeded_and_requires_numpy(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", lambda self, *a, **k: LEAGUE_PAYLOAD)
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_pro_team_schedules", lambda self, *a, **k: SCHEDULE_PAYLOAD)
+    args = ["matchup", "outlook", "--simulate", "200", "--seed", "3", "--config-path", str(cfg)]
+
+    if analytics_numpy.available():
+        first = json.loads(runner.invoke(app, args).stdout)["win_probability"]
+        second = json.loads(runner.invoke(app, args).stdout)["win_probability"]
+        assert first == second
+        assert first["simulations"] == 200
+        assert first["categories"]["PTS"]["win"] == 1.0
+        assert first["categories"]["TO"]["loss"] == 0.0
+
+    monkeypatch.setattr(analytics_numpy, "np", None)
+    result = runner.invoke(app, args)
+    assert result.exit_code == 2
+    assert "NumPy" in json.loads(result.stdout)["error"]
+
+
+def test_batch_outputs_one_json_line_per_job_and_shares_schedule(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    cfg.write_text(
+        """
+season = 2026
+
+[[jobs]]
+league_id = "123"
+team_id = 4
+command = "preview"
+
+[[jobs]]
+league_id = "456"
+team_id = 7
+command = "outlook"
+
+[[jobs]]
+league_id = "123"
+team_id = 4
+command = "recap"
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    schedule_calls = []
+    warm_calls = []
+
+    def fake_get_league(self, views, *args, **kwargs):
+        if threading.current_thread().name.startswith("espn-fbb-fetch"):
+            warm_calls.append((self.league_id, tuple(views)))
+        return LEAGUE_PAYLOAD
+
+    def fake_get_schedule(self, *args, **kwargs):
+        schedule_calls.append(self.league_id)
+        return SCHEDULE_PAYLOAD
+
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", fake_get_league)
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_pro_team_schedules", fake_get_schedule)
+
+    result = runner.invoke(app, ["batch", "--config-path", str(cfg), "--workers", "2", "--cache-stats"])
+    assert result.exit_code == 0
+    assert set(json.loads(result.stderr)["cache"]) == {"memory", "disk"}
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(x["league_id"], x["command"]) for x in lines] == [("123", "preview"), ("456", "outlook"), ("123", "recap")]
+    assert all(x["exit_code"] == 0 for x in lines)
+    assert lines[1]["result"]["command"] == "matchup_outlook"
+    assert lines[1]["result"]["league_id"] == "456"
+    assert len(schedule_calls) == 1
+    # Leagues are fetched up front, once each; the matchup views cover league 123's recap job as well.
+    assert sorted(warm_calls) == [("123", tuple(MATCHUP_VIEWS)), ("456", tuple(MATCHUP_VIEWS))]
+
+
+def test_batch_rejects_unknown_command(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    cfg = tmp_path / "config.toml"
+    cfg.write_text('season = 2026\n\n[[jobs]]\nleague_id = "1"\nteam_id = 1\ncommand = "draft"\n', encoding="utf-8")
+
+    result = runner.invoke(app, ["batch", "--config-path", str(cfg)])
+    assert result.exit_code == 2
+    assert "command must be one of" in json.loads(result.stdout)["error"]
+
+
+def test_matchup_preview_reuses_cached_schedule_index(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    schedule_calls = []
+    warm_calls = []
+
+    def fake_get_league(self, views, *args, **kwargs):
+        if threading.current_thread().name.startswith("espn-fbb-fetch"):
+            warm_calls.append((self.league_id, tuple(views)))
+        return LEAGUE_PAYLOAD
+
+    def fake_get_schedule(self, *args, **kwargs):
+        schedule_calls.append(1)
+        return SCHEDULE_PAYLOAD
+
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", fake_get_league)
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_pro_team_schedules", fake_get_schedule)
+
+    first = runner.invoke(app, ["matchup", "preview", "--config-path", str(cfg)])
+    second = runner.invoke(app, ["matchup", "preview", "--config-path", str(cfg)])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert len(schedule_calls) == 1
+
+
+def test_unknown_cache_backend_is_a_config_error(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    monkeypatch.setenv("ESPN_FBB_CACHE_BACKEND", "redis")
+
+    result = runner.invoke(app, ["recap", "--config-path", str(cfg)])
+    assert result.exit_code == 2
+    assert "ESPN_FBB_CACHE_BACKEND" in json.loads(result.stdout)["error"]
+
+
+def test_timings_go_to_stderr_and_leave_stdout_unchanged(monkeypatch, tmp_path: Path):
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", lambda self, *a, **k: LEAGUE_PAYLOAD)
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_pro_team_schedules", lambda self, *a, **k: SCHEDULE_PAYLOAD)
+    args = ["matchup", "preview", "--config-path", str(cfg)]
+
+    plain = runner.invoke(app, args)
+    timed = runner.invoke(app, [*args, "--timings", "--profile", str(tmp_path / "preview.prof")])
+    monkeypatch.setenv("ESPN_FBB_TIMINGS", "1")
+    from_env = runner.invoke(app, args)
+
+    assert plain.exit_code == timed.exit_code == 0
+    assert plain.stderr == ""
+    strip = lambda out: {k: v for k, v in json.loads(out).items() if k != "generated_at"}  # noqa: E731
+    assert strip(timed.stdout) == strip(plain.stdout)
+    assert (tmp_path / "preview.prof").stat().st_size > 0
+
+    tree = json.loads(timed.stderr)["timings"]
+    stages = {child["stage"]: child for child in tree["children"]}
+    assert tree["stage"] == "matchup_preview"
+    assert {"cache_open", "config", "load_league", "load_schedule", "analytics", "serialize"} <= set(stages)
+    assert "league_model" in {child["stage"] for child in stages["analytics"]["children"]}
+    # The compiled schedule index was cached by the first run.
+    assert tree["totals"]["cache_hits"] == 1
+    assert tree["budget"]["max_espn_requests"] == 2
+    assert json.loads(from_env.stderr)["timings"]["stage"] == "matchup_preview"
+
+
+def test_cli_import_defers_heavy_modules():
+    # A fresh interpreter: the test session itself has already imported everything.
+    code = "import sys, espn_fbb.cli; print(' '.join(sorted(sys.modules)))"
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root)
+    loaded = set(result.stdout.split())
+
+    assert "espn_fbb.cli" in loaded
+    assert not loaded & {"espn_fbb.commands", "espn_fbb.analytics", "espn_fbb.schema", "pydantic", "requests", "numpy"}
+
+
+def test_serve_answers_queries_with_the_cli_contract_from_a_warm_process(monkeypatch, tmp_path: Path):
+    from urllib.error import HTTPError
+    from urllib.request import urlopen
+
+    from espn_fbb.cache_memory import TieredCache
+    from espn_fbb.serve import LeagueService, make_server
+
+    cfg = tmp_path / "config.toml"
+    _write_config(cfg)
+    league_calls = []
+    schedule_calls = []
+
+    def fake_get_league(self, *args, **kwargs):
+        league_calls.append(1)
+        return LEAGUE_PAYLOAD
+
+    def fake_get_schedule(self, *args, **kwargs):
+        schedule_calls.append(1)
+        return SCHEDULE_PAYLOAD
+
+    monkeypatch.setattr("espn_fbb.cli.JsonCache", lambda: JsonCache(tmp_path))
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_league", fake_get_league)
+    monkeypatch.setattr("espn_fbb.fetch.ESPNClient.get_pro_team_schedules", fake_get_schedule)
+    expected = json.loads(runner.invoke(app, ["matchup", "preview", "--config-path", str(cfg)]).stdout)
+
+    service = LeagueService(cache=TieredCache(JsonCache(tmp_path)), config_path=cfg)
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = "http://127.0.0.1:{}".format(server.server_address[1])
+    try:
+        first = json.loads(urlopen(f"{base}/matchup/preview").read())
+        second = json.loads(urlopen(f"{base}/matchup/preview?team_id=4").read())
+        with pytest.raises(HTTPError) as bad:
+            urlopen(f"{base}/recap?team_id=four")
+        with pytest.raises(HTTPError) as too_many:
+            urlopen(f"{base}/matchup/outlook?simulate=100000000")
+        with pytest.raises(HTTPError) as missing:
+            urlopen(f"{base}/nope")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    drop = lambda payload: {k: v for k, v in payload.items() if k != "generated_at"}  # noqa: E731
+    assert drop(first) == drop(second) == drop(expected)
+    # The compiled schedule index is held in memory after the first query.
+    assert len(schedule_calls) == 1
+    assert bad.value.code == 400
+    assert json.loads(bad.value.read()) == {"error": "team_id must be an integer"}
+    assert too_many.value.code == 400
+    assert json.loads(too_many.value.read()) == {"error": "simulate must be between 0 and 100000"}
+    assert missing.value.code == 404
+    assert service.refresh() == []
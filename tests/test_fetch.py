@@ -1,23 +1,63 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 
 import pytest
+import requests
 
-from espn_fbb.cache import JsonCache
-from espn_fbb.fetch import AuthError, ESPNClient, RequestBudget, RequestLimitError
+from espn_fbb import timings
+from espn_fbb.cache import JsonCache, key_digest, read_entry_header
+from espn_fbb.cache_memory import TieredCache
+from espn_fbb.cache_sqlite import SqliteCache
+from espn_fbb.fetch import (
+    AuthError,
+    ESPNClient,
+    ESPNError,
+    HttpTransport,
+    RequestBudget,
+    RequestLimitError,
+    default_transport,
+    wait_for_refreshes,
+)
+from espn_fbb.fetch_async import fetch_leagues
+from espn_fbb.prefetch import PrefetchScheduler, PrefetchTarget
+from espn_fbb.utils import ET_ZONE
 
 
 class DummyResponse:
-    def __init__(self, status_code: int, payload: dict):
+    def __init__(self, status_code: int, payload: dict, headers: dict | None = None):
         self.status_code = status_code
         self._payload = payload
+        self.headers = headers or {}
+        self.closed = False
 
     def json(self):
         return self._payload
 
+    def close(self):
+        self.closed = True
 
-def test_fallback_on_403(monkeypatch, tmp_path: Path):
+
+class FakeSession:
+    def __init__(self, handler):
+        self.handler = handler
+
+    def get(self, url, **kwargs):
+        return self.handler(url, **kwargs)
+
+
+def _transport(handler) -> HttpTransport:
+    return HttpTransport(session=FakeSession(handler))
+
+
+def test_fallback_on_403(tmp_path: Path):
     calls = []
 
     def fake_get(url, **kwargs):
@@ -26,8 +66,7 @@ def test_fallback_on_403(monkeypatch, tmp_path: Path):
             return DummyResponse(403, {})
         return DummyResponse(200, {"ok": True})
 
-    monkeypatch.setattr("requests.get", fake_get)
-    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path))
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
 
     payload = client.get_league(["mTeam"], use_cache=False)
     assert payload["ok"] is True
@@ -36,12 +75,34 @@ def test_fallback_on_403(monkeypatch, tmp_path: Path):
     assert "lm-api-reads" in calls[1]
 
 
-def test_auth_error_after_fallback_403(monkeypatch, tmp_path: Path):
+def test_timings_count_requests_fallbacks_and_cache_reads(tmp_path: Path):
+    def fake_get(url, **kwargs):
+        if "lm-api-reads" not in url:
+            return DummyResponse(403, {})
+        return DummyResponse(200, {"ok": True}, headers={"Content-Length": "11"})
+
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
+    with timings.recording("test") as recorder:
+        client.get_league(["mTeam"])
+        client.get_league(["mTeam"])
+    tree = recorder.finish()
+
+    assert tree["totals"] == {
+        # First call: the payload, the superset views index, the validators, then the index again to record the views.
+        "cache_misses": 4,
+        "cache_hits": 1,
+        "cache_bytes_read": 11,
+        "http_requests": 2,
+        "http_bytes": 11,
+    }
+    assert [child["stage"] for child in tree["children"]] == ["cache_read", "http", "json_parse"]
+
+
+def test_auth_error_after_fallback_403(tmp_path: Path):
     def fake_get(url, **kwargs):
         return DummyResponse(403, {})
 
-    monkeypatch.setattr("requests.get", fake_get)
-    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path))
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
 
     with pytest.raises(AuthError):
         client.get_league(["mTeam"], use_cache=False)
@@ -59,18 +120,478 @@ def test_request_budget_enforced(tmp_path: Path):
         client.get_league(["mTeam"], use_cache=True)
 
 
-def test_cache_hit_skips_network(monkeypatch, tmp_path: Path):
+def test_cache_hit_skips_network(tmp_path: Path):
     calls = {"count": 0}
 
     def fake_get(url, **kwargs):
         calls["count"] += 1
         return DummyResponse(200, {"value": 1})
 
-    monkeypatch.setattr("requests.get", fake_get)
-    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path))
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
 
     first = client.get_league(["mTeam"], use_cache=True)
     second = client.get_league(["mTeam"], use_cache=True)
 
     assert first == second
     assert calls["count"] == 1
+
+
+def test_superset_view_payload_serves_subset_requests(tmp_path: Path):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append([value for name, value in kwargs["params"] if name == "view"])
+        return DummyResponse(200, {"value": len(calls)})
+
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
+    client.budget.max_espn_requests = 10
+
+    superset = client.get_league(["mTeam", "mRoster", "mStandings"])
+    assert client.get_league(["mTeam", "mRoster"]) == superset
+    assert client.get_league(["mRoster"]) == superset
+    # Not covered by the cached views, or a different scoring period: fetched.
+    assert client.get_league(["mTeam", "mMatchup"]) != superset
+    client.get_league(["mTeam"], scoring_period_id=80)
+    assert calls == [["mTeam", "mRoster", "mStandings"], ["mTeam", "mMatchup"], ["mTeam"]]
+    # A fresh exact entry still wins over a superset.
+    assert client.get_league(["mTeam", "mMatchup"]) == {"value": 2}
+
+
+def test_network_error_maps_to_espn_error(tmp_path: Path):
+    def fake_get(url, **kwargs):
+        raise requests.ConnectionError("boom")
+
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
+
+    with pytest.raises(ESPNError):
+        client.get_league(["mTeam"], use_cache=False)
+
+
+def test_transport_is_shared_and_counts_requests(tmp_path: Path):
+    transport = _transport(lambda url, **kwargs: DummyResponse(200, {"ok": True}))
+    first = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=transport)
+    second = ESPNClient(league_id="2", season=2026, cache=JsonCache(tmp_path), transport=transport)
+
+    first.get_league(["mTeam"], use_cache=False)
+    second.get_league(["mTeam"], use_cache=False)
+
+    stats = transport.stats()
+    assert stats.requests == 2
+    assert stats.connections_reused == 2
+    assert ESPNClient(league_id="3", season=2026).transport is default_transport()
+
+
+def test_default_session_pools_and_retries():
+    transport = HttpTransport(pool_connections=1, pool_maxsize=3, max_retries=4, backoff_factor=0.1)
+    adapter = transport.session.get_adapter("https://fantasy.espn.com")
+
+    assert adapter._pool_maxsize == 3
+    assert adapter.max_retries.total == 4
+    assert 503 in adapter.max_retries.status_forcelist
+    # Opened connections are counted as they are created, so a pool evicted from the LRU keeps its count.
+    for url in ("https://fantasy.espn.com", "https://lm-api-reads.fantasy.espn.com"):
+        adapter.poolmanager.connection_from_url(url)._new_conn()
+    assert len(adapter.poolmanager.pools) == 1
+    assert transport.stats().connections_opened == 2
+    transport.close()
+
+
+def test_async_fetch_leagues_runs_concurrently_with_limit(tmp_path: Path):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+    # Each wave of fetches only gets past the barrier once `concurrency` of them are in flight together.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_get(url, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        barrier.wait()
+        with lock:
+            state["active"] -= 1
+        return DummyResponse(200, {"url": url})
+
+    transport = _transport(fake_get)
+    clients = [
+        ESPNClient(league_id=str(i), season=2026, cache=JsonCache(tmp_path), transport=transport) for i in range(6)
+    ]
+
+    results = asyncio.run(fetch_leagues(clients, ["mTeam"], concurrency=3, use_cache=False))
+
+    assert [r.league_id for r in results] == [str(i) for i in range(6)]
+    assert all(r.error is None and r.league for r in results)
+    assert state["peak"] == 3
+
+
+def test_async_fetch_leagues_reports_errors_per_league(tmp_path: Path):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        if "/leagues/3" in url:
+            raise RuntimeError("boom")
+        return DummyResponse(200, {"ok": True})
+
+    transport = _transport(fake_get)
+    clients = [
+        ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=transport),
+        ESPNClient(
+            league_id="2",
+            season=2026,
+            cache=JsonCache(tmp_path),
+            transport=transport,
+            budget=RequestBudget(max_espn_requests=0),
+        ),
+        ESPNClient(league_id="3", season=2026, cache=JsonCache(tmp_path), transport=transport),
+    ]
+
+    results = asyncio.run(fetch_leagues(clients, ["mTeam"], include_schedule=True, use_cache=False))
+
+    assert results[0].error is None
+    assert results[0].schedule == {"ok": True}
+    assert isinstance(results[1].error, RequestLimitError)
+    assert isinstance(results[2].error, RuntimeError)
+    # One schedule request serves every league of the season.
+    assert sum("/leagues/" not in url for url in calls) == 1
+
+
+def test_schedule_cache_is_shared_across_leagues(tmp_path: Path):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse(200, {"proTeams": []})
+
+    transport = _transport(fake_get)
+    cache = JsonCache(tmp_path)
+    first = ESPNClient(league_id="1", season=2026, cache=cache, transport=transport)
+    second = ESPNClient(league_id="2", season=2026, cache=cache, transport=transport)
+    other_season = ESPNClient(league_id="1", season=2025, cache=cache, transport=transport)
+
+    assert first.get_pro_team_schedules() == second.get_pro_team_schedules()
+    other_season.get_pro_team_schedules()
+
+    assert len(calls) == 2
+
+
+def test_concurrent_schedule_fetches_are_single_flight(tmp_path: Path):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        time.sleep(0.1)
+        return DummyResponse(200, {"proTeams": [{"id": 1}]})
+
+    transport = _transport(fake_get)
+    cache = JsonCache(tmp_path)
+    other = JsonCache(tmp_path / "other")
+    clients = [ESPNClient(league_id=str(i), season=2026, cache=cache, transport=transport) for i in range(5)]
+    clients.append(ESPNClient(league_id="9", season=2026, cache=other, transport=transport))
+    results = []
+    threads = [threading.Thread(target=lambda c=c: results.append(c.get_pro_team_schedules())) for c in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # A client on another cache never follows a leader that writes into someone else's cache.
+    assert len(calls) == 2
+    assert results == [{"proTeams": [{"id": 1}]}] * 6
+    key = clients[-1]._schedule_cache_key("/seasons/2026", [("view", "proTeamSchedules_wl")])
+    assert other.get(key, ttl_seconds=60) == {"proTeams": [{"id": 1}]}
+
+
+def test_stale_league_entry_is_revalidated_with_etag(monkeypatch, tmp_path: Path):
+    clock = type("Clock", (), {"now": time.time(), "time": lambda self: self.now})()
+    monkeypatch.setattr("espn_fbb.cache.time", clock)
+    sent = []
+    not_modified = []
+
+    def fake_get(url, **kwargs):
+        sent.append(kwargs["headers"].get("If-None-Match"))
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            not_modified.append(DummyResponse(304, {}))
+            return not_modified[-1]
+        return DummyResponse(200, {"ok": True}, headers={"ETag": '"v1"'})
+
+    client = ESPNClient(league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get))
+    client.budget.max_espn_requests = 10
+    assert client.get_league(["mTeam"], cache_ttl_seconds=60) == {"ok": True}
+
+    clock.now += 120
+    assert client.get_league(["mTeam"], cache_ttl_seconds=60) == {"ok": True}
+    assert sent == [None, '"v1"']
+    assert not_modified[0].closed  # released to the pool even when streamed
+    assert client.get_league(["mTeam"], cache_ttl_seconds=60) == {"ok": True}  # 304 restarted the TTL
+    assert len(sent) == 2
+
+
+def test_stale_while_revalidate_serves_cached_value_and_refreshes(monkeypatch, tmp_path: Path):
+    clock = type("Clock", (), {"now": time.time(), "time": lambda self: self.now})()
+    monkeypatch.setattr("espn_fbb.cache.time", clock)
+    version = {"n": 1}
+
+    def fake_get(url, **kwargs):
+        return DummyResponse(200, {"version": version["n"]})
+
+    client = ESPNClient(
+        league_id="1",
+        season=2026,
+        cache=JsonCache(tmp_path),
+        transport=_transport(fake_get),
+        stale_while_revalidate=True,
+    )
+    client.budget.max_espn_requests = 10
+    assert client.get_league(["mTeam"], cache_ttl_seconds=60) == {"version": 1}
+
+    clock.now += 120
+    version["n"] = 2
+    assert client.get_league(["mTeam"], cache_ttl_seconds=60) == {"version": 1}
+    wait_for_refreshes(timeout=5)
+    assert client.get_league(["mTeam"], cache_ttl_seconds=60) == {"version": 2}
+
+
+class StreamingResponse:
+    def __init__(self, payload: dict):
+        self.status_code = 200
+        self.headers = {}
+        self.raw = io.BytesIO(json.dumps(payload).encode("utf-8"))
+        self.closed = False
+
+    def json(self):
+        raise AssertionError("streaming path must not materialize the full body")
+
+    def close(self):
+        self.closed = True
+
+
+def test_stream_parse_keeps_only_analytics_fields(tmp_path: Path):
+    pytest.importorskip("ijson")
+    player = {
+        "id": 9,
+        "fullName": "P",
+        "ownership": {"percentOwned": 99.0},
+        "stats": [{"statSourceId": 0, "seasonId": 2026, "stats": {"0": 10.0}, "appliedStats": {"0": 1.0}}],
+    }
+    payload = {
+        "status": {"currentMatchupPeriod": 5},
+        "members": [{"id": "x"}],
+        "settings": {"name": "L", "rosterSettings": {"lineupSlotCounts": {"0": 1}, "positionLimits": {}}},
+        "schedule": [{"id": 1, "matchupPeriodId": 5, "home": {"teamId": 4, "rosterForCurrentScoringPeriod": {}}}],
+        "teams": [{"id": 4, "primaryOwner": "x", "roster": {"entries": [{"lineupSlotId": 0, "playerPoolEntry": {"player": player}}]}}],
+    }
+    responses = []
+
+    def fake_get(url, **kwargs):
+        assert kwargs["stream"] is True
+        responses.append(StreamingResponse(payload))
+        return responses[-1]
+
+    client = ESPNClient(
+        league_id="1", season=2026, cache=JsonCache(tmp_path), transport=_transport(fake_get), stream_parse=True
+    )
+    league = client.get_league(["mRoster"])
+    assert responses[0].closed
+    assert league == {
+        "status": {"currentMatchupPeriod": 5},
+        "settings": {"rosterSettings": {"lineupSlotCounts": {"0": 1}}},
+        "schedule": [{"id": 1, "matchupPeriodId": 5, "home": {"teamId": 4}}],
+        "teams": [
+            {
+                "id": 4,
+                "roster": {
+                    "entries": [
+                        {
+                            "lineupSlotId": 0,
+                            "playerPoolEntry": {
+                                "player": {
+                                    "id": 9,
+                                    "fullName": "P",
+                                    "stats": [{"statSourceId": 0, "seasonId": 2026, "stats": {"0": 10.0}}],
+                                }
+                            },
+                        }
+                    ]
+                },
+            }
+        ],
+    }
+    assert client.get_league(["mRoster"]) == league
+    assert len(responses) == 1
+
+    # Pruned payloads stay out of the full-payload keys and the superset index that other callers read.
+    client.budget.max_espn_requests = 10
+    assert client.get_league(["mRoster", "mTeam"]) == league
+    full_calls = []
+
+    def full_get(url, **kwargs):
+        full_calls.append(url)
+        return DummyResponse(200, payload)
+
+    full_client = ESPNClient(league_id="1", season=2026, cache=client.cache, transport=_transport(full_get))
+    full_client.budget.max_espn_requests = 10
+    assert full_client.get_league(["mRoster"]) == payload
+    assert full_client.get_league(["mRoster", "mTeam"]) == payload
+    assert len(full_calls) == 2
+
+
+def test_json_cache_stores_compressed_entries_and_reads_legacy_json(tmp_path: Path):
+    cache = JsonCache(tmp_path)
+    value = {"teams": [{"id": i, "name": "x" * 50} for i in range(40)]}
+    cache.set("league:1", value, ttl_seconds=60)
+
+    (path,) = tmp_path.glob("*.cache")
+    raw = path.read_bytes()
+    assert raw[:4] == b"EFBC"
+    assert len(raw) < len(json.dumps(value))
+    with path.open("rb") as fh:
+        header = read_entry_header(fh)
+    assert header is not None and header.ttl_seconds == 60
+    assert cache.get("league:1", ttl_seconds=60) == value
+    assert cache.get("league:1", ttl_seconds=-1) is None
+
+    legacy = tmp_path / f"{key_digest('league:2')}.json"
+    legacy.write_text(json.dumps({"created_at": time.time(), "value": {"old": True}}), encoding="utf-8")
+    assert cache.get("league:2", ttl_seconds=60) == {"old": True}
+    cache.set("league:2", {"old": False})
+    assert not legacy.exists()
+    assert cache.get("league:2", ttl_seconds=60) == {"old": False}
+
+    created_at = header.created_at
+    assert path.stat().st_mtime == pytest.approx(created_at, abs=1e-3)
+    os.utime(path, (created_at - 120, created_at - 120))
+    assert cache.get("league:1", ttl_seconds=60) is None
+
+    path.write_bytes(b"garbage")
+    assert cache.get("league:1", ttl_seconds=60) is None
+    cache.purge_old_snapshots(retention_days=1, now_ts=time.time() + 2 * 24 * 60 * 60)
+    assert not list(tmp_path.glob("*.cache"))
+
+
+def test_tiered_cache_serves_memory_hits_and_evicts_by_bytes(tmp_path: Path):
+    disk = JsonCache(tmp_path)
+    value = {"rows": list(range(100))}
+    size = len(json.dumps(value, separators=(",", ":")))
+    cache = TieredCache(disk, max_bytes=size * 2)
+
+    cache.set("a", value)
+    assert cache.get("a", ttl_seconds=60) == value
+    assert cache.stats()["memory"].hits == 1
+
+    assert disk.set("b", value) == size  # the size a read of the entry reports, so memory accounting agrees
+    assert cache.get("b", ttl_seconds=60) == value  # memory miss, disk hit, promoted
+    assert cache.get("b", ttl_seconds=60) == value
+    assert (cache.stats()["disk"].hits, cache.stats()["memory"].hits) == (1, 2)
+    assert cache.memory_bytes == size * 2
+
+    cache.set("c", value)  # evicts "a", the least recently used
+    assert cache.stats()["memory"].evictions == 1
+    assert cache.get("a", ttl_seconds=60) == value
+    assert cache.stats()["disk"].hits == 2
+    assert cache.get("missing", ttl_seconds=60) is None
+    assert cache.stats()["disk"].misses == 1
+    assert cache.get("c", ttl_seconds=-1) is None  # too old for this caller, even though it is resident
+
+
+def test_sqlite_cache_migrates_json_files_and_purges_by_timestamp(tmp_path: Path):
+    legacy = JsonCache(tmp_path)
+    legacy.set("league:old", {"teams": [1, 2]})
+    legacy.set("snapshot:1:4:5:2026-02-01", {"PTS": 10})
+    (tmp_path / f"{key_digest('corrupt')}.cache").write_bytes(b"not an entry")
+
+    cache = SqliteCache(tmp_path)
+    assert [path.name for path in tmp_path.glob("*.cache")] == [f"{key_digest('corrupt')}.cache"]
+    assert cache.get("league:old", ttl_seconds=60) == {"teams": [1, 2]}
+    assert cache.get("missing", ttl_seconds=60) is None
+    assert cache._has_legacy
+    assert cache.get("snapshot:1:4:5:2026-02-01", ttl_seconds=60) == {"PTS": 10}
+    assert not cache._has_legacy  # every imported row is claimed; later misses skip the legacy lookup
+
+    cache.set("fresh", {"n": 1}, ttl_seconds=5)
+    assert cache.get("fresh", ttl_seconds=0) is None
+    assert cache.purge_expired(now_ts=time.time() + 10) == 1
+
+    cache.set("kept", {"n": 2})
+    cache.purge_old_snapshots(retention_days=1, now_ts=time.time() + 12 * 60 * 60)
+    assert cache.get("kept", ttl_seconds=60) == {"n": 2}
+    cache.purge_old_snapshots(retention_days=1, now_ts=time.time() + 2 * 24 * 60 * 60)
+    assert cache.get("kept", ttl_seconds=10**9) is None
+
+
+def test_sqlite_cache_is_shared_across_threads_and_clients(tmp_path: Path):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse(200, {"proTeams": [{"id": 1}]})
+
+    cache = SqliteCache(tmp_path)
+    client = ESPNClient(league_id="1", season=2026, cache=cache, transport=_transport(fake_get))
+    client.get_pro_team_schedules()
+
+    results = []
+    reopened = SqliteCache(tmp_path)
+
+    def round_trip(i: int) -> None:
+        reopened.set(f"k{i}", i)
+        results.append(reopened.get(f"k{i}", 60))
+
+    threads = [threading.Thread(target=round_trip, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    other = ESPNClient(league_id="2", season=2026, cache=reopened, transport=_transport(fake_get))
+    assert other.get_pro_team_schedules() == {"proTeams": [{"id": 1}]}
+    assert len(calls) == 1
+    assert sorted(results) == list(range(8))
+
+
+def test_prefetch_refreshes_before_ttl_and_after_game_nights_within_budget(monkeypatch, tmp_path: Path):
+    # Game night Jan 14 (7pm ET tip); its stats are final at 3am ET Jan 15.
+    tip = datetime(2026, 1, 14, 19, tzinfo=ET_ZONE).timestamp()
+    schedule = {"proTeams": [{"id": 1, "proGamesByScoringPeriod": {"80": [{"date": int(tip * 1000)}]}}]}
+    league_calls = []
+
+    def fake_get(url, **kwargs):
+        if ("view", "proTeamSchedules_wl") in kwargs["params"]:
+            return DummyResponse(200, schedule)
+        league_calls.append(url)
+        return DummyResponse(200, {"ok": True})
+
+    clock = [datetime(2026, 1, 15, 1, tzinfo=ET_ZONE).timestamp()]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    scheduler = PrefetchScheduler(
+        JsonCache(tmp_path), max_league_requests=1, client_options={"transport": _transport(fake_get)}
+    )
+    targets = [PrefetchTarget("1", 2026, ("mTeam",)), PrefetchTarget("2", 2026, ("mTeam",))]
+
+    def statuses(lines):
+        return [(line["kind"], line.get("league_id"), line["reason"], line["status"]) for line in lines]
+
+    # Cold cache: everything is due, but this run's budget covers a single league fetch.
+    assert statuses(scheduler.run(targets)) == [
+        ("schedule", None, "missing", "refreshed"),
+        ("league", "1", "missing", "refreshed"),
+        ("league", "2", "missing", "deferred"),
+    ]
+    clock[0] += 60
+    lines = scheduler.run(targets)
+    assert statuses(lines) == [
+        ("league", "2", "missing", "refreshed"),
+        ("league", "1", "stats_final", "scheduled"),
+        ("schedule", None, "ttl", "scheduled"),
+    ]
+    # League 1's TTL would run out at 3:50am; the game night going final at 3am comes first.
+    assert lines[1]["due_at"] == "2026-01-15T03:00:00-05:00"
+    assert scheduler.next_due(targets) == datetime(2026, 1, 15, 3, tzinfo=ET_ZONE).timestamp()
+
+    clock[0] = datetime(2026, 1, 15, 3, 1, tzinfo=ET_ZONE).timestamp()
+    assert statuses(scheduler.run(targets))[:2] == [
+        ("league", "1", "stats_final", "refreshed"),
+        ("league", "2", "stats_final", "deferred"),
+    ]
+    assert len(league_calls) == 3
+    # No later game nights are scheduled, so the refreshed entry is next due shortly before its TTL runs out.
+    assert scheduler.plan(targets)[1].reason == "ttl"
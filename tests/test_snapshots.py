@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from espn_fbb.cache import JsonCache
+from espn_fbb.cache_sqlite import SqliteCache
+
+
+def _snap(pts: float, reb: float = 0.0) -> dict:
+    return {"PTS": {"you": pts, "opp": 100.0}, "REB": {"you": reb, "opp": 40.0}}
+
+
+def test_snapshot_store_appends_rows_and_truncates_by_retention(tmp_path: Path):
+    store = JsonCache(tmp_path).snapshot_store()
+    day = date(2026, 2, 1)
+
+    for offset, pts in enumerate([90.0, 95.0, 99.0, 104.0]):
+        store.append("1", 4, 5, day + timedelta(days=offset), _snap(pts), retention_days=10)
+    size = store.path("1", 4).stat().st_size
+    store.append("1", 4, 5, day + timedelta(days=3), _snap(110.0), retention_days=10)  # same-day re-run
+    assert store.path("1", 4).stat().st_size == size
+    assert store.get("1", 4, 5, day + timedelta(days=3)) == _snap(110.0)
+    assert store.get("1", 4, 6, day + timedelta(days=3)) is None
+    assert store.get("1", 2, 5, day) is None
+
+    series = store.load("1", 4)
+    assert list(series.rows(5, start=day + timedelta(days=1))) == [1, 2, 3]
+    assert list(series.rows(5, end=day + timedelta(days=1))) == [0, 1]
+    assert series.first(5, end=day + timedelta(days=2)) == _snap(90.0)
+    assert series.first(5, end=day - timedelta(days=1)) is None
+    # PTS margins run -10, -5, -1, +10 over the four days.
+    assert series.margins("PTS", series.rows(5)) == [-10.0, -5.0, -1.0, 10.0]
+    assert series.deltas("PTS", series.rows(5)) == [5.0, 4.0, 11.0]
+    assert series.deltas("PTS", series.rows(5), window=2) == [9.0, 15.0]
+    assert series.trend("PTS", series.rows(5, start=day + timedelta(days=1))) == 15.0
+    assert series.trend("PTS", series.rows(5, end=day)) is None
+
+    # Rows at or past the retention window are dropped on append; the series file is rewritten, not scanned for.
+    store.append("1", 4, 6, day + timedelta(days=11), _snap(30.0), retention_days=10)
+    series = store.load("1", 4)
+    assert [ordinal - day.toordinal() for ordinal in series.days] == [2, 3, 11]
+    assert list(series.periods) == [5, 5, 6]
+    assert series.first(6, end=day + timedelta(days=11)) == _snap(30.0)
+
+    # A new category layout keeps only the rows that carry every new category.
+    wider = {**_snap(31.0), "AST": {"you": 1.0, "opp": 2.0}}
+    store.append("1", 4, 6, day + timedelta(days=12), wider, retention_days=10)
+    assert store.load("1", 4).keys == ["PTS", "REB", "AST"]
+    assert len(store.load("1", 4)) == 1
+
+
+def test_purge_old_snapshots_removes_series_no_longer_appended(tmp_path: Path):
+    for cache in (JsonCache(tmp_path / "json"), SqliteCache(tmp_path / "sqlite")):
+        store = cache.snapshot_store()
+        store.append("1", 4, 5, date(2026, 2, 1), _snap(90.0), retention_days=10)
+        store.append("1", 2, 5, date(2026, 2, 1), _snap(80.0), retention_days=10)
+        stale = time.time() - 11 * 24 * 60 * 60
+        os.utime(store.path("1", 2), (stale, stale))
+
+        cache.purge_old_snapshots(retention_days=10)
+        assert store.path("1", 4).exists()
+        assert not store.path("1", 2).exists()
+        assert not store.path("1", 2).with_suffix(".lock").exists()